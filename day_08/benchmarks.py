@@ -0,0 +1,121 @@
+"""
+⏱️ Benchmarks for Turtle Robot Grid Navigator
+
+Compares running a long command stream one function call at a time
+with replaying the whole stream at once, and the memory and distance
+query cost of a list path vs a PathHistory.
+
+Usage:
+    python benchmarks.py
+"""
+
+import time
+import tracemalloc
+
+import numpy as np
+
+from project import (
+    create_robot_state,
+    move_forward,
+    turn_left,
+    turn_right,
+    replay_commands,
+    calculate_total_distance,
+    CMD_FORWARD,
+    CMD_LEFT,
+    CMD_RIGHT,
+)
+
+
+# ============================================================
+# HELPERS
+# ============================================================
+
+def make_commands(count, seed=0):
+    """A random command stream: mostly moves, some turns."""
+    rng = np.random.default_rng(seed)
+    commands = rng.choice([CMD_FORWARD, CMD_FORWARD, CMD_LEFT, CMD_RIGHT], size=count)
+    distances = rng.integers(1, 60, size=count)
+    return commands, distances
+
+
+# ============================================================
+# BENCHMARKS
+# ============================================================
+
+def bench_replay(count=1_000_000):
+    """Step-by-step functions vs replay_commands on one long stream."""
+    commands, distances = make_commands(count)
+
+    state = create_robot_state()
+    begin = time.perf_counter()
+    for command, distance in zip(commands.tolist(), distances.tolist()):
+        if command == CMD_FORWARD:
+            move_forward(state, distance)
+        elif command == CMD_LEFT:
+            turn_left(state)
+        else:
+            turn_right(state)
+    stepped = time.perf_counter() - begin
+
+    replayed = create_robot_state()
+    begin = time.perf_counter()
+    positions = replay_commands(replayed, commands, distances, update_path=False)
+    batch = time.perf_counter() - begin
+
+    with_path = create_robot_state()
+    begin = time.perf_counter()
+    replay_commands(with_path, commands, distances)
+    batch_path = time.perf_counter() - begin
+
+    same = positions.tolist() == [list(p) for p in state["path"]] and with_path == state
+    print(f"{count:,} commands ({len(positions) - 1:,} moves), identical paths: {same}")
+    print(f"  step by step:    {stepped * 1000:>9.1f} ms")
+    print(f"  replay_commands: {batch * 1000:>9.1f} ms  ({stepped / batch:.0f}x faster)")
+    print(f"  ... and path:    {batch_path * 1000:>9.1f} ms  ({stepped / batch_path:.0f}x faster)")
+
+
+def bench_path_history(count=1_000_000):
+    """Memory and distance query time: list of tuples vs PathHistory."""
+    commands, distances = make_commands(count)
+    positions = replay_commands(create_robot_state(), commands, distances, update_path=False)
+    points = [tuple(p) for p in positions.tolist()]
+
+    print(f"{len(points):,} path points")
+    print(f"  {'storage':<24}{'memory':>10}{'stored':>11}{'distance query':>16}")
+    layouts = [
+        ("list of tuples", None),
+        ("PathHistory", {}),
+        ("PathHistory run_length", {"run_length": True}),
+        ("PathHistory cap 10,000", {"max_points": 10_000}),
+    ]
+    for name, options in layouts:
+        tracemalloc.start()
+        if options is None:
+            path = list(zip(positions[:, 0].tolist(), positions[:, 1].tolist()))
+        else:
+            path = create_robot_state(**options)["path"]
+            path.extend(points[1:])
+        memory = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        state = {"path": path}
+        begin = time.perf_counter()
+        calculate_total_distance(state)
+        query = time.perf_counter() - begin
+        print(f"  {name:<24}{memory / 2**20:>8.1f}MB{len(path):>11,}{query * 1000:>13.3f} ms")
+
+
+def run_all_benchmarks():
+    """Run all benchmarks and show results."""
+    print("=" * 50)
+    print("⏱️  Grid Navigator Benchmarks")
+    print("=" * 50)
+    bench_replay()
+    print()
+    bench_path_history()
+    print("=" * 50)
+
+
+if __name__ == "__main__":
+    run_all_benchmarks()
@@ -36,10 +36,46 @@ Grid System:
 - Origin (0, 0) is at the center
 - x increases going right, y increases going up
 - Heading: 0=East, 90=North, 180=West, 270=South
+
+Replaying Recorded Commands:
+----------------------------
+replay_commands() runs a whole array of commands (forward / left /
+right) at once with NumPy instead of one function call per command,
+and gives the same positions as calling move_forward(), turn_left() and
+turn_right() one by one.
+
+Path History:
+-------------
+state["path"] is a PathHistory: it acts like the list of visited
+(x, y) tuples, but stores them packed in an array('i') (array('d') once a
+position isn't a whole number) and keeps a
+running total of the distance travelled, so calculate_total_distance()
+doesn't have to walk the whole path. It can also keep only the newest
+points (max_points) or merge straight runs into one point per corner
+(run_length=True).
 """
 
+import math
+from array import array
+from collections.abc import Sequence
+from numbers import Integral
+
+import numpy as np
+
+
+# Unit step for each heading: heading -> (dx, dy)
+HEADING_VECTORS = {0: (1, 0), 90: (0, 1), 180: (-1, 0), 270: (0, -1)}
+
+# Command codes for replay_commands()
+CMD_FORWARD = 0
+CMD_LEFT = 1
+CMD_RIGHT = 2
+
+# Robot is "at the boundary" within this many units of the edge
+BOUNDARY_MARGIN = 10
+
 
-def create_robot_state(x=0, y=0, heading=0):
+def create_robot_state(x=0, y=0, heading=0, max_points=None, run_length=False):
     """
     Create the initial state for a robot navigator.
     
@@ -47,6 +83,9 @@ def create_robot_state(x=0, y=0, heading=0):
         x: Starting x coordinate (default 0)
         y: Starting y coordinate (default 0)
         heading: Starting direction in degrees (default 0 = East)
+        max_points: Only remember this many of the newest positions
+                    (default None = remember all of them)
+        run_length: Store only the corners of straight runs (default False)
     
     Returns:
         A dictionary with robot state:
@@ -54,16 +93,16 @@ def create_robot_state(x=0, y=0, heading=0):
             "x": x position,
             "y": y position,
             "heading": direction (0, 90, 180, or 270),
-            "path": [(x, y)] - list of visited positions
+            "path": [(x, y)] - visited positions (a PathHistory,
+                               which works like a list)
         }
     
     Example:
         create_robot_state(0, 0, 90) returns:
         {"x": 0, "y": 0, "heading": 90, "path": [(0, 0)]}
     """
-    # TODO: Create and return the state dictionary
-    # Don't forget to initialize path with the starting position!
-    pass
+    path = PathHistory([(x, y)], max_points=max_points, run_length=run_length)
+    return {"x": x, "y": y, "heading": heading, "path": path}
 
 
 def move_forward(state, distance, grid_size=400):
@@ -84,17 +123,24 @@ def move_forward(state, distance, grid_size=400):
             - heading 90 (North): y += distance
             - heading 180 (West): x -= distance
             - heading 270 (South): y -= distance
-        - Keep robot within bounds: -grid_size/2 to +grid_size/2
+        - Keep robot within bounds: -(grid_size // 2) to +(grid_size // 2),
+          so a clamped position stays a whole number (for an odd grid_size
+          that is half a unit inside the ±grid_size/2 edge)
         - Add new position to path history
     
     Example:
         state = {"x": 0, "y": 0, "heading": 0, "path": [(0,0)]}
         move_forward(state, 50, 400) -> x becomes 50
     """
-    # TODO: Calculate new position based on heading
-    # TODO: Clamp position to grid boundaries
-    # TODO: Update state and add to path
-    pass
+    dx, dy = HEADING_VECTORS[state["heading"]]
+    half = grid_size // 2
+    x = min(max(state["x"] + dx * distance, -half), half)
+    y = min(max(state["y"] + dy * distance, -half), half)
+    # Record the move first, so a position the path rejects changes nothing
+    state["path"].append((x, y))
+    state["x"] = x
+    state["y"] = y
+    return state
 
 
 def turn_left(state):
@@ -115,8 +161,8 @@ def turn_left(state):
         turn_left(state)
         state["heading"] -> 90
     """
-    # TODO: Add 90 to heading and use modulo 360
-    pass
+    state["heading"] = (state["heading"] + 90) % 360
+    return state
 
 
 def turn_right(state):
@@ -137,8 +183,8 @@ def turn_right(state):
         turn_right(state)
         state["heading"] -> 270
     """
-    # TODO: Subtract 90 from heading and use modulo 360
-    pass
+    state["heading"] = (state["heading"] - 90) % 360
+    return state
 
 
 def is_at_boundary(state, grid_size=400):
@@ -158,8 +204,8 @@ def is_at_boundary(state, grid_size=400):
         state = {"x": 195, "y": 0, ...}  # grid_size=400
         is_at_boundary(state, 400) -> True (195 is close to 200)
     """
-    # TODO: Check if x or y is within 10 of the boundary
-    pass
+    edge = grid_size / 2 - BOUNDARY_MARGIN
+    return abs(state["x"]) >= edge or abs(state["y"]) >= edge
 
 
 def get_path_history(state):
@@ -176,8 +222,7 @@ def get_path_history(state):
         state["path"] = [(0, 0), (50, 0), (50, 50)]
         get_path_history(state) -> [(0, 0), (50, 0), (50, 50)]
     """
-    # TODO: Return a copy of state["path"]
-    pass
+    return list(state["path"])
 
 
 def calculate_total_distance(state):
@@ -198,6 +243,283 @@ def calculate_total_distance(state):
         # Distance: 3 + 4 = 7
         calculate_total_distance(state) -> 7.0
     """
-    # TODO: Loop through path and sum distances between consecutive points
-    pass
+    path = state["path"]
+    if isinstance(path, PathHistory):
+        return path.distance
+    return math.fsum(math.dist(a, b) for a, b in zip(path, path[1:]))
+
+
+# ============================================================
+# BATCH REPLAY
+# ============================================================
+
+def clamped_walk(start, steps, low, high):
+    """
+    Positions along one axis after each step, clamped to [low, high].
+    
+    Clamping makes each position depend on the one before it, so a plain
+    cumulative sum doesn't work (a robot pushed against a wall "forgets"
+    the overshoot). But each step is a function v -> clip(v + a, lo, hi),
+    and two of those in a row are again one such function:
+    
+        (a1, lo1, hi1) then (a2, lo2, hi2)
+            = (a1 + a2, clip(lo1 + a2, lo2, hi2), clip(hi1 + a2, lo2, hi2))
+    
+    so all prefixes are found with a parallel prefix scan: log2(n) rounds
+    of whole-array NumPy operations.
+    
+    Args:
+        start: Position before the first step
+        steps: Array of signed step sizes
+        low, high: The bounds applied after every step
+    
+    Returns:
+        An int64 array: the position after each step
+    """
+    offset = np.asarray(steps, dtype=np.int64).copy()
+    lows = np.full(offset.shape, low, dtype=np.int64)
+    highs = np.full(offset.shape, high, dtype=np.int64)
+    shift = 1
+    while shift < len(offset):
+        # Combine each prefix with the one `shift` entries before it
+        later = slice(shift, None)
+        earlier = slice(None, -shift)
+        later_offset = offset[later]
+        new_lows = np.clip(lows[earlier] + later_offset, lows[later], highs[later])
+        new_highs = np.clip(highs[earlier] + later_offset, lows[later], highs[later])
+        offset[later] = offset[earlier] + later_offset
+        lows[later] = new_lows
+        highs[later] = new_highs
+        shift *= 2
+    return np.clip(start + offset, lows, highs)
+
+
+def replay_commands(state, commands, distances=1, grid_size=400, update_path=True):
+    """
+    Run a whole recorded command stream at once.
+    
+    Args:
+        state: The robot state dictionary (heading must be 0, 90, 180 or 270)
+        commands: Array of CMD_FORWARD, CMD_LEFT or CMD_RIGHT codes
+        distances: How far each CMD_FORWARD moves - one number for all of
+                   them, or an array as long as commands (entries for
+                   turns are ignored)
+        grid_size: The size of the grid (default 400)
+        update_path: Also append every new position to state["path"]
+                     (copied in one go when it is a PathHistory)
+    
+    Returns:
+        An int32 array of shape (moves + 1, 2): the start position, then
+        the (x, y) after each CMD_FORWARD. The state ends up exactly as if
+        move_forward / turn_left / turn_right had been called in order.
+    
+    Raises:
+        ValueError for unknown commands, a heading other than 0, 90, 180
+        or 270 (90.0 is fine), or a start position / distances that aren't
+        integers (use move_forward for those)
+    
+    Example:
+        commands = [CMD_FORWARD, CMD_LEFT, CMD_FORWARD]
+        replay_commands(state, commands, distances=50)
+        # -> [[0, 0], [50, 0], [50, 50]]
+    """
+    commands = np.asarray(commands)
+    if np.any((commands < CMD_FORWARD) | (commands > CMD_RIGHT)):
+        raise ValueError("commands must be CMD_FORWARD, CMD_LEFT or CMD_RIGHT")
+    if state["heading"] not in HEADING_VECTORS:
+        raise ValueError("heading must be 0, 90, 180 or 270")
+    heading = int(state["heading"])  # 90.0 -> 90, for the array indexing below
+    if not (_fits_int(state["x"]) and _fits_int(state["y"])):
+        raise ValueError("replay_commands needs an integer start position")
+    distances = np.asarray(distances)
+    if not np.issubdtype(distances.dtype, np.integer):
+        raise ValueError("replay_commands needs integer distances")
+    distances = np.broadcast_to(distances.astype(np.int64), commands.shape)
+
+    # Heading after each command, counted in quarter turns from East
+    turns = np.where(commands == CMD_LEFT, 1, 0) - np.where(commands == CMD_RIGHT, 1, 0)
+    quarters = (heading // 90 + np.cumsum(turns)) % 4
+
+    moves = np.flatnonzero(commands == CMD_FORWARD)
+    unit_x = np.array([1, 0, -1, 0])
+    unit_y = np.array([0, 1, 0, -1])
+    step = distances[moves]
+    half = grid_size // 2
+    xs = clamped_walk(state["x"], unit_x[quarters[moves]] * step, -half, half)
+    ys = clamped_walk(state["y"], unit_y[quarters[moves]] * step, -half, half)
+
+    positions = np.empty((len(moves) + 1, 2), dtype=np.int32)
+    positions[0] = (state["x"], state["y"])
+    positions[1:, 0] = xs
+    positions[1:, 1] = ys
+
+    if len(moves):
+        state["x"], state["y"] = int(xs[-1]), int(ys[-1])
+    if len(commands):
+        state["heading"] = int(quarters[-1]) * 90
+    if update_path:
+        path = state["path"]
+        if isinstance(path, PathHistory):
+            path.extend_coords(xs, ys)
+        else:
+            path.extend(zip(xs.tolist(), ys.tolist()))
+    return positions
+
+
+# ============================================================
+# PATH HISTORY
+# ============================================================
+
+class PathHistory(Sequence):
+    """
+    The robot's visited positions, packed two numbers per point.
+    
+    Works like a list of (x, y) tuples (len, indexing, `in`, iteration,
+    append, == with a list), at a fraction of the memory. `distance` is
+    the total length travelled, updated on every append.
+    
+    Points are stored as 32-bit ints. The first point that isn't (e.g.
+    (1.5, 0)) switches the whole buffer to floats, after which every
+    point reads back as floats.
+    
+    Args:
+        points: Starting points (usually just the start position)
+        max_points: Keep only this many of the newest points; older ones
+                    are overwritten like a ring buffer. `distance` still
+                    counts the whole trip.
+        run_length: Merge each straight run into one point, so only the
+                    corners (and the current position) are stored.
+    
+    Example:
+        path = PathHistory([(0, 0)], run_length=True)
+        path.append((50, 0))
+        path.append((80, 0))  # same run: replaces (50, 0)
+        list(path) -> [(0, 0), (80, 0)]
+        path.distance -> 80.0
+    """
+
+    def __init__(self, points=(), max_points=None, run_length=False):
+        if max_points is not None and max_points < 2:
+            raise ValueError("max_points must be at least 2")
+        self.max_points = max_points
+        self.run_length = run_length
+        self.distance = 0.0
+        self._coords = array("i")  # x0, y0, x1, y1, ...
+        self._first = 0            # slot of the oldest point once the ring wraps
+        self._count = 0
+        self.extend(points)
+
+    def _slot(self, index):
+        """Where the point at `index` (0 = oldest) lives in _coords."""
+        if self.max_points is None:
+            return index
+        return (self._first + index) % self.max_points
+
+    def _continues_run(self, x, y):
+        """True if (x, y) carries on the straight run ending at the last point."""
+        last = 2 * self._slot(self._count - 1)
+        last_x, last_y = self._coords[last], self._coords[last + 1]
+        if (x, y) == (last_x, last_y):
+            return True
+        if self._count < 2:
+            return False
+        prev = 2 * self._slot(self._count - 2)
+        run_x, run_y = last_x - self._coords[prev], last_y - self._coords[prev + 1]
+        step_x, step_y = x - last_x, y - last_y
+        same_line = run_x * step_y == run_y * step_x
+        return same_line and run_x * step_x + run_y * step_y > 0
+
+    def append(self, point):
+        """Add the next visited position."""
+        x, y = point
+        coords = self._coords
+        if coords.typecode == "d" or not (_fits_int(x) and _fits_int(y)):
+            # Convert before storing anything, so a bad value changes nothing
+            x, y = float(x), float(y)
+            if coords.typecode == "i":
+                coords = self._coords = array("d", coords)
+        if self._count:
+            last = 2 * self._slot(self._count - 1)
+            self.distance += math.hypot(x - coords[last], y - coords[last + 1])
+            if self.run_length and self._continues_run(x, y):
+                coords[last] = x
+                coords[last + 1] = y
+                return
+        if self._count == self.max_points:
+            # Full ring: overwrite the oldest point
+            oldest = 2 * self._first
+            coords[oldest] = x
+            coords[oldest + 1] = y
+            self._first = (self._first + 1) % self.max_points
+        else:
+            coords.append(x)
+            coords.append(y)
+            self._count += 1
+
+    def extend(self, points):
+        """Add several visited positions in order."""
+        for point in points:
+            self.append(point)
+
+    def extend_coords(self, xs, ys):
+        """
+        Add positions given as two arrays of coordinates.
+        
+        Same as extend(zip(xs, ys)). A path that keeps every point takes
+        whole-number positions straight into its int buffer with NumPy,
+        instead of one append per point; `distance` is then added up with
+        math.fsum, so its last bit can differ from one append at a time.
+        """
+        xs = np.asarray(xs)
+        ys = np.asarray(ys)
+        if len(xs) == 0:
+            return
+        bulk = (self._count and self.max_points is None and not self.run_length
+                and self._coords.typecode == "i"
+                and np.issubdtype(xs.dtype, np.integer) and np.issubdtype(ys.dtype, np.integer))
+        if bulk:
+            points = np.stack([xs, ys], axis=1).astype(np.int64)
+            bulk = points.min() >= -2**31 and points.max() < 2**31
+        if not bulk:
+            self.extend(zip(xs.tolist(), ys.tolist()))
+            return
+        last = 2 * (self._count - 1)
+        start = np.array([[self._coords[last], self._coords[last + 1]]], dtype=np.int64)
+        steps = np.diff(np.concatenate([start, points]), axis=0)
+        self.distance += math.fsum(np.hypot(steps[:, 0], steps[:, 1]).tolist())
+        self._coords.frombytes(points.astype(np.int32).tobytes())
+        self._count += len(points)
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("path index out of range")
+        slot = 2 * self._slot(index)
+        return (self._coords[slot], self._coords[slot + 1])
+
+    def __iter__(self):
+        coords = self._coords
+        if self._first:
+            split = 2 * self._first
+            coords = coords[split:] + coords[:split]
+        values = iter(coords)
+        return zip(values, values)
+
+    def __eq__(self, other):
+        if isinstance(other, (PathHistory, list)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self):
+        return f"PathHistory({list(self)!r})"
+
 
+def _fits_int(value):
+    """True if value can be stored in a PathHistory's int buffer."""
+    return isinstance(value, Integral) and -2**31 <= value < 2**31
@@ -15,6 +15,11 @@ from project import (
     is_at_boundary,
     get_path_history,
     calculate_total_distance,
+    replay_commands,
+    PathHistory,
+    CMD_FORWARD,
+    CMD_LEFT,
+    CMD_RIGHT,
 )
 
 
@@ -222,6 +227,115 @@ def test_distance_single_point():
     print("✅ Test 22 passed: Single point")
 
 
+# ============================================================
+# BATCH REPLAY TESTS
+# ============================================================
+
+def test_replay_square():
+    """Test: Replaying commands traces the same square"""
+    state = create_robot_state()
+    commands = [CMD_FORWARD, CMD_LEFT, CMD_FORWARD, CMD_LEFT, CMD_FORWARD, CMD_RIGHT]
+    positions = replay_commands(state, commands, distances=50)
+    expected = [[0, 0], [50, 0], [50, 50], [0, 50]]
+    assert positions.tolist() == expected, f"❌ Expected {expected}, got {positions.tolist()}"
+    assert state["path"] == [tuple(p) for p in expected], f"❌ Path not updated: {state['path']}"
+    assert (state["x"], state["y"], state["heading"]) == (0, 50, 90), \
+        f"❌ Expected robot at (0, 50) facing 90, got {state}"
+    print("✅ Test 23 passed: Replay traces a square")
+
+
+def test_replay_matches_step_by_step_at_walls():
+    """Test: Replay clamps at the walls exactly like move_forward"""
+    commands = [CMD_FORWARD, CMD_FORWARD, CMD_RIGHT, CMD_RIGHT, CMD_FORWARD,
+                CMD_LEFT, CMD_FORWARD, CMD_LEFT, CMD_LEFT, CMD_FORWARD]
+    distances = [150, 150, 0, 0, 120, 0, 300, 0, 0, 80]
+    stepped = create_robot_state()
+    for command, distance in zip(commands, distances):
+        if command == CMD_FORWARD:
+            move_forward(stepped, distance)
+        elif command == CMD_LEFT:
+            turn_left(stepped)
+        else:
+            turn_right(stepped)
+    replayed = create_robot_state()
+    replay_commands(replayed, commands, distances)
+    assert replayed == stepped, f"❌ Expected {stepped}, got {replayed}"
+    try:
+        replay_commands(create_robot_state(), [CMD_FORWARD], distances=2.5)
+        assert False, f"❌ Fractional distances should raise ValueError"
+    except ValueError:
+        pass
+    print("✅ Test 24 passed: Replay matches step-by-step at the walls")
+
+
+# ============================================================
+# PATH HISTORY TESTS
+# ============================================================
+
+def test_path_history_ring_cap():
+    """Test: A capped path keeps the newest points but the full distance"""
+    state = create_robot_state(max_points=3)
+    for _ in range(4):
+        move_forward(state, 10)
+        turn_left(state)
+    expected = [(0, 10), (0, 0)]
+    assert get_path_history(state)[-2:] == expected, f"❌ Expected path ending {expected}"
+    assert len(state["path"]) == 3, f"❌ Expected 3 points kept, got {len(state['path'])}"
+    assert state["path"][0] == (10, 10), f"❌ Expected oldest kept point (10, 10)"
+    dist = calculate_total_distance(state)
+    assert dist == 40.0, f"❌ Expected distance 40.0 for the whole trip, got {dist}"
+    print("✅ Test 25 passed: Ring cap keeps newest points")
+
+
+def test_path_history_run_length():
+    """Test: Run-length mode stores only the corners"""
+    path = PathHistory([(0, 0)], run_length=True)
+    for point in [(10, 0), (20, 0), (20, 0), (20, 5), (20, 15), (20, 5)]:
+        path.append(point)
+    expected = [(0, 0), (20, 0), (20, 15), (20, 5)]
+    assert path == expected, f"❌ Expected {expected}, got {list(path)}"
+    assert path.distance == 45.0, f"❌ Expected distance 45.0, got {path.distance}"
+    print("✅ Test 26 passed: Run-length mode stores corners")
+
+
+def test_path_history_fractional_positions():
+    """Test: Fractional positions are stored, and bad ones change nothing"""
+    state = create_robot_state(1.5, 0)
+    move_forward(state, 2.5)
+    assert state["x"] == 4.0, f"❌ Expected x 4.0, got {state['x']}"
+    assert get_path_history(state) == [(1.5, 0), (4.0, 0)], \
+        f"❌ Expected [(1.5, 0), (4.0, 0)], got {get_path_history(state)}"
+    assert calculate_total_distance(state) == 2.5, f"❌ Expected distance 2.5"
+    try:
+        move_forward(state, "far")
+    except TypeError:
+        pass
+    assert state["x"] == 4.0 and len(state["path"]) == 2, \
+        f"❌ A rejected move should leave the state unchanged"
+    print("✅ Test 27 passed: Fractional positions")
+
+
+def test_replay_bulk_path_and_float_heading():
+    """Test: Replay fills the path in bulk and accepts a 90.0 heading"""
+    commands = [CMD_FORWARD, CMD_RIGHT, CMD_FORWARD, CMD_FORWARD, CMD_LEFT, CMD_FORWARD]
+    distances = [30, 0, 250, 40, 0, 5]
+    for options in [{}, {"run_length": True}, {"max_points": 3}]:
+        stepped = create_robot_state(heading=90, **options)
+        for command, distance in zip(commands, distances):
+            if command == CMD_FORWARD:
+                move_forward(stepped, distance)
+            elif command == CMD_LEFT:
+                turn_left(stepped)
+            else:
+                turn_right(stepped)
+        replayed = create_robot_state(heading=90.0, **options)
+        replay_commands(replayed, commands, distances)
+        assert replayed == stepped, f"❌ Expected {stepped}, got {replayed}"
+        assert calculate_total_distance(replayed) == calculate_total_distance(stepped), \
+            f"❌ Replayed distance should match step-by-step"
+    print("✅ Test 28 passed: Bulk path and float heading")
+
+
 def run_all_tests():
     """Run all tests and show results."""
     print("=" * 50)
@@ -252,6 +366,12 @@ def run_all_tests():
         test_distance_simple,
         test_distance_multiple_segments,
         test_distance_single_point,
+        test_replay_square,
+        test_replay_matches_step_by_step_at_walls,
+        test_path_history_ring_cap,
+        test_path_history_run_length,
+        test_path_history_fractional_positions,
+        test_replay_bulk_path_and_float_heading,
     ]
     
     passed = 0
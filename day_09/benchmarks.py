@@ -0,0 +1,158 @@
+"""
+⏱️ Benchmarks for Robot Parts Collection Game
+
+Shows how the cost of a trail collision check and of spawning a part
+grows as the trail fills the board.
+
+Usage:
+    python benchmarks.py
+"""
+
+import os
+import random
+import time
+from project import (
+    create_game_state,
+    check_trail_collision,
+    spawn_part,
+    get_trail_cells,
+    update_game,
+    DIRECTIONS,
+    DIRECTION_NAMES,
+    greedy_policy,
+    run_episodes,
+)
+
+
+# ============================================================
+# HELPERS
+# ============================================================
+
+def make_long_trail(length, grid_size=1000):
+    """A state whose robot has swept back and forth over `length` cells."""
+    state = create_game_state(grid_size, start_pos=(0, 0))
+    trail = state["trail"]
+    for i in range(length):
+        y, x = divmod(i, grid_size)
+        trail.append((x if y % 2 == 0 else grid_size - 1 - x, y))
+    state["robot_pos"] = (grid_size // 2, grid_size - 1)  # not on the trail
+    return state
+
+
+def greedy_direction(state):
+    """greedy_policy for one dictionary game: the same choice, move by move."""
+    size = state["grid_size"]
+    x, y = state["robot_pos"]
+    trail_cells = get_trail_cells(state)
+    part_x, part_y = state["part_pos"] or (size - 1, -1)  # like part cell -1
+    best, best_cost = None, None
+    for name in DIRECTION_NAMES:
+        dx, dy = DIRECTIONS[name]
+        next_x, next_y = x + dx, y + dy
+        safe = (0 <= next_x < size and 0 <= next_y < size
+                and (next_x, next_y) not in trail_cells)
+        cost = abs(next_x - part_x) + abs(next_y - part_y) + (0 if safe else 4 * size)
+        if best_cost is None or cost < best_cost:
+            best, best_cost = name, cost
+    return best
+
+
+# ============================================================
+# BENCHMARKS
+# ============================================================
+
+def bench_trail_collision(lengths=(1_000, 10_000, 100_000, 500_000), checks=200):
+    """Time one collision check: scanning the trail list vs the trail set."""
+    print(f"{'trail length':>12}  {'list scan':>12}  {'set lookup':>12}")
+    for length in lengths:
+        state = make_long_trail(length)
+        check_trail_collision(state)  # build the set once, like a running game
+
+        begin = time.perf_counter()
+        for _ in range(checks):
+            state["robot_pos"] in state["trail"]
+        scan_time = (time.perf_counter() - begin) / checks
+
+        begin = time.perf_counter()
+        for _ in range(checks):
+            check_trail_collision(state)
+        set_time = (time.perf_counter() - begin) / checks
+
+        print(f"{length:>12,}  {scan_time * 1e6:>10.1f}µs  {set_time * 1e6:>10.2f}µs")
+
+
+def spawn_part_rejection(state):
+    """The old spawn_part: guess positions until one is empty."""
+    size = state["grid_size"]
+    trail_cells = get_trail_cells(state)
+    while True:
+        position = (random.randrange(size), random.randrange(size))
+        if position != state["robot_pos"] and position not in trail_cells:
+            state["part_pos"] = position
+            return state
+
+
+def bench_spawn_part(grid_size=300, occupancy=(0.0, 0.5, 0.9, 0.99, 0.999), spawns=2000):
+    """Time one spawn as the trail covers more of the board."""
+    print(f"{'occupancy':>10}  {'rejection':>12}  {'free cells':>12}")
+    for fraction in occupancy:
+        state = make_long_trail(int(grid_size * grid_size * fraction), grid_size)
+        state["robot_pos"] = (grid_size - 1, grid_size - 1)
+        spawn_part(state)  # build the free-cell array once, like a running game
+
+        begin = time.perf_counter()
+        for _ in range(spawns):
+            spawn_part_rejection(state)
+        rejection_time = (time.perf_counter() - begin) / spawns
+
+        begin = time.perf_counter()
+        for _ in range(spawns):
+            spawn_part(state)
+        free_time = (time.perf_counter() - begin) / spawns
+
+        print(f"{fraction:>10.1%}  {rejection_time * 1e6:>10.1f}µs  {free_time * 1e6:>10.2f}µs")
+
+
+def bench_batch_simulation(episodes=2_000, grid_size=20, max_steps=1000):
+    """
+    Steps per second: one dict game at a time vs BatchGame vs a process pool.
+    
+    Every variant plays the same number of episodes with the greedy policy.
+    """
+    moves = 0
+    begin = time.perf_counter()
+    for _ in range(episodes):
+        state = create_game_state(grid_size)
+        spawn_part(state)
+        for _ in range(max_steps):
+            if state["game_over"]:
+                break
+            update_game(state, greedy_direction(state))
+            moves += 1
+    dict_rate = moves / (time.perf_counter() - begin)
+
+    single = run_episodes(greedy_policy, episodes, grid_size, workers=1, max_steps=max_steps)
+    pooled = run_episodes(greedy_policy, episodes, grid_size, max_steps=max_steps)
+
+    print(f"{episodes:,} episodes on a {grid_size}x{grid_size} board")
+    print(f"  update_game, one game at a time: {dict_rate:>12,.0f} steps/sec")
+    print(f"  BatchGame, 1 process:            {single['steps_per_sec']:>12,.0f} steps/sec")
+    print(f"  run_episodes, {os.cpu_count()} processes:       "
+          f"{pooled['steps_per_sec']:>12,.0f} steps/sec")
+
+
+def run_all_benchmarks():
+    """Run all benchmarks and show results."""
+    print("=" * 50)
+    print("⏱️  Parts Collection Game Benchmarks")
+    print("=" * 50)
+    bench_trail_collision()
+    print()
+    bench_spawn_part()
+    print()
+    bench_batch_simulation()
+    print("=" * 50)
+
+
+if __name__ == "__main__":
+    run_all_benchmarks()
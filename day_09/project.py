@@ -41,9 +41,154 @@ Game Rules:
 - Hitting a wall = game over
 - Hitting your own trail = game over
 - Each part collected adds to score and grows the trail
+
+Fast Collision Checks:
+----------------------
+The trail only ever grows, so "is the robot on its trail?" gets slower
+with every step if it means scanning the list. The state also keeps a
+TrailIndex: a set of the trail's positions that follows the list, so
+the check is a single set lookup however long the trail gets.
+
+The TrailIndex also keeps the free cells in an array (FreeCells), so a
+new part is placed by picking one random entry instead of guessing
+positions until one is empty - which gets slower as the board fills up
+and never finishes on a full board.
+
+Batch Simulation:
+-----------------
+BatchGame plays many games in lockstep with NumPy arrays instead of one
+state dictionary each, for testing control policies on lots of episodes.
+run_episodes() spreads the episodes over a process pool and reports
+steps per second.
 """
 
+import os
 import random
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+
+# Movement for each direction: (dx, dy)
+DIRECTIONS = {
+    "up": (0, 1),
+    "down": (0, -1),
+    "left": (-1, 0),
+    "right": (1, 0),
+}
+
+# Points for each collected part
+PART_SCORE = 10
+
+
+class FreeCells:
+    """
+    The cells of a grid_size x grid_size board that are still free.
+    
+    Cell (x, y) has id y * grid_size + x. `cells` holds the free ids in
+    no particular order and `slots[id]` is where id sits in it (-1 if the
+    cell is taken). Removing a cell moves the last entry into its slot,
+    so add, remove and a uniform random pick are all O(1).
+    
+    Example:
+        free = FreeCells(3)
+        free.remove(4)          # the center cell is taken
+        free.sample() != 4      # -> True
+    """
+    
+    def __init__(self, grid_size):
+        count = grid_size * grid_size
+        self.grid_size = grid_size
+        self.cells = array("i", range(count))
+        self.slots = array("i", range(count))
+    
+    def __len__(self):
+        return len(self.cells)
+    
+    def __contains__(self, cell):
+        return self.slots[cell] >= 0
+    
+    def cell_id(self, position):
+        """Id of an (x, y) position, or None if it is off the board."""
+        x, y = position
+        if 0 <= x < self.grid_size and 0 <= y < self.grid_size:
+            return y * self.grid_size + x
+        return None
+    
+    def remove(self, cell):
+        """Mark a cell as taken (no-op if it already is)."""
+        slot = self.slots[cell]
+        if slot < 0:
+            return
+        last = self.cells.pop()
+        if last != cell:
+            self.cells[slot] = last
+            self.slots[last] = slot
+        self.slots[cell] = -1
+    
+    def add(self, cell):
+        """Mark a cell as free again (no-op if it already is)."""
+        if self.slots[cell] < 0:
+            self.slots[cell] = len(self.cells)
+            self.cells.append(cell)
+    
+    def sample(self):
+        """A uniformly random free cell id. The board must not be full."""
+        return self.cells[random.randrange(len(self.cells))]
+
+
+class TrailIndex:
+    """
+    A set of the positions in a trail list, kept in sync with it.
+    
+    The trail list keeps the order; this keeps membership. sync() looks
+    only at entries appended since the last call, so keeping up costs
+    O(1) per move. If the list is replaced (state["trail"] = [...]) or
+    gets shorter, the set is rebuilt from scratch.
+    
+    free_cells() adds a FreeCells board of everything not on the trail,
+    built the first time it is asked for and then updated by sync().
+    
+    Example:
+        index = TrailIndex()
+        trail = [(5, 5)]
+        (5, 5) in index.sync(trail)  # -> True
+    """
+    
+    def __init__(self):
+        self.trail = None
+        self.cells = set()
+        self.synced = 0
+        self.free = None
+    
+    def sync(self, trail):
+        """Catch up with trail and return the set of its positions."""
+        if trail is not self.trail or len(trail) < self.synced:
+            self.trail = trail
+            self.cells = set(trail)
+            self.free = None
+        elif len(trail) > self.synced:
+            new_positions = trail[self.synced:]
+            self.cells.update(new_positions)
+            if self.free is not None:
+                for position in new_positions:
+                    cell = self.free.cell_id(position)
+                    if cell is not None:
+                        self.free.remove(cell)
+        self.synced = len(trail)
+        return self.cells
+    
+    def free_cells(self, grid_size):
+        """The FreeCells of a grid_size board, minus the synced trail."""
+        if self.free is None or self.free.grid_size != grid_size:
+            self.free = FreeCells(grid_size)
+            for position in self.cells:
+                cell = self.free.cell_id(position)
+                if cell is not None:
+                    self.free.remove(cell)
+        return self.free
 
 
 def create_game_state(grid_size=20, start_pos=None):
@@ -63,16 +208,42 @@ def create_game_state(grid_size=20, start_pos=None):
             "part_pos": (x, y) or None if no part spawned,
             "score": current score,
             "game_over": False,
-            "direction": "right" (current direction)
+            "direction": "right" (current direction),
+            "trail_index": TrailIndex for fast trail lookups
         }
     
     Example:
         state = create_game_state(20)
         state["robot_pos"] -> (10, 10)  # center of 20x20 grid
     """
-    # TODO: Create and return the game state dictionary
-    # Default start_pos should be center: (grid_size // 2, grid_size // 2)
-    pass
+    if start_pos is None:
+        start_pos = (grid_size // 2, grid_size // 2)
+    return {
+        "grid_size": grid_size,
+        "robot_pos": start_pos,
+        "trail": [],
+        "part_pos": None,
+        "score": 0,
+        "game_over": False,
+        "direction": "right",
+        "trail_index": TrailIndex(),
+    }
+
+
+def get_trail_cells(state):
+    """
+    Get the set of positions on the trail.
+    
+    Args:
+        state: The game state dictionary
+    
+    Returns:
+        A set of (x, y) tuples, in sync with state["trail"]
+    """
+    index = state.get("trail_index")
+    if index is None:
+        index = state["trail_index"] = TrailIndex()
+    return index.sync(state["trail"])
 
 
 def spawn_part(state):
@@ -89,14 +260,35 @@ def spawn_part(state):
         - Part must not spawn on the robot's current position
         - Part must not spawn on the trail
         - Part position must be within grid bounds (0 to grid_size-1)
+        - If there is no empty cell left, part_pos is set to None
+    
+    Every empty cell is equally likely, and picking one takes the same
+    time on an empty board as on a 99% full one (see FreeCells).
     
     Example:
         spawn_part(state)
         state["part_pos"] -> (5, 12)  # random position
     """
-    # TODO: Generate random x, y that's not on robot or trail
-    # Hint: Use a while loop to keep trying until valid position found
-    pass
+    size = state["grid_size"]
+    get_trail_cells(state)
+    free = state["trail_index"].free_cells(size)
+
+    # Take the robot's cell out just for the draw
+    robot = free.cell_id(state["robot_pos"])
+    if robot is not None and robot not in free:
+        robot = None
+    if robot is not None:
+        free.remove(robot)
+
+    if len(free) == 0:
+        state["part_pos"] = None
+    else:
+        y, x = divmod(free.sample(), size)
+        state["part_pos"] = (x, y)
+
+    if robot is not None:
+        free.add(robot)
+    return state
 
 
 def move_robot(state, direction):
@@ -125,10 +317,12 @@ def move_robot(state, direction):
         move_robot(state, "right")
         state["robot_pos"] -> (11, 10)
     """
-    # TODO: Calculate new position based on direction
-    # TODO: Add old position to trail
-    # TODO: Update robot_pos and direction
-    pass
+    dx, dy = DIRECTIONS[direction]
+    x, y = state["robot_pos"]
+    state["trail"].append((x, y))
+    state["robot_pos"] = (x + dx, y + dy)
+    state["direction"] = direction
+    return state
 
 
 def check_wall_collision(state):
@@ -149,8 +343,9 @@ def check_wall_collision(state):
         state["robot_pos"] = (-1, 5)
         check_wall_collision(state) -> True
     """
-    # TODO: Check if robot_pos is outside bounds
-    pass
+    x, y = state["robot_pos"]
+    size = state["grid_size"]
+    return not (0 <= x < size and 0 <= y < size)
 
 
 def check_trail_collision(state):
@@ -163,13 +358,15 @@ def check_trail_collision(state):
     Returns:
         True if robot position is in the trail, False otherwise
     
+    This is a set lookup (see TrailIndex), so it takes the same time
+    whether the trail has 10 cells or 100,000.
+    
     Example:
         state["robot_pos"] = (5, 5)
         state["trail"] = [(5, 5), (6, 5)]
         check_trail_collision(state) -> True
     """
-    # TODO: Check if robot_pos is in trail list
-    pass
+    return state["robot_pos"] in get_trail_cells(state)
 
 
 def check_part_collection(state):
@@ -192,9 +389,11 @@ def check_part_collection(state):
         check_part_collection(state) -> True
         state["score"] -> 10
     """
-    # TODO: Check if robot_pos equals part_pos
-    # TODO: If so, increase score and clear part_pos
-    pass
+    if state["part_pos"] is None or state["robot_pos"] != state["part_pos"]:
+        return False
+    state["score"] += PART_SCORE
+    state["part_pos"] = None
+    return True
 
 
 def update_game(state, direction):
@@ -215,12 +414,24 @@ def update_game(state, direction):
         4. Check part collection -> increase score
         5. If no part exists, spawn one
     
+    Once the game is over, further updates change nothing.
+    
     Example:
         update_game(state, "right")
         # Robot moves, collisions checked, parts collected
     """
-    # TODO: Implement the game update logic in order
-    pass
+    if state["game_over"]:
+        return state
+
+    move_robot(state, direction)
+    if check_wall_collision(state) or check_trail_collision(state):
+        state["game_over"] = True
+        return state
+
+    check_part_collection(state)
+    if state["part_pos"] is None:
+        spawn_part(state)
+    return state
 
 
 def get_game_summary(state):
@@ -235,6 +446,189 @@ def get_game_summary(state):
         "Score: 30 | Position: (15, 10) | Trail length: 4 | Status: Playing"
         or "Status: Game Over" if game_over is True
     """
-    # TODO: Return a formatted game summary string
-    pass
+    status = "Game Over" if state["game_over"] else "Playing"
+    return (f"Score: {state['score']} | Position: {state['robot_pos']} | "
+            f"Trail length: {len(state['trail'])} | Status: {status}")
+
+
+# ============================================================
+# HEADLESS BATCH SIMULATION
+# ============================================================
+
+# Direction codes used by BatchGame, in DIRECTIONS order
+DIRECTION_NAMES = list(DIRECTIONS)
+DIRECTION_DX = np.array([DIRECTIONS[name][0] for name in DIRECTION_NAMES])
+DIRECTION_DY = np.array([DIRECTIONS[name][1] for name in DIRECTION_NAMES])
+
+
+class BatchGame:
+    """
+    Many parts-collection games stepped together, without dictionaries.
+    
+    Each game's state is one entry in a set of NumPy arrays:
+    
+        x, y        robot positions (int32)
+        part        cell id (y * grid_size + x) of the part, -1 if none
+        score       scores (int32)
+        steps       moves made so far (int32)
+        game_over   bool
+        trail       (games, grid_size * grid_size) uint8 bitmap of the
+                    cells each robot has left behind
+    
+    step() applies one move to every game still running with the same
+    rules as update_game(): move, wall or trail collision ends the game,
+    landing on the part scores PART_SCORE and spawns the next one.
+    
+    Example:
+        batch = BatchGame(games=1000, grid_size=20, seed=1)
+        while not batch.game_over.all():
+            batch.step(greedy_policy(batch))
+    """
+    
+    def __init__(self, games, grid_size=20, seed=None):
+        self.games = games
+        self.grid_size = grid_size
+        self.rng = np.random.default_rng(seed)
+        self.x = np.full(games, grid_size // 2, dtype=np.int32)
+        self.y = np.full(games, grid_size // 2, dtype=np.int32)
+        self.part = np.full(games, -1, dtype=np.int32)
+        self.score = np.zeros(games, dtype=np.int32)
+        self.steps = np.zeros(games, dtype=np.int32)
+        self.game_over = np.zeros(games, dtype=bool)
+        self.trail = np.zeros((games, grid_size * grid_size), dtype=np.uint8)
+        self._spawn(np.arange(games))
+    
+    def step(self, directions):
+        """
+        Move every running game one step.
+        
+        Args:
+            directions: Array of direction codes (index into
+                        DIRECTION_NAMES), one per game; entries for
+                        finished games are ignored
+        """
+        size = self.grid_size
+        running = np.flatnonzero(~self.game_over)
+        if running.size == 0:
+            return
+        moves = np.asarray(directions)[running]
+
+        x, y = self.x[running], self.y[running]
+        self.trail[running, y * size + x] = 1
+        x = x + DIRECTION_DX[moves]
+        y = y + DIRECTION_DY[moves]
+        self.x[running] = x
+        self.y[running] = y
+        self.steps[running] += 1
+
+        inside = (x >= 0) & (x < size) & (y >= 0) & (y < size)
+        cells = np.where(inside, y * size + x, 0)
+        crashed = ~inside | (self.trail[running, cells] == 1)
+        self.game_over[running[crashed]] = True
+
+        alive = ~crashed
+        collected = alive & (self.part[running] == cells)
+        winners = running[collected]
+        self.score[winners] += PART_SCORE
+        self._spawn(winners)
+    
+    def _spawn(self, games):
+        """Put a part on a uniformly random free cell in each given game."""
+        if games.size == 0:
+            return
+        size = self.grid_size
+        free = self.trail[games] == 0
+        free[np.arange(games.size), self.y[games] * size + self.x[games]] = False
+        counts = free.sum(axis=1)
+        # The k-th free cell of each row, found with a running count
+        picks = (self.rng.random(games.size) * counts).astype(np.int64)
+        running_count = np.cumsum(free, axis=1)
+        cells = (running_count <= picks[:, None]).sum(axis=1)
+        self.part[games] = np.where(counts > 0, cells, -1)
+
+
+def random_policy(batch):
+    """Pick a random direction for every game."""
+    return batch.rng.integers(0, len(DIRECTION_NAMES), batch.games)
+
+
+def greedy_policy(batch):
+    """
+    Head for the part, never stepping into a wall or the trail if a safe
+    move exists.
+    """
+    size = batch.grid_size
+    x = batch.x[:, None] + DIRECTION_DX[None, :]
+    y = batch.y[:, None] + DIRECTION_DY[None, :]
+    inside = (x >= 0) & (x < size) & (y >= 0) & (y < size)
+    cells = np.where(inside, y * size + x, 0)
+    rows = np.arange(batch.games)[:, None]
+    safe = inside & (batch.trail[rows, cells] == 0)
+
+    part_y, part_x = np.divmod(batch.part, size)
+    distance = np.abs(x - part_x[:, None]) + np.abs(y - part_y[:, None])
+    cost = distance + np.where(safe, 0, 4 * size)
+    return cost.argmin(axis=1)
+
+
+def _run_episode_chunk(task):
+    """Play one batch of episodes to the end (runs in a worker process)."""
+    policy, games, grid_size, max_steps, seed = task
+    batch = BatchGame(games, grid_size, seed)
+    while not batch.game_over.all() and batch.steps.max() < max_steps:
+        batch.step(policy(batch))
+    return batch.score, batch.steps
+
+
+def run_episodes(policy, episodes, grid_size=20, batch_size=1024,
+                 workers=None, seed=0, max_steps=1000):
+    """
+    Play many episodes with a policy and measure throughput.
+    
+    Episodes are split into batches of batch_size games. Batch i always
+    gets the i-th seed spawned from `seed`, so the results are the same
+    whatever the number of workers.
+    
+    Args:
+        policy: A module-level function taking a BatchGame and returning
+                one direction code per game (e.g. greedy_policy)
+        episodes: Number of games to play
+        grid_size: Board size for every game
+        batch_size: Games per lockstep batch
+        workers: Number of processes (default: one per CPU); with 1 the
+                 batches run in this process
+        seed: Seed for the whole run
+        max_steps: Games still running after this many moves are stopped
+    
+    Returns:
+        A dictionary:
+        {
+            "scores": array of final scores, one per episode,
+            "steps": array of moves made, one per episode,
+            "seconds": wall-clock time,
+            "steps_per_sec": total moves / seconds
+        }
+    """
+    sizes = [min(batch_size, episodes - start) for start in range(0, episodes, batch_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    tasks = [(policy, games, grid_size, max_steps, batch_seed)
+             for games, batch_seed in zip(sizes, seeds)]
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    begin = time.perf_counter()
+    if workers <= 1 or len(tasks) <= 1:
+        results = [_run_episode_chunk(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as pool:
+            results = list(pool.map(_run_episode_chunk, tasks))
+    seconds = time.perf_counter() - begin
 
+    scores = np.concatenate([score for score, _ in results]) if results else np.zeros(0, np.int32)
+    steps = np.concatenate([step for _, step in results]) if results else np.zeros(0, np.int32)
+    return {
+        "scores": scores,
+        "steps": steps,
+        "seconds": seconds,
+        "steps_per_sec": steps.sum() / seconds if seconds > 0 else 0.0,
+    }
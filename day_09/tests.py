@@ -16,6 +16,11 @@ from project import (
     check_part_collection,
     update_game,
     get_game_summary,
+    get_trail_cells,
+    BatchGame,
+    DIRECTION_NAMES,
+    greedy_policy,
+    run_episodes,
 )
 
 
@@ -251,6 +256,104 @@ def test_summary_game_over():
     print("✅ Test 24 passed: Summary shows game over")
 
 
+# ============================================================
+# TRAIL SET TESTS
+# ============================================================
+
+def test_trail_collision_after_moves():
+    """Test: Driving back onto the trail ends the game"""
+    state = create_game_state(20, start_pos=(10, 10))
+    state["part_pos"] = (0, 0)
+    for direction in ["right", "up", "left"]:
+        update_game(state, direction)
+        assert state["game_over"] == False, f"❌ Game should still be running"
+    update_game(state, "down")  # back onto the start cell
+    assert state["game_over"] == True, f"❌ Hitting the trail should end the game"
+    print("✅ Test 25 passed: Trail collision after moves")
+
+
+def test_trail_cells_follow_trail():
+    """Test: Trail set stays in sync when the trail grows or is replaced"""
+    state = create_game_state(20, start_pos=(10, 10))
+    move_robot(state, "right")
+    state["trail"].append((3, 3))
+    assert get_trail_cells(state) == {(10, 10), (3, 3)}, f"❌ Set should include appended cells"
+    state["trail"] = [(1, 1)]
+    assert get_trail_cells(state) == {(1, 1)}, f"❌ Set should follow a replaced trail"
+    print("✅ Test 26 passed: Trail set in sync")
+
+
+# ============================================================
+# FREE CELL SPAWN TESTS
+# ============================================================
+
+def test_spawn_part_last_free_cell():
+    """Test: On a nearly full board the part goes in the one free cell"""
+    state = create_game_state(2, start_pos=(0, 0))
+    state["trail"] = [(1, 0), (0, 1)]
+    for _ in range(10):
+        spawn_part(state)
+        assert state["part_pos"] == (1, 1), f"❌ Only (1, 1) is free"
+    print("✅ Test 27 passed: Last free cell")
+
+
+def test_spawn_part_full_board():
+    """Test: A full board leaves part_pos as None instead of looping forever"""
+    state = create_game_state(2, start_pos=(0, 0))
+    state["trail"] = [(1, 0), (0, 1), (1, 1)]
+    spawn_part(state)
+    assert state["part_pos"] is None, f"❌ No part fits on a full board"
+    print("✅ Test 28 passed: Full board detected")
+
+
+# ============================================================
+# BATCH SIMULATION TESTS
+# ============================================================
+
+def test_batch_game_matches_update_game():
+    """Test: BatchGame follows the same rules as update_game"""
+    size = 6
+    batch = BatchGame(games=3, grid_size=size, seed=0)
+    history = []  # (direction codes, parts after the step)
+    parts = batch.part.copy()
+    while not batch.game_over.all():
+        codes = greedy_policy(batch)
+        batch.step(codes)
+        history.append((codes, batch.part.copy()))
+    assert batch.score.max() > 0, f"❌ Some game should collect a part"
+
+    for game in range(batch.games):
+        state = create_game_state(size)
+        part = parts[game]
+        for codes, parts_after in history:
+            if state["game_over"]:
+                break
+            # Use the batch's part, since both spawn at random
+            state["part_pos"] = None if part < 0 else (part % size, part // size)
+            update_game(state, DIRECTION_NAMES[codes[game]])
+            part = parts_after[game]
+        trail = {(cell % size, cell // size) for cell in range(size * size)
+                 if batch.trail[game, cell]}
+        assert state["robot_pos"] == (batch.x[game], batch.y[game]), \
+            f"❌ Game {game} should end at the same position"
+        assert state["score"] == batch.score[game], f"❌ Game {game} should have the same score"
+        assert state["game_over"], f"❌ Game {game} should be over in both"
+        assert set(state["trail"]) == trail, f"❌ Game {game} should leave the same trail"
+        assert len(state["trail"]) == batch.steps[game], f"❌ Game {game} step counts differ"
+    print("✅ Test 29 passed: Batch game rules")
+
+
+def test_run_episodes_deterministic():
+    """Test: run_episodes gives the same scores for the same seed"""
+    first = run_episodes(greedy_policy, 50, grid_size=10, batch_size=20, workers=1, seed=5)
+    second = run_episodes(greedy_policy, 50, grid_size=10, batch_size=20, workers=2, seed=5)
+    assert len(first["scores"]) == 50, f"❌ Should return one score per episode"
+    assert first["scores"].tolist() == second["scores"].tolist(), \
+        f"❌ Same seed should give the same scores with any number of workers"
+    assert first["steps_per_sec"] > 0, f"❌ Should report throughput"
+    print("✅ Test 30 passed: Deterministic episodes")
+
+
 def run_all_tests():
     """Run all tests and show results."""
     print("=" * 50)
@@ -283,6 +386,12 @@ def run_all_tests():
         test_update_spawns_part,
         test_summary_contains_score,
         test_summary_game_over,
+        test_trail_collision_after_moves,
+        test_trail_cells_follow_trail,
+        test_spawn_part_last_free_cell,
+        test_spawn_part_full_board,
+        test_batch_game_matches_update_game,
+        test_run_episodes_deterministic,
     ]
     
     passed = 0
@@ -0,0 +1,84 @@
+"""
+⏱️ Benchmarks for Robot Mission Log
+
+Compares appending entries one at a time with MissionLogWriter
+in each durability mode.
+
+Usage:
+    python benchmarks.py
+"""
+
+import os
+import time
+from project import (
+    create_mission_entry,
+    append_mission_log,
+    MissionLogWriter,
+    DURABILITY_NONE,
+    DURABILITY_BATCH,
+    DURABILITY_ENTRY,
+)
+
+
+BENCH_LOG_FILE = "bench_missions.txt"
+
+
+def cleanup_bench_file():
+    """Remove benchmark file if it exists."""
+    if os.path.exists(BENCH_LOG_FILE):
+        os.remove(BENCH_LOG_FILE)
+
+
+def make_entries(count):
+    """Create count formatted mission entries."""
+    return [
+        create_mission_entry(f"M{i:07d}", i % 10, i % 100, i % 3 != 0)
+        for i in range(count)
+    ]
+
+
+def bench_append_mission_log(entries):
+    """Time append_mission_log, one open/write/close per entry."""
+    cleanup_bench_file()
+    start = time.perf_counter()
+    for entry in entries:
+        append_mission_log(BENCH_LOG_FILE, entry)
+    return time.perf_counter() - start
+
+
+def bench_writer(entries, durability):
+    """Time MissionLogWriter with the given durability mode."""
+    cleanup_bench_file()
+    start = time.perf_counter()
+    with MissionLogWriter(BENCH_LOG_FILE, durability=durability) as writer:
+        for entry in entries:
+            writer.write(entry)
+    return time.perf_counter() - start
+
+
+def report(name, count, seconds):
+    """Print one result line."""
+    print(f"{name:<32} {count:>8} entries  {count / seconds:>12,.0f} entries/sec")
+
+
+def run_all_benchmarks(count=100_000, fsync_count=1_000):
+    """Run all benchmarks and show results."""
+    print("=" * 70)
+    print("⏱️  Mission Log Write Benchmarks")
+    print("=" * 70)
+
+    entries = make_entries(count)
+    report("append_mission_log", count, bench_append_mission_log(entries))
+    report("MissionLogWriter (none)", count, bench_writer(entries, DURABILITY_NONE))
+    report("MissionLogWriter (batch)", count, bench_writer(entries, DURABILITY_BATCH))
+
+    # fsync per entry is limited by the disk, so use a smaller run
+    entries = entries[:fsync_count]
+    report("MissionLogWriter (entry)", fsync_count, bench_writer(entries, DURABILITY_ENTRY))
+
+    cleanup_bench_file()
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    run_all_benchmarks()
@@ -38,8 +38,81 @@ Example:
 M001|5|75|True
 M002|3|45|False
 M003|7|90|True
+
+Large Logs:
+-----------
+Mission logs are append-only, so the newest entries are always at the end.
+get_last_n_missions() reads the file backwards from EOF in blocks, and
+build_mission_index() can write a sidecar "<log>.idx" file of line offsets
+so a tail query becomes a single seek.
+
+Running totals for calculate_success_rate() and get_mission_statistics()
+can be kept in a "<log>.stats" file together with the byte offset they
+cover, so each call only reads the entries added since the previous one.
+The file is opt-in: update_mission_totals(log, create=True) makes it, and
+from then on appends and reads keep it up to date.
+
+MissionLogWriter buffers entries and writes them in batches for when many
+missions are logged per second (see benchmarks.py for entries/sec).
+
+Binary Format:
+--------------
+convert_text_to_binary() packs a log into fixed-width 16-byte records:
+    ID_NUMBER (uint32) | TASKS (int32) | ENERGY (int32) | SUCCESS (uint32)
+Mission ids are stored once each in a "<file>.ids" table and records
+refer to them by line number. get_binary_mission_statistics() memory-maps
+the file and sums the columns straight from the buffer.
+
+Streaming:
+----------
+iter_missions() yields parsed entries one at a time instead of building a
+list, with optional success / energy filters that are checked before the
+rest of the line is parsed.
 """
 
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+import time
+from array import array
+
+
+# Block size used when reading a log backwards from the end
+TAIL_BLOCK_SIZE = 64 * 1024
+
+# Sidecar index: a two-item header (bytes of the log already indexed, log
+# signature) followed by the 8-byte starting offset of every entry
+MISSION_INDEX_SUFFIX = ".idx"
+INDEX_ITEM_SIZE = array("q").itemsize
+INDEX_HEADER_ITEMS = 2
+
+# Sidecars remember this many log bytes before their offset (plus the log's
+# device and inode), so a log that was deleted and rewritten is noticed
+LOG_SIGNATURE_SIZE = 8
+
+# Sidecar running totals: JSON with the aggregates, the log offset consumed
+# and the log signature at that offset
+MISSION_STATS_SUFFIX = ".stats"
+
+# Durability modes for MissionLogWriter
+DURABILITY_NONE = "none"      # leave it to the OS to write the data out
+DURABILITY_BATCH = "batch"    # fsync once per flushed batch
+DURABILITY_ENTRY = "entry"    # fsync after every entry
+DURABILITY_MODES = (DURABILITY_NONE, DURABILITY_BATCH, DURABILITY_ENTRY)
+
+# Binary log: 8-byte header (magic + version) followed by fixed-width records
+BINARY_MAGIC = b"MLOG"
+BINARY_VERSION = 1
+BINARY_HEADER = struct.Struct("<4sI")
+MISSION_RECORD = struct.Struct("<IiiI")
+MISSION_IDS_SUFFIX = ".ids"
+
+# Keys of a parsed mission entry, in log order
+MISSION_FIELDS = ("mission_id", "tasks_completed", "energy_used", "success")
+
 
 def create_mission_entry(mission_id, tasks_completed, energy_used, success):
     """
@@ -58,8 +131,7 @@ def create_mission_entry(mission_id, tasks_completed, energy_used, success):
         create_mission_entry("M001", 5, 75, True)
         returns "M001|5|75|True"
     """
-    # TODO: Return formatted string with pipe separators
-    pass
+    return f"{mission_id}|{tasks_completed}|{energy_used}|{success}"
 
 
 def append_mission_log(filename, entry):
@@ -77,13 +149,20 @@ def append_mission_log(filename, entry):
         - Use 'a' mode to append
         - Add a newline after the entry
         - Use 'with' statement for safe file handling
+        - If running totals exist for this log they are updated too
     
     Example:
         append_mission_log("missions.txt", "M001|5|75|True")
         # File now contains: M001|5|75|True\n
     """
-    # TODO: Open file in append mode and write entry + newline
-    pass
+    try:
+        with open(filename, "a") as f:
+            f.write(entry + "\n")
+        if os.path.exists(get_stats_filename(filename)):
+            update_mission_totals(filename)
+        return True
+    except OSError:
+        return False
 
 
 def read_mission_log(filename):
@@ -101,9 +180,7 @@ def read_mission_log(filename):
         read_mission_log("missions.txt")
         returns ["M001|5|75|True", "M002|3|45|False"]
     """
-    # TODO: Read file and return list of lines
-    # Handle FileNotFoundError by returning empty list
-    pass
+    return list(iter_entries(filename))
 
 
 def parse_mission_entry(entry):
@@ -127,8 +204,13 @@ def parse_mission_entry(entry):
         returns {"mission_id": "M001", "tasks_completed": 5, 
                  "energy_used": 75, "success": True}
     """
-    # TODO: Split the entry and convert to appropriate types
-    pass
+    mission_id, tasks, energy, success = entry.split("|")
+    return {
+        "mission_id": mission_id,
+        "tasks_completed": int(tasks),
+        "energy_used": int(energy),
+        "success": success == "True",
+    }
 
 
 def get_last_n_missions(filename, n):
@@ -142,14 +224,33 @@ def get_last_n_missions(filename, n):
     Returns:
         A list of the last n parsed mission dictionaries
         (most recent last)
+        Returns empty list if file doesn't exist
+    
+    Notes:
+        - Only the tail of the file is read, so the cost depends on n
+          and not on the size of the log
+        - If a sidecar index exists (see build_mission_index) it is used
+          to seek straight to the first wanted entry
     
     Example:
         # Log has M001, M002, M003
         get_last_n_missions("missions.txt", 2)
         returns [parsed_M002, parsed_M003]
     """
-    # TODO: Read log, parse entries, return last n
-    pass
+    if n <= 0 or not os.path.exists(filename):
+        return []
+
+    if os.path.exists(get_index_filename(filename)):
+        entries = read_indexed_tail(filename, n)
+    else:
+        entries = []
+        for entry in read_lines_reversed(filename):
+            entries.append(entry)
+            if len(entries) == n:
+                break
+        entries.reverse()
+
+    return [parse_mission_entry(entry) for entry in entries]
 
 
 def calculate_success_rate(filename):
@@ -168,8 +269,10 @@ def calculate_success_rate(filename):
         calculate_success_rate("missions.txt")
         returns 0.7
     """
-    # TODO: Read all missions, count successes, calculate rate
-    pass
+    totals = update_mission_totals(filename)
+    if totals["total_missions"] == 0:
+        return 0.0
+    return totals["successful_missions"] / totals["total_missions"]
 
 
 def get_mission_statistics(filename):
@@ -193,9 +296,18 @@ def get_mission_statistics(filename):
         }
     
     Returns dict with all zeros if log is empty.
+    
+    Once running totals are enabled with update_mission_totals(filename,
+    create=True), only entries added since the previous call are read, so
+    polling this is cheap on large logs.
     """
-    # TODO: Calculate all statistics from the log
-    pass
+    totals = update_mission_totals(filename)
+    return _build_statistics(
+        totals["total_missions"],
+        totals["successful_missions"],
+        totals["total_tasks"],
+        totals["total_energy"],
+    )
 
 
 def clear_mission_log(filename):
@@ -210,6 +322,702 @@ def clear_mission_log(filename):
     
     Note: Use 'w' mode which overwrites/creates empty file
     """
-    # TODO: Open file in write mode to clear it
-    pass
+    with open(filename, "w"):
+        pass
+
+    for sidecar in (get_index_filename(filename), get_stats_filename(filename)):
+        if os.path.exists(sidecar):
+            os.remove(sidecar)
+    return True
+
+
+# ============================================================
+# TAIL READING & SIDECAR INDEX
+# ============================================================
+
+def read_lines_reversed(filename, block_size=TAIL_BLOCK_SIZE):
+    """
+    Yield the entries of a log file newest-first.
+    
+    Args:
+        filename: Path to the log file
+        block_size: Number of bytes read per step, working back from EOF
+    
+    Yields:
+        Entry strings (without newlines), starting with the last one.
+        Blank lines are skipped, and so is a last line without a newline
+        that is still being written (see _is_finished_entry).
+    
+    Example:
+        # Log has M001, M002, M003
+        list(read_lines_reversed("missions.txt"))
+        returns ["M003|...", "M002|...", "M001|..."]
+    """
+    with open(filename, "rb") as f:
+        position = f.seek(0, os.SEEK_END)
+        remainder = b""
+        tail_checked = False
+        while position > 0:
+            read_size = min(block_size, position)
+            position -= read_size
+            f.seek(position)
+            lines = (f.read(read_size) + remainder).split(b"\n")
+            # The first piece may be the end of a line that started in
+            # an earlier block, so keep it until that block is read
+            remainder = lines[0]
+            lines = lines[1:]
+            if lines and not tail_checked:
+                # Whatever follows the last newline hasn't been finished
+                tail_checked = True
+                tail = lines.pop().rstrip(b"\r").decode("utf-8")
+                if tail.strip() and _is_finished_entry(tail):
+                    yield tail
+            for line in reversed(lines):
+                if line.strip():
+                    yield line.rstrip(b"\r").decode("utf-8")
+        if remainder.strip():
+            entry = remainder.rstrip(b"\r").decode("utf-8")
+            if tail_checked or _is_finished_entry(entry):
+                yield entry
+
+
+def get_index_filename(filename):
+    """
+    Get the path of the sidecar index for a log file.
+    
+    Example:
+        get_index_filename("missions.txt") -> "missions.txt.idx"
+    """
+    return filename + MISSION_INDEX_SUFFIX
+
+
+def build_mission_index(filename):
+    """
+    Create or update the sidecar offset index for a log file.
+    
+    Args:
+        filename: Path to the log file
+    
+    Returns:
+        Number of entries in the index
+    
+    Notes:
+        - Only the part of the log written since the last call is scanned,
+          new offsets are appended to the index file
+        - A partly written last line is left for the next call
+        - If the log shrank or was replaced (see log_signature) the index
+          is rebuilt
+    
+    Example:
+        build_mission_index("missions.txt")  # -> 3
+        # missions.txt.idx now exists
+    """
+    index_file = get_index_filename(filename)
+    with open(filename, "rb") as log:
+        log_size = os.fstat(log.fileno()).st_size
+        header = _read_index_header(index_file)
+        if (header is None or header[0] > log_size
+                or header[1] != log_signature(log, header[0])):
+            with open(index_file, "wb") as f:
+                array("q", [0, log_signature(log, 0)]).tofile(f)
+            indexed_size = 0
+        else:
+            indexed_size = header[0]
+
+        if indexed_size < log_size:
+            offsets = array("q")
+            log.seek(indexed_size)
+            position = indexed_size
+            for line in log:
+                if not line.endswith(b"\n"):
+                    break
+                if line.strip():
+                    offsets.append(position)
+                position += len(line)
+
+            with open(index_file, "r+b") as f:
+                f.seek(0, os.SEEK_END)
+                offsets.tofile(f)
+                f.seek(0)
+                array("q", [position, log_signature(log, position)]).tofile(f)
+
+    return os.path.getsize(index_file) // INDEX_ITEM_SIZE - INDEX_HEADER_ITEMS
+
+
+def read_indexed_tail(filename, n):
+    """
+    Read the last n entries of a log using its sidecar index.
+    
+    Args:
+        filename: Path to the log file
+        n: Number of entries to read
+    
+    Returns:
+        A list of the last n entry strings (most recent last)
+    
+    The index is brought up to date first, then a single seek lands on
+    the first wanted entry and only the tail of the log is read.
+    """
+    count = build_mission_index(filename)
+    if n <= 0:
+        return []
+
+    # With nothing indexed yet the whole (short) log is scanned
+    start = array("q", [0])
+    if count:
+        with open(get_index_filename(filename), "rb") as f:
+            f.seek((max(count - n, 0) + INDEX_HEADER_ITEMS) * INDEX_ITEM_SIZE)
+            start = array("q")
+            start.fromfile(f, 1)
+
+    entries = []
+    with open(filename, "rb") as log:
+        log.seek(start[0])
+        for line in log:
+            entry = line.rstrip(b"\r\n").decode("utf-8")
+            if line.strip() and (line.endswith(b"\n") or _is_finished_entry(entry)):
+                entries.append(entry)
+    # A finished last line without a newline isn't indexed yet but is the newest
+    return entries[-n:]
+
+
+def log_signature(log, offset):
+    """
+    Identify the log a sidecar was built from.
+    
+    Args:
+        log: The log file, opened in binary mode
+        offset: The byte offset the sidecar covers
+    
+    Returns:
+        A signed 64-bit hash of the log's device, inode and the
+        LOG_SIGNATURE_SIZE bytes just before offset. If the log is deleted
+        and written again the hash changes, even when the new file is
+        larger than offset or reuses the old inode.
+    """
+    info = os.fstat(log.fileno())
+    start = max(offset - LOG_SIGNATURE_SIZE, 0)
+    log.seek(start)
+    digest = hashlib.blake2b(digest_size=8)
+    digest.update(struct.pack("<QQ", info.st_dev, info.st_ino))
+    digest.update(log.read(offset - start))
+    return int.from_bytes(digest.digest(), "little", signed=True)
+
+
+def _is_finished_entry(entry):
+    """
+    Check whether a last line that has no newline yet is a whole entry.
+    
+    Every entry ends in True or False, so a line with all four fields and
+    a full success value is finished (the file just doesn't end in a
+    newline); anything shorter is still being written.
+    """
+    fields = entry.strip().split("|")
+    return len(fields) == 4 and fields[3] in ("True", "False")
+
+
+def _read_index_header(index_file):
+    """Return an index's (bytes covered, log signature), or None if unusable."""
+    try:
+        size = os.path.getsize(index_file)
+    except OSError:
+        return None
+    if size < INDEX_HEADER_ITEMS * INDEX_ITEM_SIZE or size % INDEX_ITEM_SIZE:
+        return None
+
+    header = array("q")
+    with open(index_file, "rb") as f:
+        header.fromfile(f, INDEX_HEADER_ITEMS)
+    return header
+
+
+# ============================================================
+# RUNNING TOTALS
+# ============================================================
+
+def get_stats_filename(filename):
+    """
+    Get the path of the running totals file for a log file.
+    
+    Example:
+        get_stats_filename("missions.txt") -> "missions.txt.stats"
+    """
+    return filename + MISSION_STATS_SUFFIX
+
+
+def update_mission_totals(filename, create=False):
+    """
+    Fold any new log entries into the persisted running totals.
+    
+    Args:
+        filename: Path to the log file
+        create: Start keeping a totals file if there isn't one yet.
+                Without it, and with no totals file, the log is scanned
+                and nothing is written.
+    
+    Returns:
+        A dictionary of totals:
+        {
+            "offset": bytes of the log already counted,
+            "total_missions": int,
+            "successful_missions": int,
+            "total_tasks": int,
+            "total_energy": int
+        }
+        All zeros if the log doesn't exist.
+    
+    Notes:
+        - Reading starts at the saved offset, so the cost depends on the
+          number of new entries, not the size of the log
+        - A last line without a newline is counted if it is a whole entry
+          (see _is_finished_entry), but the saved offset stops before it,
+          and one that is still being written is left for the next call
+        - If the log shrank or was replaced (see log_signature), or the
+          totals file is unreadable, the totals are recomputed from the start
+        - If the totals file can't be written (e.g. a read-only directory)
+          the totals are still returned, just not saved
+    """
+    totals = _empty_totals()
+    if not os.path.exists(filename):
+        return totals
+
+    stats_file = get_stats_filename(filename)
+    keep = create or os.path.exists(stats_file)
+    saved = None
+    try:
+        with open(stats_file, "r") as f:
+            saved = json.load(f)
+    except (OSError, ValueError):
+        pass
+
+    last_entry = None
+    with open(filename, "rb") as log:
+        log_size = os.fstat(log.fileno()).st_size
+        if isinstance(saved, dict):
+            signature = saved.pop("signature", None)
+            if (set(saved) == set(totals) and saved["offset"] <= log_size
+                    and signature == log_signature(log, saved["offset"])):
+                totals = saved
+        saved_offset = totals["offset"] if totals is saved else None
+
+        log.seek(totals["offset"])
+        for line in log:
+            if not line.endswith(b"\n"):
+                entry = line.decode("utf-8").strip()
+                if entry and _is_finished_entry(entry):
+                    last_entry = parse_mission_entry(entry)
+                break
+            totals["offset"] += len(line)
+            if line.strip():
+                _add_mission(totals, parse_mission_entry(line.decode("utf-8").strip()))
+
+        if keep and totals["offset"] != saved_offset:
+            _save_totals(stats_file, totals, log_signature(log, totals["offset"]))
+
+    if last_entry is not None:
+        totals = dict(totals)
+        _add_mission(totals, last_entry)
+    return totals
+
+
+def _add_mission(totals, mission):
+    """Add one parsed mission to running totals."""
+    totals["total_missions"] += 1
+    totals["successful_missions"] += mission["success"]
+    totals["total_tasks"] += mission["tasks_completed"]
+    totals["total_energy"] += mission["energy_used"]
+
+
+def _save_totals(stats_file, totals, signature):
+    """Write the totals file, or leave it as it is if it can't be written."""
+    # Write to a temporary file first so a crash never leaves half a file
+    temp_file = stats_file + ".tmp"
+    try:
+        with open(temp_file, "w") as f:
+            json.dump(dict(totals, signature=signature), f)
+        os.replace(temp_file, stats_file)
+    except OSError:
+        pass
+
+
+def _build_statistics(total, successful, total_tasks, total_energy):
+    """Turn raw totals into the get_mission_statistics() dictionary."""
+    if total == 0:
+        return {
+            "total_missions": 0,
+            "successful_missions": 0,
+            "failed_missions": 0,
+            "success_rate": 0.0,
+            "total_tasks": 0,
+            "total_energy": 0,
+            "avg_tasks_per_mission": 0.0,
+            "avg_energy_per_mission": 0.0,
+        }
+
+    return {
+        "total_missions": total,
+        "successful_missions": successful,
+        "failed_missions": total - successful,
+        "success_rate": successful / total,
+        "total_tasks": total_tasks,
+        "total_energy": total_energy,
+        "avg_tasks_per_mission": total_tasks / total,
+        "avg_energy_per_mission": total_energy / total,
+    }
+
+
+def _empty_totals():
+    """Return running totals for an empty log."""
+    return {
+        "offset": 0,
+        "total_missions": 0,
+        "successful_missions": 0,
+        "total_tasks": 0,
+        "total_energy": 0,
+    }
+
+
+# ============================================================
+# BUFFERED WRITER
+# ============================================================
+
+class MissionLogWriter:
+    """
+    Append mission entries to a log in batches instead of one at a time.
+    
+    Entries are kept in memory and written with a single write call once
+    max_entries are waiting or flush_interval seconds have passed since the
+    last flush. Closing the writer always flushes what is left.
+    
+    There is no background thread: the interval is checked by write() and
+    poll(). A writer that may go quiet for a while should have poll()
+    called on a schedule (e.g. from the robot's main loop) so buffered
+    entries don't wait for the next write().
+    
+    Durability modes:
+        DURABILITY_NONE  - no fsync, fastest
+        DURABILITY_BATCH - fsync once per flushed batch
+        DURABILITY_ENTRY - every entry is written and fsynced on its own
+    
+    Example:
+        with MissionLogWriter("missions.txt", durability=DURABILITY_BATCH) as writer:
+            writer.write(create_mission_entry("M001", 5, 75, True))
+            writer.write(create_mission_entry("M002", 3, 45, False))
+        # Both entries are on disk here
+    """
+    
+    def __init__(self, filename, max_entries=1000, flush_interval=1.0,
+                 durability=DURABILITY_NONE):
+        """Set up the writer. The file is opened by open() or 'with'."""
+        if durability not in DURABILITY_MODES:
+            raise ValueError(f"Unknown durability mode: {durability}")
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+
+        self.filename = filename
+        self.max_entries = max_entries
+        self.flush_interval = flush_interval
+        self.durability = durability
+        self.entries_written = 0
+        self._buffer = []
+        self._file = None
+        self._last_flush = time.monotonic()
+    
+    def __enter__(self):
+        self.open()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+    
+    def open(self):
+        """Open the log file for appending."""
+        if self._file is None:
+            self._file = open(self.filename, "ab")
+            self._last_flush = time.monotonic()
+        return self
+    
+    def write(self, entry):
+        """
+        Queue one formatted entry, flushing if the batch is due.
+        
+        Args:
+            entry: The formatted entry string to append
+        """
+        if self._file is None:
+            raise ValueError("MissionLogWriter is not open")
+
+        self._buffer.append(entry)
+        if self.durability == DURABILITY_ENTRY or len(self._buffer) >= self.max_entries:
+            self.flush()
+        else:
+            self.poll()
+    
+    def poll(self):
+        """
+        Flush queued entries if flush_interval has passed since the last flush.
+        
+        Returns:
+            True if a flush happened
+        """
+        if (self._file is None or not self._buffer
+                or time.monotonic() - self._last_flush < self.flush_interval):
+            return False
+        self.flush()
+        return True
+    
+    def flush(self):
+        """Write all queued entries to the log file."""
+        if self._file is None:
+            return
+
+        if self._buffer:
+            data = "\n".join(self._buffer) + "\n"
+            self._file.write(data.encode("utf-8"))
+            self.entries_written += len(self._buffer)
+            self._buffer.clear()
+
+        self._file.flush()
+        if self.durability != DURABILITY_NONE:
+            os.fsync(self._file.fileno())
+        self._last_flush = time.monotonic()
+
+        if os.path.exists(get_stats_filename(self.filename)):
+            update_mission_totals(self.filename)
+    
+    def close(self):
+        """Flush any queued entries and close the file."""
+        if self._file is None:
+            return
+        try:
+            self.flush()
+        finally:
+            self._file.close()
+            self._file = None
+
+
+# ============================================================
+# BINARY FORMAT
+# ============================================================
+
+def get_ids_filename(binary_filename):
+    """
+    Get the path of the mission id table for a binary log.
+    
+    Example:
+        get_ids_filename("missions.bin") -> "missions.bin.ids"
+    """
+    return binary_filename + MISSION_IDS_SUFFIX
+
+
+def convert_text_to_binary(text_filename, binary_filename):
+    """
+    Convert a text mission log into the binary record format.
+    
+    Args:
+        text_filename: Path to an existing "ID|TASKS|ENERGY|SUCCESS" log
+        binary_filename: Path of the binary log to create
+    
+    Returns:
+        Number of records written
+    
+    Each distinct mission id is written once to the id table, however
+    many times it appears in the log.
+    
+    Example:
+        convert_text_to_binary("missions.txt", "missions.bin")  # -> 3
+    """
+    id_numbers = {}
+    count = 0
+
+    with open(binary_filename, "wb") as out:
+        out.write(BINARY_HEADER.pack(BINARY_MAGIC, BINARY_VERSION))
+        for mission in iter_missions(text_filename):
+            id_number = id_numbers.setdefault(mission["mission_id"], len(id_numbers))
+            out.write(MISSION_RECORD.pack(
+                id_number,
+                mission["tasks_completed"],
+                mission["energy_used"],
+                mission["success"],
+            ))
+            count += 1
+
+    with open(get_ids_filename(binary_filename), "w") as f:
+        for mission_id in id_numbers:
+            f.write(mission_id + "\n")
+    return count
+
+
+def convert_binary_to_text(binary_filename, text_filename):
+    """
+    Convert a binary mission log back into the text format.
+    
+    Args:
+        binary_filename: Path to a binary log made by convert_text_to_binary
+        text_filename: Path of the text log to create
+    
+    Returns:
+        Number of entries written
+    """
+    count = 0
+    with open(text_filename, "w") as f:
+        for mission in read_binary_missions(binary_filename):
+            f.write(create_mission_entry(
+                mission["mission_id"],
+                mission["tasks_completed"],
+                mission["energy_used"],
+                mission["success"],
+            ) + "\n")
+            count += 1
+    return count
+
+
+def read_binary_missions(binary_filename):
+    """
+    Yield every mission in a binary log as a parsed dictionary.
+    
+    Args:
+        binary_filename: Path to a binary log
+    
+    Yields:
+        Dictionaries in the same shape as parse_mission_entry() returns
+    """
+    with open(get_ids_filename(binary_filename), "r") as f:
+        mission_ids = [line.rstrip("\n") for line in f]
+
+    with open(binary_filename, "rb") as f:
+        _check_binary_header(f.read(BINARY_HEADER.size), binary_filename)
+        while True:
+            chunk = f.read(MISSION_RECORD.size * 4096)
+            if not chunk:
+                break
+            for id_number, tasks, energy, success in MISSION_RECORD.iter_unpack(chunk):
+                yield {
+                    "mission_id": mission_ids[id_number],
+                    "tasks_completed": tasks,
+                    "energy_used": energy,
+                    "success": bool(success),
+                }
+
+
+def get_binary_mission_statistics(binary_filename):
+    """
+    Get the same statistics as get_mission_statistics() from a binary log.
+    
+    Args:
+        binary_filename: Path to a binary log
+    
+    Returns:
+        The get_mission_statistics() dictionary
+    
+    The file is memory-mapped and viewed as a flat array of int32 values,
+    so each column is a strided slice of that view and is summed without
+    creating any per-mission objects.
+    """
+    with open(binary_filename, "rb") as f:
+        _check_binary_header(f.read(BINARY_HEADER.size), binary_filename)
+        data_size = os.fstat(f.fileno()).st_size - BINARY_HEADER.size
+        total = data_size // MISSION_RECORD.size
+        if total == 0:
+            return _build_statistics(0, 0, 0, 0)
+
+        if sys.byteorder != "little":
+            # The cast below reads native byte order, so unpack instead
+            columns = [0, 0, 0, 0]
+            f.seek(BINARY_HEADER.size)
+            for record in MISSION_RECORD.iter_unpack(f.read(total * MISSION_RECORD.size)):
+                for i, value in enumerate(record):
+                    columns[i] += value
+            return _build_statistics(total, columns[3], columns[1], columns[2])
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            end = BINARY_HEADER.size + total * MISSION_RECORD.size
+            with memoryview(buffer)[BINARY_HEADER.size:end] as raw:
+                with raw.cast("i") as values:
+                    fields = MISSION_RECORD.size // values.itemsize
+                    total_tasks = sum(values[1::fields])
+                    total_energy = sum(values[2::fields])
+                    successful = sum(values[3::fields])
+
+    return _build_statistics(total, successful, total_tasks, total_energy)
+
+
+def _check_binary_header(header, binary_filename):
+    """Raise ValueError if header is not a supported binary log header."""
+    if len(header) != BINARY_HEADER.size:
+        raise ValueError(f"{binary_filename} is not a binary mission log")
+    magic, version = BINARY_HEADER.unpack(header)
+    if magic != BINARY_MAGIC or version != BINARY_VERSION:
+        raise ValueError(f"{binary_filename} is not a binary mission log")
+
+
+# ============================================================
+# STREAMING
+# ============================================================
+
+def iter_entries(filename):
+    """
+    Yield the raw entry strings of a log one at a time.
+    
+    Args:
+        filename: Path to the log file
+    
+    Yields:
+        Entry strings (without newlines), oldest first.
+        Nothing if the file doesn't exist.
+    """
+    try:
+        f = open(filename, "r")
+    except FileNotFoundError:
+        return
+    with f:
+        for line in f:
+            if line.strip():
+                yield line.rstrip("\n")
+
+
+def iter_missions(filename, filter=None, fields=None, success=None,
+                  energy_above=None):
+    """
+    Yield parsed missions one at a time, keeping memory use constant.
+    
+    Args:
+        filename: Path to the log file
+        filter: Optional function taking a parsed mission and returning
+                True to keep it
+        fields: Optional list of keys to keep in each yielded dictionary
+        success: If True/False, only yield missions with that result
+        energy_above: If set, only yield missions with energy_used > this
+    
+    Yields:
+        Mission dictionaries like parse_mission_entry() returns, oldest first
+    
+    The success and energy_above checks look at just those fields of the
+    raw line, so rejected entries are never fully parsed.
+    
+    Example:
+        for mission in iter_missions("missions.txt", success=True,
+                                     fields=["mission_id"]):
+            print(mission["mission_id"])
+    """
+    if fields is not None:
+        unknown = [field for field in fields if field not in MISSION_FIELDS]
+        if unknown:
+            raise ValueError(f"Unknown mission fields: {unknown}")
+
+    check_raw = success is not None or energy_above is not None
+    for entry in iter_entries(filename):
+        if check_raw:
+            _, energy, result = entry.rsplit("|", 2)
+            if success is not None and (result == "True") != success:
+                continue
+            if energy_above is not None and int(energy) <= energy_above:
+                continue
 
+        mission = parse_mission_entry(entry)
+        if filter is not None and not filter(mission):
+            continue
+        if fields is not None:
+            mission = {field: mission[field] for field in fields}
+        yield mission
@@ -17,16 +17,32 @@ from project import (
     calculate_success_rate,
     get_mission_statistics,
     clear_mission_log,
+    read_lines_reversed,
+    build_mission_index,
+    get_index_filename,
+    get_stats_filename,
+    update_mission_totals,
+    MissionLogWriter,
+    DURABILITY_BATCH,
+    convert_text_to_binary,
+    convert_binary_to_text,
+    get_binary_mission_statistics,
+    get_ids_filename,
+    iter_missions,
 )
 
 
 TEST_LOG_FILE = "test_missions.txt"
+TEST_BINARY_FILE = "test_missions.bin"
 
 
 def cleanup_test_file():
-    """Remove test file if it exists."""
-    if os.path.exists(TEST_LOG_FILE):
-        os.remove(TEST_LOG_FILE)
+    """Remove test file (and its sidecar index) if they exist."""
+    sidecars = (get_index_filename(TEST_LOG_FILE), get_stats_filename(TEST_LOG_FILE))
+    binary = (TEST_BINARY_FILE, get_ids_filename(TEST_BINARY_FILE))
+    for path in (TEST_LOG_FILE,) + sidecars + binary:
+        if os.path.exists(path):
+            os.remove(path)
 
 
 # ============================================================
@@ -229,6 +245,302 @@ def test_clear_log():
     print("✅ Test 17 passed: Clear log")
 
 
+# ============================================================
+# TAIL READING & INDEX TESTS
+# ============================================================
+
+def test_read_lines_reversed_small_blocks():
+    """Test: Reverse reader handles lines split across blocks"""
+    cleanup_test_file()
+    for i in range(1, 6):
+        append_mission_log(TEST_LOG_FILE, f"M00{i}|{i}|{i * 10}|True")
+    entries = list(read_lines_reversed(TEST_LOG_FILE, block_size=4))
+    expected = list(reversed(read_mission_log(TEST_LOG_FILE)))
+    assert entries == expected, f"❌ Expected {expected}, got {entries}"
+    cleanup_test_file()
+    print("✅ Test 18 passed: Reverse reader")
+
+
+def test_get_last_n_with_index():
+    """Test: Indexed tail matches unindexed tail"""
+    cleanup_test_file()
+    for i in range(1, 4):
+        append_mission_log(TEST_LOG_FILE, f"M00{i}|{i}|{i * 10}|True")
+    count = build_mission_index(TEST_LOG_FILE)
+    assert count == 3, f"❌ Index should hold 3 entries, got {count}"
+    missions = get_last_n_missions(TEST_LOG_FILE, 2)
+    ids = [m["mission_id"] for m in missions]
+    assert ids == ["M002", "M003"], f"❌ Expected ['M002', 'M003'], got {ids}"
+    cleanup_test_file()
+    print("✅ Test 19 passed: Indexed tail")
+
+
+def test_index_catches_up_after_append():
+    """Test: Index picks up entries appended after it was built"""
+    cleanup_test_file()
+    append_mission_log(TEST_LOG_FILE, "M001|5|75|True")
+    build_mission_index(TEST_LOG_FILE)
+    append_mission_log(TEST_LOG_FILE, "M002|3|45|False")
+    missions = get_last_n_missions(TEST_LOG_FILE, 1)
+    assert missions[0]["mission_id"] == "M002", f"❌ Last should be M002"
+    clear_mission_log(TEST_LOG_FILE)
+    assert not os.path.exists(get_index_filename(TEST_LOG_FILE)), \
+        f"❌ Clearing the log should remove its index"
+    cleanup_test_file()
+    print("✅ Test 20 passed: Index catches up")
+
+
+# ============================================================
+# RUNNING TOTALS TESTS
+# ============================================================
+
+def test_totals_fold_new_entries():
+    """Test: Running totals only read entries added since last call"""
+    cleanup_test_file()
+    append_mission_log(TEST_LOG_FILE, "M001|5|75|True")
+    first = update_mission_totals(TEST_LOG_FILE, create=True)
+    append_mission_log(TEST_LOG_FILE, "M002|3|45|False")
+    stats = get_mission_statistics(TEST_LOG_FILE)
+    assert first["total_missions"] == 1, f"❌ First totals should hold 1 mission"
+    assert stats["total_missions"] == 2, f"❌ Expected 2 missions"
+    assert stats["total_energy"] == 120, f"❌ Expected 120 energy"
+    assert stats["success_rate"] == 0.5, f"❌ Expected 0.5 success rate"
+    cleanup_test_file()
+    print("✅ Test 21 passed: Running totals")
+
+
+def test_totals_reset_after_clear():
+    """Test: Totals start over after the log is cleared"""
+    cleanup_test_file()
+    append_mission_log(TEST_LOG_FILE, "M001|5|75|True")
+    update_mission_totals(TEST_LOG_FILE, create=True)
+    clear_mission_log(TEST_LOG_FILE)
+    append_mission_log(TEST_LOG_FILE, "M002|3|45|False")
+    rate = calculate_success_rate(TEST_LOG_FILE)
+    assert rate == 0.0, f"❌ Expected 0.0 after clear, got {rate}"
+    cleanup_test_file()
+    print("✅ Test 22 passed: Totals reset after clear")
+
+
+# ============================================================
+# BUFFERED WRITER TESTS
+# ============================================================
+
+def test_writer_flushes_on_close():
+    """Test: Buffered writer writes everything when closed"""
+    cleanup_test_file()
+    with MissionLogWriter(TEST_LOG_FILE, max_entries=10) as writer:
+        for i in range(1, 4):
+            writer.write(create_mission_entry(f"M00{i}", i, i * 10, True))
+        assert read_mission_log(TEST_LOG_FILE) == [], \
+            f"❌ Entries should still be buffered"
+    entries = read_mission_log(TEST_LOG_FILE)
+    assert len(entries) == 3, f"❌ Expected 3 entries, got {len(entries)}"
+    cleanup_test_file()
+    print("✅ Test 23 passed: Writer flushes on close")
+
+
+def test_writer_flushes_full_batch():
+    """Test: Buffered writer flushes when the batch is full"""
+    cleanup_test_file()
+    with MissionLogWriter(TEST_LOG_FILE, max_entries=2,
+                          durability=DURABILITY_BATCH) as writer:
+        writer.write("M001|5|75|True")
+        writer.write("M002|3|45|False")
+        entries = read_mission_log(TEST_LOG_FILE)
+        assert len(entries) == 2, f"❌ Full batch should be written"
+    cleanup_test_file()
+    print("✅ Test 24 passed: Writer flushes full batch")
+
+
+# ============================================================
+# BINARY FORMAT TESTS
+# ============================================================
+
+def test_binary_statistics_match_text():
+    """Test: Binary statistics match text statistics"""
+    cleanup_test_file()
+    append_mission_log(TEST_LOG_FILE, "M001|5|75|True")
+    append_mission_log(TEST_LOG_FILE, "M002|3|45|False")
+    append_mission_log(TEST_LOG_FILE, "M001|7|90|True")
+    count = convert_text_to_binary(TEST_LOG_FILE, TEST_BINARY_FILE)
+    assert count == 3, f"❌ Expected 3 records, got {count}"
+    expected = get_mission_statistics(TEST_LOG_FILE)
+    stats = get_binary_mission_statistics(TEST_BINARY_FILE)
+    assert stats == expected, f"❌ Expected {expected}, got {stats}"
+    cleanup_test_file()
+    print("✅ Test 25 passed: Binary statistics")
+
+
+def test_binary_round_trip():
+    """Test: Text -> binary -> text gives the same log"""
+    cleanup_test_file()
+    append_mission_log(TEST_LOG_FILE, "M001|5|75|True")
+    append_mission_log(TEST_LOG_FILE, "M002|3|45|False")
+    original = read_mission_log(TEST_LOG_FILE)
+    convert_text_to_binary(TEST_LOG_FILE, TEST_BINARY_FILE)
+    convert_binary_to_text(TEST_BINARY_FILE, TEST_LOG_FILE)
+    entries = read_mission_log(TEST_LOG_FILE)
+    assert entries == original, f"❌ Expected {original}, got {entries}"
+    cleanup_test_file()
+    print("✅ Test 26 passed: Binary round trip")
+
+
+# ============================================================
+# STREAMING TESTS
+# ============================================================
+
+def test_iter_missions_pushdown_filters():
+    """Test: Streaming with success and energy filters"""
+    cleanup_test_file()
+    append_mission_log(TEST_LOG_FILE, "M001|5|75|True")
+    append_mission_log(TEST_LOG_FILE, "M002|3|45|False")
+    append_mission_log(TEST_LOG_FILE, "M003|7|90|True")
+    append_mission_log(TEST_LOG_FILE, "M004|2|30|True")
+    ids = [m["mission_id"] for m in iter_missions(TEST_LOG_FILE, success=True,
+                                                 energy_above=50)]
+    assert ids == ["M001", "M003"], f"❌ Expected ['M001', 'M003'], got {ids}"
+    cleanup_test_file()
+    print("✅ Test 27 passed: Streaming filters")
+
+
+def test_iter_missions_fields_and_filter():
+    """Test: Streaming with a filter function and selected fields"""
+    cleanup_test_file()
+    append_mission_log(TEST_LOG_FILE, "M001|5|75|True")
+    append_mission_log(TEST_LOG_FILE, "M002|3|45|False")
+    missions = list(iter_missions(TEST_LOG_FILE,
+                                  filter=lambda m: m["tasks_completed"] < 4,
+                                  fields=["mission_id", "success"]))
+    expected = [{"mission_id": "M002", "success": False}]
+    assert missions == expected, f"❌ Expected {expected}, got {missions}"
+    assert list(iter_missions("nonexistent_file.txt")) == [], \
+        f"❌ Missing file should yield nothing"
+    cleanup_test_file()
+    print("✅ Test 28 passed: Streaming fields")
+
+
+# ============================================================
+# SIDECAR RECOVERY TESTS
+# ============================================================
+
+def test_index_skips_partial_line_and_replaced_log():
+    """Test: Index waits for unfinished lines and notices a replaced log"""
+    cleanup_test_file()
+    with open(TEST_LOG_FILE, "w") as f:
+        f.write("A|1|1|True\nB|2|2|Tr")
+    assert build_mission_index(TEST_LOG_FILE) == 1, f"❌ Unfinished line shouldn't be indexed"
+    with open(TEST_LOG_FILE, "a") as f:
+        f.write("ue\n")
+    missions = get_last_n_missions(TEST_LOG_FILE, 1)
+    assert missions[0]["mission_id"] == "B", f"❌ Expected B once its line is finished"
+
+    os.remove(TEST_LOG_FILE)
+    for i in range(1, 6):
+        append_mission_log(TEST_LOG_FILE, f"N00{i}|{i}|{i}|False")
+    ids = [m["mission_id"] for m in get_last_n_missions(TEST_LOG_FILE, 5)]
+    expected = [f"N00{i}" for i in range(1, 6)]
+    assert ids == expected, f"❌ Expected {expected} from the new log, got {ids}"
+    cleanup_test_file()
+    print("✅ Test 29 passed: Index recovers from partial line and replaced log")
+
+
+def test_totals_reset_for_replaced_log():
+    """Test: Totals start over when the log is replaced, and survive a failed save"""
+    cleanup_test_file()
+    for i in range(1, 4):
+        append_mission_log(TEST_LOG_FILE, f"M00{i}|{i}|{i * 10}|True")
+    update_mission_totals(TEST_LOG_FILE, create=True)
+    os.remove(TEST_LOG_FILE)
+    with MissionLogWriter(TEST_LOG_FILE) as writer:
+        for i in range(1, 6):
+            writer.write(create_mission_entry(f"N00{i}", 1, 2, False))
+    stats = get_mission_statistics(TEST_LOG_FILE)
+    assert stats["total_missions"] == 5, f"❌ Expected 5 missions, got {stats['total_missions']}"
+    assert stats["total_energy"] == 10, f"❌ Expected 10 energy, got {stats['total_energy']}"
+
+    # A directory in the way makes saving the totals fail like a read-only directory
+    temp_file = get_stats_filename(TEST_LOG_FILE) + ".tmp"
+    os.mkdir(temp_file)
+    try:
+        append_mission_log(TEST_LOG_FILE, "N006|1|2|True")
+        rate = calculate_success_rate(TEST_LOG_FILE)
+    finally:
+        os.rmdir(temp_file)
+    assert rate == 1 / 6, f"❌ Expected 1/6 even when totals can't be saved, got {rate}"
+    cleanup_test_file()
+    print("✅ Test 30 passed: Totals reset for a replaced log")
+
+
+# ============================================================
+# WRITER POLLING TESTS
+# ============================================================
+
+def test_writer_poll_flushes_after_interval():
+    """Test: poll() flushes a quiet writer once the interval has passed"""
+    cleanup_test_file()
+    with MissionLogWriter(TEST_LOG_FILE, flush_interval=60) as writer:
+        writer.write("M001|5|75|True")
+        assert not writer.poll(), f"❌ poll() shouldn't flush before the interval"
+        assert read_mission_log(TEST_LOG_FILE) == [], f"❌ Entry should still be buffered"
+        writer.flush_interval = 0
+        assert writer.poll(), f"❌ poll() should flush once the interval has passed"
+        entries = read_mission_log(TEST_LOG_FILE)
+        assert entries == ["M001|5|75|True"], f"❌ Expected the entry on disk, got {entries}"
+    cleanup_test_file()
+    print("✅ Test 31 passed: Writer poll")
+
+
+# ============================================================
+# UNFINISHED LAST LINE TESTS
+# ============================================================
+
+def test_tail_skips_unfinished_last_line():
+    """Test: Tail reads skip a last line that is still being written"""
+    cleanup_test_file()
+    with open(TEST_LOG_FILE, "w") as f:
+        f.write("M001|5|75|True\nM002|3|4")
+    for indexed in (False, True):
+        if indexed:
+            build_mission_index(TEST_LOG_FILE)
+        ids = [m["mission_id"] for m in get_last_n_missions(TEST_LOG_FILE, 2)]
+        assert ids == ["M001"], f"❌ Expected ['M001'] (indexed={indexed}), got {ids}"
+
+    with open(TEST_LOG_FILE, "a") as f:
+        f.write("5|False")  # finished, just no newline at the end of the file
+    for indexed in (False, True):
+        if not indexed:
+            os.remove(get_index_filename(TEST_LOG_FILE))
+        ids = [m["mission_id"] for m in get_last_n_missions(TEST_LOG_FILE, 2)]
+        assert ids == ["M001", "M002"], \
+            f"❌ Expected ['M001', 'M002'] (indexed={indexed}), got {ids}"
+    cleanup_test_file()
+    print("✅ Test 32 passed: Tail skips unfinished last line")
+
+
+def test_statistics_count_finished_last_line():
+    """Test: Statistics count a finished last line, and reads don't create totals"""
+    cleanup_test_file()
+    with open(TEST_LOG_FILE, "w") as f:
+        f.write("M001|5|75|True\nM002|3|45|False")
+    stats = get_mission_statistics(TEST_LOG_FILE)
+    assert stats["total_missions"] == 2, f"❌ Expected 2 missions, got {stats['total_missions']}"
+    assert calculate_success_rate(TEST_LOG_FILE) == 0.5, f"❌ Expected 0.5 success rate"
+    assert not os.path.exists(get_stats_filename(TEST_LOG_FILE)), \
+        f"❌ Reading statistics shouldn't create a totals file"
+
+    totals = update_mission_totals(TEST_LOG_FILE, create=True)
+    assert totals["total_missions"] == 2, f"❌ Totals should include the last line"
+    assert totals["offset"] == len("M001|5|75|True\n"), \
+        f"❌ Saved offset should stop before the line without a newline"
+    with open(TEST_LOG_FILE, "a") as f:
+        f.write("\nM003|1|1|True\n")
+    stats = get_mission_statistics(TEST_LOG_FILE)
+    assert stats["total_missions"] == 3, f"❌ Expected 3 missions, got {stats['total_missions']}"
+    cleanup_test_file()
+    print("✅ Test 33 passed: Finished last line counted")
+
+
 def run_all_tests():
     """Run all tests and show results."""
     print("=" * 50)
@@ -254,6 +566,22 @@ def run_all_tests():
         test_statistics_averages,
         test_statistics_empty,
         test_clear_log,
+        test_read_lines_reversed_small_blocks,
+        test_get_last_n_with_index,
+        test_index_catches_up_after_append,
+        test_totals_fold_new_entries,
+        test_totals_reset_after_clear,
+        test_writer_flushes_on_close,
+        test_writer_flushes_full_batch,
+        test_binary_statistics_match_text,
+        test_binary_round_trip,
+        test_iter_missions_pushdown_filters,
+        test_iter_missions_fields_and_filter,
+        test_index_skips_partial_line_and_replaced_log,
+        test_totals_reset_for_replaced_log,
+        test_writer_poll_flushes_after_interval,
+        test_tail_skips_unfinished_last_line,
+        test_statistics_count_finished_last_line,
     ]
     
     passed = 0
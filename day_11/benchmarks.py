@@ -0,0 +1,90 @@
+"""
+⏱️ Benchmarks for Robot Sensor Log Analyzer
+
+Compares the fused generate_report() with calling each metric
+function in turn (generate_report_per_metric).
+
+Usage:
+    python benchmarks.py
+"""
+
+import time
+import numpy as np
+import pandas as pd
+from project import (
+    LOW_BATTERY_THRESHOLD,
+    generate_report,
+    get_run_count,
+    get_average_distance,
+    get_total_distance,
+    get_low_battery_runs,
+    get_battery_consumption,
+    get_runs_with_errors,
+)
+
+
+def generate_report_per_metric(df):
+    """
+    Generate the report by calling each metric function in turn.
+    
+    Same result as generate_report(df), but every function scans the
+    DataFrame again. This is the baseline the fused report is timed against.
+    """
+    consumption = get_battery_consumption(df)
+    return {
+        "total_runs": get_run_count(df),
+        "total_distance": get_total_distance(df),
+        "average_distance": get_average_distance(df),
+        "runs_with_errors": len(get_runs_with_errors(df)),
+        "low_battery_runs": len(get_low_battery_runs(df, LOW_BATTERY_THRESHOLD)),
+        "average_battery_consumption": (
+            round(float(consumption.mean()), 2) if consumption.count() else 0.0
+        ),
+    }
+
+
+def make_sensor_log(rows, seed=0):
+    """Create a typed sensor log DataFrame with the given number of rows."""
+    rng = np.random.default_rng(seed)
+    run_ids = pd.Categorical.from_codes(
+        np.arange(rows) % 1000, [f"R{i:03d}" for i in range(1000)]
+    )
+    return pd.DataFrame({
+        "run_id": run_ids,
+        "timestamp": pd.Timestamp("2024-01-15") + pd.to_timedelta(np.arange(rows), unit="s"),
+        "distance": rng.uniform(0, 300, rows).round(1),
+        "battery_start": rng.integers(60, 101, rows).astype(np.int16),
+        "battery_end": rng.integers(0, 60, rows).astype(np.int16),
+        "errors": rng.integers(0, 4, rows).astype(np.int16),
+    })
+
+
+def best_time(function, df, repeats=3):
+    """Return the fastest of several timed calls."""
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function(df)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def run_all_benchmarks(sizes=(1_000_000, 10_000_000)):
+    """Run all benchmarks and show results."""
+    print("=" * 60)
+    print("⏱️  Sensor Log Report Benchmarks")
+    print("=" * 60)
+
+    for rows in sizes:
+        df = make_sensor_log(rows)
+        assert generate_report(df) == generate_report_per_metric(df)
+        per_metric = best_time(generate_report_per_metric, df)
+        fused = best_time(generate_report, df)
+        print(f"{rows:>12,} rows  per-metric {per_metric:8.3f}s  "
+              f"fused {fused:8.3f}s  ({per_metric / fused:.1f}x)")
+
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    run_all_benchmarks()
@@ -40,29 +40,128 @@ R002,2024-01-15 10:30,200.2,100,45,1
 R003,2024-01-15 14:00,175.8,80,30,0
 
 Note: A sample CSV file 'sensor_log.csv' should be created for testing.
+
+Large Logs (Chunked Mode):
+--------------------------
+load_sensor_log(filename, chunksize=N) returns a SensorLogChunks instead
+of one big DataFrame: iterating it yields DataFrames of N rows, and every
+iteration re-reads the file, so it can be passed to several functions.
+The report functions accept either one, and for chunks they build small
+per-chunk summaries (summarize_chunk) that are merged together
+(merge_summaries), so the whole file is never in memory. Results are the
+same as the in-memory path. Functions that return rows or one value per
+run (get_low_battery_runs, get_battery_consumption, ...) still have to
+hold their result; use get_average_battery_consumption() or
+generate_report() for a constant-memory answer.
+
+Typed Loading & Cache:
+----------------------
+Columns are read with explicit dtypes (SENSOR_DTYPES) and the timestamp
+is parsed as a datetime (if the file has one). The integer columns allow
+blank cells: a column with blanks stays a nullable Int16 column (the
+blanks are <NA> and are left out of counts and averages), one without
+becomes plain int16. Pass report="..." (see REPORT_COLUMNS) or
+columns=[...] to read only what a report needs. With cache=True the typed
+data is saved in a columnar cache next to the CSV (Parquet when pyarrow is
+installed, otherwise one .npy file per column); later loads read the cache
+until the CSV's modification time or size changes.
+
+Fused Report:
+-------------
+generate_report(df) is the same summary as in chunked mode, taken over
+the whole DataFrame: summarize_chunk() pulls each needed column out as a
+NumPy array once and computes every report value from those in a single
+pass, instead of one scan per metric function.
 """
 
+import importlib.util
+import itertools
+import json
+import math
+import os
+import shutil
+
+import numpy as np
 import pandas as pd
 
 
-def load_sensor_log(filename):
+# Battery level below which a run counts as "low battery" in reports
+LOW_BATTERY_THRESHOLD = 30
+
+# Explicit column types, so pandas doesn't have to guess them on every load.
+# "Int16" is pandas' nullable integer, so blank cells load as <NA>; columns
+# without blanks are turned into plain int16 after loading.
+SENSOR_DTYPES = {
+    "run_id": "category",
+    "distance": "float64",
+    "battery_start": "Int16",
+    "battery_end": "Int16",
+    "errors": "Int16",
+}
+DATE_COLUMNS = ["timestamp"]
+
+# Columns each report function needs, for load_sensor_log(report=...)
+REPORT_COLUMNS = {
+    "run_count": ["run_id"],
+    "average_distance": ["distance"],
+    "total_distance": ["distance"],
+    "low_battery_runs": ["battery_end"],
+    "battery_consumption": ["battery_start", "battery_end"],
+    "average_battery_consumption": ["battery_start", "battery_end"],
+    "error_summary": ["errors"],
+    "runs_with_errors": ["errors"],
+    "report": ["distance", "battery_start", "battery_end", "errors"],
+}
+
+# Columnar cache: a "<csv>.cache" folder with meta.json plus the data
+CACHE_SUFFIX = ".cache"
+CACHE_META_FILE = "meta.json"
+CACHE_PARQUET_FILE = "data.parquet"
+
+
+def load_sensor_log(filename, chunksize=None, columns=None, report=None,
+                    cache=False):
     """
     Load sensor log from a CSV file into a pandas DataFrame.
     
     Args:
         filename: Path to the CSV file
+        chunksize: Optional number of rows per chunk. When given, an
+                   iterator of DataFrames is returned instead (chunked mode)
+        columns: Optional list of columns to load (others are skipped)
+        report: Optional report name from REPORT_COLUMNS, loads just the
+                columns that report needs
+        cache: If True, load through the columnar cache (ignored in
+               chunked mode)
     
     Returns:
         A pandas DataFrame with the sensor data
+        (or a SensorLogChunks of DataFrames if chunksize is set)
         Returns None if file doesn't exist
+        Blank battery/errors cells load as <NA> (see SENSOR_DTYPES)
     
     Example:
         df = load_sensor_log("sensor_log.csv")
         df.head()  # Shows first 5 rows
+        
+        chunks = load_sensor_log("huge_log.csv", chunksize=100_000)
+        generate_report(chunks)  # one pass over the file
+        
+        df = load_sensor_log("sensor_log.csv", report="error_summary")
+        # Only the 'errors' column is parsed
     """
-    # TODO: Use pd.read_csv() to load the file
-    # Handle FileNotFoundError by returning None
-    pass
+    if report is not None:
+        columns = REPORT_COLUMNS[report]
+
+    try:
+        if chunksize is not None:
+            os.stat(filename)  # report a missing file now, not on first use
+            return SensorLogChunks(filename, chunksize, _read_options(filename, columns))
+        if cache:
+            return load_cached_sensor_log(filename, columns)
+        return compact_int_columns(pd.read_csv(filename, **_read_options(filename, columns)))
+    except FileNotFoundError:
+        return None
 
 
 def get_column_names(df):
@@ -78,8 +177,7 @@ def get_column_names(df):
     Example:
         get_column_names(df) -> ['run_id', 'timestamp', 'distance', ...]
     """
-    # TODO: Return list of column names
-    pass
+    return list(df.columns)
 
 
 def get_run_count(df):
@@ -95,8 +193,9 @@ def get_run_count(df):
     Example:
         get_run_count(df) -> 25
     """
-    # TODO: Return the number of rows in the DataFrame
-    pass
+    if is_chunked(df):
+        return summarize_chunks(df)["rows"]
+    return len(df)
 
 
 def get_average_distance(df):
@@ -112,8 +211,11 @@ def get_average_distance(df):
     Example:
         get_average_distance(df) -> 175.5
     """
-    # TODO: Calculate and return the mean of the 'distance' column
-    pass
+    if is_chunked(df):
+        return _average_distance(summarize_chunks(df))
+    if len(df) == 0:
+        return 0.0
+    return round(get_total_distance(df) / len(df), 2)
 
 
 def get_total_distance(df):
@@ -126,11 +228,15 @@ def get_total_distance(df):
     Returns:
         Total distance as a float
     
+    The sum uses math.fsum so it is exact to the last bit, which keeps the
+    chunked and in-memory results identical.
+    
     Example:
         get_total_distance(df) -> 4387.5
     """
-    # TODO: Calculate and return the sum of the 'distance' column
-    pass
+    if is_chunked(df):
+        return _total_distance(summarize_chunks(df))
+    return math.fsum(df["distance"])
 
 
 def get_low_battery_runs(df, threshold=30):
@@ -148,8 +254,11 @@ def get_low_battery_runs(df, threshold=30):
         low_runs = get_low_battery_runs(df, 30)
         # Returns rows where battery_end < 30
     """
-    # TODO: Filter DataFrame where battery_end < threshold
-    pass
+    if is_chunked(df):
+        return _concat_chunks(
+            chunk[chunk["battery_end"] < threshold] for chunk in _iter_chunks(df)
+        )
+    return df[df["battery_end"] < threshold]
 
 
 def get_battery_consumption(df):
@@ -162,12 +271,42 @@ def get_battery_consumption(df):
     Returns:
         A pandas Series with battery consumption (start - end)
     
+    In chunked mode the Series still has one value per run of the whole
+    file; use get_average_battery_consumption() if only the average is
+    needed.
+    
     Example:
         consumption = get_battery_consumption(df)
         # Series: [25, 55, 50, ...]
     """
-    # TODO: Return battery_start - battery_end
-    pass
+    if is_chunked(df):
+        return _concat_chunks(
+            chunk["battery_start"] - chunk["battery_end"] for chunk in _iter_chunks(df)
+        )
+    return df["battery_start"] - df["battery_end"]
+
+
+def get_average_battery_consumption(df):
+    """
+    Calculate the average battery consumption per run.
+    
+    Args:
+        df: A pandas DataFrame with 'battery_start' and 'battery_end' columns
+    
+    Returns:
+        Average consumption as a float, rounded to 2 decimal places
+        (0.0 if there are no runs)
+    
+    Example:
+        get_average_battery_consumption(df) -> 44.0
+    """
+    if is_chunked(df):
+        summary = summarize_chunks(df)
+        rows, consumption_sum = summary["consumption_rows"], summary["consumption_sum"]
+    else:
+        consumption = get_battery_consumption(df)
+        rows, consumption_sum = int(consumption.count()), int(consumption.sum())
+    return round(consumption_sum / rows, 2) if rows else 0.0
 
 
 def get_error_summary(df):
@@ -184,8 +323,9 @@ def get_error_summary(df):
         get_error_summary(df) -> {0: 15, 1: 8, 2: 2}
         # 15 runs with 0 errors, 8 with 1 error, etc.
     """
-    # TODO: Use value_counts() on the 'errors' column
-    pass
+    if is_chunked(df):
+        return summarize_chunks(df)["error_counts"]
+    return _count_errors(df)
 
 
 def get_runs_with_errors(df):
@@ -198,8 +338,9 @@ def get_runs_with_errors(df):
     Returns:
         A DataFrame with only rows where errors > 0
     """
-    # TODO: Filter DataFrame where errors > 0
-    pass
+    if is_chunked(df):
+        return _concat_chunks(chunk[chunk["errors"] > 0] for chunk in _iter_chunks(df))
+    return df[df["errors"] > 0]
 
 
 def generate_report(df):
@@ -224,6 +365,412 @@ def generate_report(df):
         report = generate_report(df)
         print(report["total_runs"])  # 25
     """
-    # TODO: Use other functions to compile the report
-    pass
+    if is_chunked(df):
+        return report_from_summary(summarize_chunks(df))
+    return report_from_summary(summarize_chunk(df))
+
+
+# ============================================================
+# CHUNKED MODE
+# ============================================================
+
+class SensorLogChunks:
+    """
+    A sensor log CSV read in chunks, as returned by load_sensor_log(chunksize=N).
+    
+    Iterating yields DataFrames of up to chunksize rows. Unlike a plain
+    pandas chunk reader, which can only be read once, every iteration
+    opens the file again, so the same object can go to several report
+    functions.
+    
+    Example:
+        chunks = load_sensor_log("huge_log.csv", chunksize=100_000)
+        get_run_count(chunks)    # reads the file
+        generate_report(chunks)  # reads it again
+    """
+    
+    def __init__(self, filename, chunksize, read_options):
+        self.filename = filename
+        self.chunksize = chunksize
+        self.read_options = read_options
+    
+    def __iter__(self):
+        with pd.read_csv(self.filename, chunksize=self.chunksize,
+                         **self.read_options) as reader:
+            for chunk in reader:
+                yield compact_int_columns(chunk)
+
 
+def is_chunked(data):
+    """
+    Check whether data is chunked input rather than a single DataFrame.
+    
+    Example:
+        is_chunked(df) -> False
+        is_chunked(load_sensor_log("log.csv", chunksize=1000)) -> True
+    """
+    return not isinstance(data, pd.DataFrame)
+
+
+def summarize_chunk(df, threshold=LOW_BATTERY_THRESHOLD):
+    """
+    Reduce one DataFrame (or chunk) to a small mergeable summary.
+    
+    Args:
+        df: A pandas DataFrame with sensor data
+        threshold: Battery level for counting low battery runs
+    
+    Returns:
+        A dictionary:
+        {
+            "rows": int,
+            "distance_parts": [float, ...],  # exact sum as float pieces
+            "consumption_sum": int,
+            "consumption_rows": int,   # runs with both battery readings
+            "runs_with_errors": int,
+            "low_battery_runs": int,
+            "error_counts": {errors: count, ...}
+        }
+    
+    Each column is read into a NumPy array once and reduced once; no
+    filtered DataFrames or intermediate Series are built. generate_report()
+    uses this for a whole DataFrame too, so there is one report
+    implementation for both modes.
+    """
+    distance = df["distance"].to_numpy()
+    battery_start, start_known = _int_values(df["battery_start"])
+    battery_end, end_known = _int_values(df["battery_end"])
+    errors, _ = _int_values(df["errors"])  # a missing count is not an error
+
+    low_battery = battery_end < threshold
+    if end_known is not None:
+        low_battery &= end_known
+
+    if start_known is not None or end_known is not None:
+        # Only runs with both battery readings count towards consumption
+        known = np.ones(len(distance), dtype=bool)
+        for column_known in (start_known, end_known):
+            if column_known is not None:
+                known &= column_known
+        battery_start = battery_start[known]
+        battery_end = battery_end[known]
+
+    distance_sum = math.fsum(distance)
+    # Whatever fsum had to round away, so merged sums stay exact
+    distance_rest = math.fsum(itertools.chain(distance, (-distance_sum,)))
+    return {
+        "rows": len(distance),
+        "distance_parts": [distance_sum, distance_rest],
+        "consumption_sum": (
+            int(battery_start.sum(dtype=np.int64)) - int(battery_end.sum(dtype=np.int64))
+        ),
+        "consumption_rows": len(battery_start),
+        "runs_with_errors": int(np.count_nonzero(errors > 0)),
+        "low_battery_runs": int(np.count_nonzero(low_battery)),
+        "error_counts": _count_errors(df),
+    }
+
+
+def merge_summaries(first, second):
+    """
+    Combine two summaries from summarize_chunk() into one.
+    
+    Example:
+        merge_summaries(summarize_chunk(part1), summarize_chunk(part2))
+        # same as summarize_chunk(pd.concat([part1, part2]))
+    """
+    error_counts = dict(first["error_counts"])
+    for errors, count in second["error_counts"].items():
+        error_counts[errors] = error_counts.get(errors, 0) + count
+
+    return {
+        "rows": first["rows"] + second["rows"],
+        "distance_parts": first["distance_parts"] + second["distance_parts"],
+        "consumption_sum": first["consumption_sum"] + second["consumption_sum"],
+        "consumption_rows": first["consumption_rows"] + second["consumption_rows"],
+        "runs_with_errors": first["runs_with_errors"] + second["runs_with_errors"],
+        "low_battery_runs": first["low_battery_runs"] + second["low_battery_runs"],
+        "error_counts": dict(sorted(error_counts.items())),
+    }
+
+
+def summarize_chunks(chunks, threshold=LOW_BATTERY_THRESHOLD):
+    """
+    Summarize an iterator of DataFrames in a single pass.
+    
+    Args:
+        chunks: Iterable of DataFrames (e.g. from load_sensor_log with chunksize)
+        threshold: Battery level for counting low battery runs
+    
+    Returns:
+        One merged summary (see summarize_chunk)
+    """
+    summary = None
+    for chunk in _iter_chunks(chunks):
+        part = summarize_chunk(chunk, threshold)
+        summary = part if summary is None else merge_summaries(summary, part)
+        # Keep the list of float pieces short on long files
+        summary["distance_parts"] = _compact_parts(summary["distance_parts"])
+    if summary is None:
+        summary = summarize_chunk(
+            pd.DataFrame(columns=["distance", "battery_start", "battery_end", "errors"]),
+            threshold,
+        )
+    return summary
+
+
+def report_from_summary(summary):
+    """
+    Build the generate_report() dictionary from a summary.
+    
+    Args:
+        summary: A summary from summarize_chunk / summarize_chunks
+    
+    Returns:
+        The same dictionary generate_report() returns
+    """
+    rows = summary["rows"]
+    consumption_rows = summary["consumption_rows"]
+    return {
+        "total_runs": rows,
+        "total_distance": _total_distance(summary),
+        "average_distance": _average_distance(summary),
+        "runs_with_errors": summary["runs_with_errors"],
+        "low_battery_runs": summary["low_battery_runs"],
+        "average_battery_consumption": (
+            round(summary["consumption_sum"] / consumption_rows, 2)
+            if consumption_rows else 0.0
+        ),
+    }
+
+
+def _total_distance(summary):
+    """Total distance of a summary."""
+    return math.fsum(summary["distance_parts"])
+
+
+def _average_distance(summary):
+    """Average distance of a summary, rounded to 2 decimal places."""
+    if summary["rows"] == 0:
+        return 0.0
+    return round(_total_distance(summary) / summary["rows"], 2)
+
+
+def _compact_parts(parts):
+    """Shrink a list of float pieces to two that add up to the same value."""
+    if len(parts) <= 2:
+        return parts
+    total = math.fsum(parts)
+    return [total, math.fsum([*parts, -total])]
+
+
+def _count_errors(df):
+    """Count runs by number of errors as a plain {errors: count} dict."""
+    counts = df["errors"].value_counts().sort_index()
+    return {int(errors): int(count) for errors, count in counts.items()}
+
+
+def _int_values(series):
+    """
+    An integer column as a NumPy array plus a mask of known values.
+    
+    The mask is None when nothing is missing; otherwise missing values
+    are 0 in the array and False in the mask.
+    """
+    if series.hasnans:
+        return series.to_numpy(dtype=np.int64, na_value=0), series.notna().to_numpy()
+    return series.to_numpy(), None
+
+
+def _iter_chunks(chunks):
+    """
+    Iterate over chunks, refusing a one-shot iterator that was already read.
+    
+    Reading a used-up iterator again would silently give an all-zero
+    report. A chunk reader always yields at least one (maybe empty)
+    chunk, so getting nothing at all from an iterator means it was used up.
+    """
+    found = False
+    for chunk in chunks:
+        found = True
+        yield chunk
+    if not found and iter(chunks) is chunks:
+        raise ValueError(
+            "chunk iterator was already read; load the log again "
+            "(a SensorLogChunks from load_sensor_log can be read many times)"
+        )
+
+
+def _concat_chunks(parts):
+    """Join filtered chunks back into one DataFrame or Series."""
+    parts = list(parts)
+    if not parts:
+        return pd.DataFrame()
+    return pd.concat(parts)
+
+
+# ============================================================
+# COLUMNAR CACHE
+# ============================================================
+
+def get_cache_dir(filename):
+    """
+    Get the path of the cache folder for a CSV file.
+    
+    Example:
+        get_cache_dir("sensor_log.csv") -> "sensor_log.csv.cache"
+    """
+    return filename + CACHE_SUFFIX
+
+
+def load_cached_sensor_log(filename, columns=None):
+    """
+    Load a sensor log through its columnar cache.
+    
+    Args:
+        filename: Path to the CSV file
+        columns: Optional list of columns to load
+    
+    Returns:
+        A typed pandas DataFrame
+    
+    The cache holds every column, so one cache serves any column choice.
+    It is rebuilt from the CSV when the CSV's modification time or size
+    no longer match the ones saved with the cache.
+    
+    Raises:
+        FileNotFoundError if the CSV doesn't exist
+    """
+    csv_stat = os.stat(filename)
+    cache_dir = get_cache_dir(filename)
+    meta = _read_cache_meta(cache_dir)
+
+    if (meta is None
+            or meta["mtime_ns"] != csv_stat.st_mtime_ns
+            or meta["size"] != csv_stat.st_size):
+        df = compact_int_columns(pd.read_csv(filename, **_read_options(filename, None)))
+        _write_cache(cache_dir, df, csv_stat)
+        return df if columns is None else df[list(columns)]
+
+    if meta["format"] == "parquet":
+        return compact_int_columns(pd.read_parquet(
+            os.path.join(cache_dir, CACHE_PARQUET_FILE),
+            columns=None if columns is None else list(columns),
+        ))
+
+    wanted = meta["columns"] if columns is None else list(columns)
+    return pd.DataFrame({
+        name: _load_npy_column(cache_dir, meta["columns"].index(name), meta["kinds"][name])
+        for name in wanted
+    })
+
+
+def compact_int_columns(df):
+    """
+    Turn nullable integer columns without missing values into plain NumPy ones.
+    
+    Columns that do have blanks stay nullable. Returns df (changed in place).
+    
+    Example:
+        # "errors" loaded as Int16 with no blanks
+        compact_int_columns(df)["errors"].dtype -> int16
+    """
+    for name in df.columns:
+        dtype = df[name].dtype
+        if (isinstance(dtype, pd.api.extensions.ExtensionDtype)
+                and pd.api.types.is_integer_dtype(dtype)
+                and not df[name].hasnans):
+            df[name] = df[name].astype(dtype.numpy_dtype)
+    return df
+
+
+def clear_sensor_log_cache(filename):
+    """Delete the cache folder for a CSV file if it exists."""
+    shutil.rmtree(get_cache_dir(filename), ignore_errors=True)
+
+
+def _read_options(filename, columns):
+    """
+    Build the pd.read_csv keyword arguments for typed, pruned loading.
+    
+    Without a column list only the header is read, so that date parsing is
+    asked for just the date columns the file really has (pandas raises for
+    missing ones).
+    """
+    options = {"dtype": SENSOR_DTYPES}
+    if columns is None:
+        present = pd.read_csv(filename, nrows=0).columns
+    else:
+        present = columns
+        options["usecols"] = list(columns)
+        options["dtype"] = {
+            name: dtype for name, dtype in SENSOR_DTYPES.items() if name in columns
+        }
+    options["parse_dates"] = [name for name in DATE_COLUMNS if name in present]
+    return options
+
+
+def _read_cache_meta(cache_dir):
+    """Return the saved cache metadata, or None if there is no usable cache."""
+    try:
+        with open(os.path.join(cache_dir, CACHE_META_FILE), "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_cache(cache_dir, df, csv_stat):
+    """Save df into cache_dir, writing meta.json last so it marks a full cache."""
+    shutil.rmtree(cache_dir, ignore_errors=True)
+    os.makedirs(cache_dir)
+
+    meta = {
+        "mtime_ns": csv_stat.st_mtime_ns,
+        "size": csv_stat.st_size,
+        "columns": list(df.columns),
+    }
+    if importlib.util.find_spec("pyarrow") is not None:
+        df.to_parquet(os.path.join(cache_dir, CACHE_PARQUET_FILE), index=False)
+        meta["format"] = "parquet"
+    else:
+        meta["kinds"] = {
+            name: _save_npy_column(cache_dir, i, df[name])
+            for i, name in enumerate(df.columns)
+        }
+        meta["format"] = "npy"
+
+    with open(os.path.join(cache_dir, CACHE_META_FILE), "w") as f:
+        json.dump(meta, f)
+
+
+def _save_npy_column(cache_dir, position, series):
+    """Save one column as .npy file(s) and return how it was stored."""
+    path = os.path.join(cache_dir, f"column_{position}")
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        np.save(path + "_codes.npy", series.cat.codes.to_numpy())
+        np.save(path + "_categories.npy", series.cat.categories.to_numpy(dtype=str))
+        return "category"
+    if series.dtype == object or pd.api.types.is_string_dtype(series.dtype):
+        np.save(path + ".npy", series.to_numpy(dtype=str))
+        return "string"
+    if pd.api.types.is_integer_dtype(series.dtype) and series.hasnans:
+        numpy_dtype = series.dtype.numpy_dtype
+        np.save(path + ".npy", series.to_numpy(dtype=numpy_dtype, na_value=0))
+        np.save(path + "_missing.npy", series.isna().to_numpy())
+        return "nullable"
+    np.save(path + ".npy", series.to_numpy())
+    return "values"
+
+
+def _load_npy_column(cache_dir, position, kind):
+    """Load one column saved by _save_npy_column."""
+    path = os.path.join(cache_dir, f"column_{position}")
+    if kind == "category":
+        codes = np.load(path + "_codes.npy")
+        categories = np.load(path + "_categories.npy")
+        return pd.Categorical.from_codes(codes, categories)
+    if kind == "string":
+        return np.load(path + ".npy").astype(object)
+    if kind == "nullable":
+        return pd.arrays.IntegerArray(np.load(path + ".npy"), np.load(path + "_missing.npy"))
+    return np.load(path + ".npy")
@@ -17,10 +17,16 @@ from project import (
     get_total_distance,
     get_low_battery_runs,
     get_battery_consumption,
+    get_average_battery_consumption,
     get_error_summary,
     get_runs_with_errors,
     generate_report,
+    summarize_chunk,
+    merge_summaries,
+    get_cache_dir,
+    clear_sensor_log_cache,
 )
+from benchmarks import generate_report_per_metric
 
 
 TEST_CSV_FILE = "test_sensor_log.csv"
@@ -40,9 +46,10 @@ R005,2024-01-16 11:00,180.5,90,40,0
 
 
 def cleanup_test_file():
-    """Remove test file if it exists."""
+    """Remove test file (and its cache) if it exists."""
     if os.path.exists(TEST_CSV_FILE):
         os.remove(TEST_CSV_FILE)
+    clear_sensor_log_cache(TEST_CSV_FILE)
 
 
 # ============================================================
@@ -221,6 +228,186 @@ def test_report_runs_with_errors():
     print("✅ Test 14 passed: Report error runs")
 
 
+# ============================================================
+# CHUNKED MODE TESTS
+# ============================================================
+
+def test_chunked_report_matches():
+    """Test: Chunked report matches in-memory report"""
+    create_test_csv()
+    expected = generate_report(load_sensor_log(TEST_CSV_FILE))
+    report = generate_report(load_sensor_log(TEST_CSV_FILE, chunksize=2))
+    assert report == expected, f"❌ Expected {expected}, got {report}"
+    cleanup_test_file()
+    print("✅ Test 15 passed: Chunked report")
+
+
+def test_chunked_metrics_match():
+    """Test: Chunked metrics match in-memory metrics"""
+    create_test_csv()
+    df = load_sensor_log(TEST_CSV_FILE)
+
+    def chunks():
+        return load_sensor_log(TEST_CSV_FILE, chunksize=2)
+
+    assert get_average_distance(chunks()) == get_average_distance(df), \
+        f"❌ Chunked average distance differs"
+    assert get_total_distance(chunks()) == get_total_distance(df), \
+        f"❌ Chunked total distance differs"
+    assert get_error_summary(chunks()) == get_error_summary(df), \
+        f"❌ Chunked error summary differs"
+    assert list(get_battery_consumption(chunks())) == list(get_battery_consumption(df)), \
+        f"❌ Chunked battery consumption differs"
+    cleanup_test_file()
+    print("✅ Test 16 passed: Chunked metrics")
+
+
+def test_merge_summaries():
+    """Test: Merging summaries equals summarizing everything"""
+    create_test_csv()
+    df = load_sensor_log(TEST_CSV_FILE)
+    merged = merge_summaries(summarize_chunk(df.iloc[:3]), summarize_chunk(df.iloc[3:]))
+    whole = summarize_chunk(df)
+    assert merged["rows"] == whole["rows"], f"❌ Row counts differ"
+    assert merged["error_counts"] == whole["error_counts"], f"❌ Error counts differ"
+    cleanup_test_file()
+    print("✅ Test 17 passed: Merge summaries")
+
+
+# ============================================================
+# TYPED LOADING & CACHE TESTS
+# ============================================================
+
+def test_typed_load():
+    """Test: Columns load with explicit types"""
+    create_test_csv()
+    df = load_sensor_log(TEST_CSV_FILE)
+    assert str(df["run_id"].dtype) == "category", f"❌ run_id should be category"
+    assert str(df["errors"].dtype) == "int16", f"❌ errors should be int16"
+    assert pd.api.types.is_datetime64_any_dtype(df["timestamp"]), \
+        f"❌ timestamp should be parsed as datetime"
+    cleanup_test_file()
+    print("✅ Test 18 passed: Typed load")
+
+
+def test_report_column_pruning():
+    """Test: Loading for a report reads only its columns"""
+    create_test_csv()
+    df = load_sensor_log(TEST_CSV_FILE, report="error_summary")
+    assert get_column_names(df) == ["errors"], f"❌ Only 'errors' should be loaded"
+    assert get_error_summary(df)[0] == 3, f"❌ Expected 3 runs with 0 errors"
+    cleanup_test_file()
+    print("✅ Test 19 passed: Column pruning")
+
+
+def test_cache_reused_and_invalidated():
+    """Test: Cache matches the CSV and is rebuilt when the CSV changes"""
+    create_test_csv()
+    df = load_sensor_log(TEST_CSV_FILE)
+    first = load_sensor_log(TEST_CSV_FILE, cache=True)
+    assert os.path.isdir(get_cache_dir(TEST_CSV_FILE)), f"❌ Cache should be created"
+    cached = load_sensor_log(TEST_CSV_FILE, cache=True)
+    assert cached.equals(df) and first.equals(df), f"❌ Cached data should match CSV"
+    pruned = load_sensor_log(TEST_CSV_FILE, report="average_distance", cache=True)
+    assert get_column_names(pruned) == ["distance"], f"❌ Cache should prune columns"
+
+    with open(TEST_CSV_FILE, 'a') as f:
+        f.write("R006,2024-01-17 09:00,99.5,100,10,3\n")
+    updated = load_sensor_log(TEST_CSV_FILE, cache=True)
+    assert get_run_count(updated) == 6, f"❌ Cache should be rebuilt after CSV change"
+    cleanup_test_file()
+    print("✅ Test 20 passed: Columnar cache")
+
+
+# ============================================================
+# FUSED REPORT TESTS
+# ============================================================
+
+def test_fused_report_matches_per_metric():
+    """Test: Fused report matches the per-metric report"""
+    create_test_csv()
+    df = load_sensor_log(TEST_CSV_FILE)
+    expected = generate_report_per_metric(df)
+    report = generate_report(df)
+    assert report == expected, f"❌ Expected {expected}, got {report}"
+    empty = generate_report(df.iloc[:0])
+    assert empty["total_runs"] == 0, f"❌ Empty report should have 0 runs"
+    cleanup_test_file()
+    print("✅ Test 21 passed: Fused report")
+
+
+# ============================================================
+# REUSING CHUNKS TESTS
+# ============================================================
+
+def test_chunks_can_be_reused():
+    """Test: Chunked logs can be read by several functions"""
+    create_test_csv()
+    expected = generate_report(load_sensor_log(TEST_CSV_FILE))
+    chunks = load_sensor_log(TEST_CSV_FILE, chunksize=2)
+    assert get_run_count(chunks) == 5, f"❌ Expected 5 runs"
+    report = generate_report(chunks)
+    assert report == expected, f"❌ Second use should give {expected}, got {report}"
+    average = get_average_battery_consumption(chunks)
+    assert average == expected["average_battery_consumption"], \
+        f"❌ Expected average consumption {expected['average_battery_consumption']}, got {average}"
+
+    reader = pd.read_csv(TEST_CSV_FILE, chunksize=2)
+    get_run_count(reader)
+    try:
+        generate_report(reader)
+        assert False, f"❌ A used-up chunk reader should raise ValueError"
+    except ValueError:
+        pass
+    cleanup_test_file()
+    print("✅ Test 22 passed: Reusing chunks")
+
+
+# ============================================================
+# BLANK CELL TESTS
+# ============================================================
+
+def test_blank_cells_load_as_missing():
+    """Test: Blank battery/errors cells load as missing values"""
+    create_test_csv()
+    with open(TEST_CSV_FILE, 'a') as f:
+        f.write("R006,2024-01-17 09:00,99.5,,10,\n")
+    df = load_sensor_log(TEST_CSV_FILE)
+    assert df is not None, f"❌ A CSV with blank cells should still load"
+    assert str(df["errors"].dtype) == "Int16", f"❌ errors with blanks should be Int16"
+    assert df["errors"].isna().sum() == 1, f"❌ The blank errors cell should be missing"
+
+    expected = generate_report_per_metric(df)
+    assert expected["total_runs"] == 6, f"❌ Expected 6 runs"
+    assert expected["average_battery_consumption"] == 45.0, \
+        f"❌ Runs without a start reading shouldn't count towards consumption"
+    for name, report in [
+        ("fused", generate_report(df)),
+        ("chunked", generate_report(load_sensor_log(TEST_CSV_FILE, chunksize=4))),
+        ("cached", generate_report(load_sensor_log(TEST_CSV_FILE, cache=True))),
+    ]:
+        assert report == expected, f"❌ {name} report {report} should match {expected}"
+    cached = load_sensor_log(TEST_CSV_FILE, cache=True)
+    assert cached.equals(df), f"❌ Cached data with blanks should match the CSV"
+    cleanup_test_file()
+    print("✅ Test 23 passed: Blank cells")
+
+
+def test_load_without_timestamp_column():
+    """Test: A CSV without a timestamp column still loads"""
+    with open(TEST_CSV_FILE, 'w') as f:
+        f.write("run_id,distance,battery_start,battery_end,errors\n")
+        f.write("R001,150.5,100,75,0\nR002,200.2,100,45,1\n")
+    df = load_sensor_log(TEST_CSV_FILE)
+    assert df is not None and get_run_count(df) == 2, f"❌ Expected 2 runs to load"
+    assert get_run_count(load_sensor_log(TEST_CSV_FILE, chunksize=1)) == 2, \
+        f"❌ Chunked load should work without a timestamp column"
+    assert load_sensor_log(TEST_CSV_FILE, cache=True).equals(df), \
+        f"❌ Cached load should work without a timestamp column"
+    cleanup_test_file()
+    print("✅ Test 24 passed: No timestamp column")
+
+
 def run_all_tests():
     """Run all tests and show results."""
     print("=" * 50)
@@ -243,6 +430,16 @@ def run_all_tests():
         test_report_total_runs,
         test_report_total_distance,
         test_report_runs_with_errors,
+        test_chunked_report_matches,
+        test_chunked_metrics_match,
+        test_merge_summaries,
+        test_typed_load,
+        test_report_column_pruning,
+        test_cache_reused_and_invalidated,
+        test_fused_report_matches_per_metric,
+        test_chunks_can_be_reused,
+        test_blank_cells_load_as_missing,
+        test_load_without_timestamp_column,
     ]
     
     passed = 0
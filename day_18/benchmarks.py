@@ -0,0 +1,424 @@
+"""
+⏱️ Benchmarks for Pathfinding on a Grid
+
+Compares the planners on random, maze and open maps.
+
+Usage:
+    python benchmarks.py
+"""
+
+import os
+import random
+import time
+from project import (
+    create_grid,
+    add_obstacle,
+    find_path_bfs,
+    find_path_astar,
+    find_path_jps,
+    PathOracle,
+    IncrementalPlanner,
+    multi_source_bfs,
+    bfs_distances,
+    plan_paths,
+    visualize_grid,
+    find_paths_cooperative,
+    HierarchicalPlanner,
+)
+
+
+MAP_SIZE = 301
+
+
+# ============================================================
+# MAP GENERATORS
+# ============================================================
+
+def make_random_map(size=MAP_SIZE, density=0.25, seed=0):
+    """Grid with a random scattering of obstacles (corners kept open)."""
+    rng = random.Random(seed)
+    grid = create_grid(size, size)
+    for y in range(size):
+        for x in range(size):
+            if rng.random() < density:
+                add_obstacle(grid, x, y)
+    grid[0][0] = 0
+    grid[size - 1][size - 1] = 0
+    return grid
+
+
+def make_maze_map(size=MAP_SIZE, seed=0):
+    """Perfect maze carved by a randomized depth-first search."""
+    rng = random.Random(seed)
+    grid = create_grid(size, size, fill=1)
+    grid[0][0] = 0
+    stack = [(0, 0)]
+    while stack:
+        x, y = stack[-1]
+        options = [
+            (x + dx, y + dy, dx, dy)
+            for dx, dy in ((2, 0), (-2, 0), (0, 2), (0, -2))
+            if 0 <= x + dx < size and 0 <= y + dy < size and grid[y + dy][x + dx] == 1
+        ]
+        if not options:
+            stack.pop()
+            continue
+        nx, ny, dx, dy = rng.choice(options)
+        grid[y + dy // 2][x + dx // 2] = 0
+        grid[ny][nx] = 0
+        stack.append((nx, ny))
+    return grid
+
+
+def make_open_map(size=MAP_SIZE, walls=8, seed=0):
+    """Mostly empty grid with a few long walls."""
+    rng = random.Random(seed)
+    grid = create_grid(size, size)
+    for _ in range(walls):
+        y = rng.randrange(1, size - 1)
+        start = rng.randrange(0, size // 2)
+        for x in range(start, start + size // 3):
+            add_obstacle(grid, x, y)
+    return grid
+
+
+BENCH_MAPS = {
+    "random": make_random_map,
+    "maze": make_maze_map,
+    "open": make_open_map,
+}
+
+
+# ============================================================
+# BENCHMARKS
+# ============================================================
+
+def time_planner(planner, grid, start, goal):
+    """Run one planner and return (path length, nodes expanded, seconds)."""
+    stats = {}
+    begin = time.perf_counter()
+    path = planner(grid, start, goal, stats=stats)
+    return len(path), stats.get("expanded", 0), time.perf_counter() - begin
+
+
+def bench_planners():
+    """Compare BFS, A* and JPS from corner to corner on every map."""
+    planners = {
+        "bfs": find_path_bfs,
+        "astar": find_path_astar,
+        "jps": find_path_jps,
+    }
+    print(f"{'map':<8} {'planner':<8} {'length':>8} {'expanded':>10} {'time':>10}")
+    for map_name, make_map in BENCH_MAPS.items():
+        grid = make_map()
+        start, goal = (0, 0), (len(grid[0]) - 1, len(grid) - 1)
+        lengths = set()
+        for name, planner in planners.items():
+            length, expanded, seconds = time_planner(planner, grid, start, goal)
+            lengths.add(length)
+            print(f"{map_name:<8} {name:<8} {length:>8} {expanded:>10} {seconds:>9.4f}s")
+        assert len(lengths) == 1, f"Planners disagree on {map_name}: {lengths}"
+
+
+def bench_bidirectional(size=1001, queries=5, seed=1):
+    """Compare one-sided and bidirectional BFS on a large random map."""
+    grid = make_random_map(size=size, density=0.2, seed=seed)
+    rng = random.Random(seed)
+    print(f"{'query':<28} {'bfs cells':>10} {'bidir cells':>12} {'bfs':>9} {'bidir':>9}")
+    for _ in range(queries):
+        start = (rng.randrange(size), rng.randrange(size))
+        goal = (rng.randrange(size), rng.randrange(size))
+        grid[start[1]][start[0]] = 0
+        grid[goal[1]][goal[0]] = 0
+        one_stats, two_stats = {}, {}
+        begin = time.perf_counter()
+        one = find_path_bfs(grid, start, goal, stats=one_stats)
+        middle = time.perf_counter()
+        two = find_path_bfs(grid, start, goal, stats=two_stats, bidirectional=True)
+        end = time.perf_counter()
+        assert len(one) == len(two), "Bidirectional BFS found a different length"
+        print(f"{str(start) + ' -> ' + str(goal):<28} {one_stats['expanded']:>10} "
+              f"{two_stats['expanded']:>12} {middle - begin:>8.3f}s {end - middle:>8.3f}s")
+
+
+def bench_oracle(queries=200, distinct=50, seed=2):
+    """Repeated queries on one maze: plain BFS vs PathOracle."""
+    grid = make_maze_map()
+    size = len(grid)
+    rng = random.Random(seed)
+    open_cells = [(x, y) for y in range(size) for x in range(size) if grid[y][x] == 0]
+    pairs = [(rng.choice(open_cells), rng.choice(open_cells)) for _ in range(distinct)]
+    workload = [rng.choice(pairs) for _ in range(queries)]
+
+    begin = time.perf_counter()
+    for start, goal in workload:
+        find_path_bfs(grid, start, goal)
+    bfs_time = time.perf_counter() - begin
+
+    oracle = PathOracle(grid)
+    begin = time.perf_counter()
+    oracle.refresh()
+    setup_time = time.perf_counter() - begin
+    begin = time.perf_counter()
+    for start, goal in workload:
+        oracle.find_path(start, goal)
+    oracle_time = time.perf_counter() - begin
+
+    print(f"{queries} queries ({distinct} distinct) on a {size}x{size} maze")
+    print(f"  find_path_bfs: {bfs_time:.3f}s")
+    print(f"  PathOracle:    {oracle_time:.3f}s "
+          f"(+ {setup_time:.3f}s precompute, {oracle.cache_hits} cache hits)")
+
+
+def bench_incremental(changes=30, seed=1):
+    """Block one cell of the current path at a time: full replan vs repair."""
+    grid = make_random_map(density=0.2, seed=seed)
+    size = len(grid)
+    start, goal = (0, 0), (size - 1, size - 1)
+    rng = random.Random(seed)
+    planner = IncrementalPlanner(grid, start, goal)
+    path = planner.find_path()
+
+    replan_time = repair_time = 0.0
+    replan_expanded = repair_expanded = 0
+    for _ in range(changes):
+        if len(path) < 3:
+            break
+        add_obstacle(grid, *rng.choice(path[1:-1]))
+
+        stats = {}
+        begin = time.perf_counter()
+        find_path_astar(grid, start, goal, stats)
+        replan_time += time.perf_counter() - begin
+        replan_expanded += stats["expanded"]
+
+        stats = {}
+        begin = time.perf_counter()
+        path = planner.find_path(stats)
+        repair_time += time.perf_counter() - begin
+        repair_expanded += stats["expanded"]
+    planner.close()
+
+    print(f"{changes} single-cell changes on a {size}x{size} map")
+    print(f"  find_path_astar replan: {replan_time:.3f}s, {replan_expanded} expanded")
+    print(f"  IncrementalPlanner:     {repair_time:.3f}s, {repair_expanded} expanded")
+
+
+def bench_multi_source(sources=20, big_size=2001, big_sources=500, seed=4):
+    """One BFS per charging station vs one multi-source sweep."""
+    grid = make_random_map(seed=seed)
+    size = len(grid)
+    rng = random.Random(seed)
+    open_cells = [(x, y) for y in range(size) for x in range(size) if grid[y][x] == 0]
+    stations = rng.sample(open_cells, sources)
+
+    begin = time.perf_counter()
+    for x, y in stations:
+        bfs_distances(grid, grid.cell_id(x, y))
+    single_time = time.perf_counter() - begin
+
+    begin = time.perf_counter()
+    multi_source_bfs(grid, stations)
+    multi_time = time.perf_counter() - begin
+
+    print(f"{sources} stations on a {size}x{size} map")
+    print(f"  bfs_distances per station: {single_time:.3f}s")
+    print(f"  multi_source_bfs:          {multi_time:.3f}s")
+
+    grid = make_random_map(size=big_size, seed=seed)
+    stations = [(rng.randrange(big_size), rng.randrange(big_size))
+                for _ in range(big_sources)]
+    begin = time.perf_counter()
+    multi_source_bfs(grid, stations)
+    print(f"  {big_sources} stations on {big_size}x{big_size}: "
+          f"{time.perf_counter() - begin:.3f}s")
+
+
+def bench_plan_paths(requests=200, seed=5):
+    """A fleet's worth of BFS queries: one by one vs plan_paths()."""
+    grid = make_maze_map()
+    size = len(grid)
+    rng = random.Random(seed)
+    open_cells = [(x, y) for y in range(size) for x in range(size) if grid[y][x] == 0]
+    batch = [(rng.choice(open_cells), rng.choice(open_cells)) for _ in range(requests)]
+    workers = os.cpu_count() or 1
+
+    begin = time.perf_counter()
+    for start, goal in batch:
+        find_path_bfs(grid, start, goal)
+    serial_time = time.perf_counter() - begin
+
+    begin = time.perf_counter()
+    plan_paths(grid, batch, workers=workers)
+    pool_time = time.perf_counter() - begin
+
+    print(f"{requests} requests on a {size}x{size} maze, {workers} workers")
+    print(f"  serial find_path_bfs: {serial_time:.3f}s")
+    print(f"  plan_paths:           {pool_time:.3f}s "
+          f"({serial_time / pool_time:.1f}x)")
+
+
+def visualize_grid_per_cell(grid, path=None, start=None, goal=None):
+    """The old visualize_grid: a comparison chain and a path list scan per cell."""
+    path = path or []
+    lines = []
+    for y, row in enumerate(grid):
+        symbols = []
+        for x, value in enumerate(row):
+            if (x, y) == start:
+                symbols.append("S")
+            elif (x, y) == goal:
+                symbols.append("G")
+            elif value == 1:
+                symbols.append("#")
+            elif (x, y) in path:
+                symbols.append("*")
+            else:
+                symbols.append(".")
+        lines.append(" ".join(symbols))
+    return "\n".join(lines)
+
+
+def bench_visualize(size=401, stream_size=4001):
+    """
+    Render a map with a long path; then stream a bigger one to /dev/null.
+    
+    The per-cell baseline scans the whole path for every cell, so the
+    rendered map is kept small enough for it to finish.
+    """
+    grid = make_random_map(size=size, density=0.2, seed=1)
+    start, goal = (0, 0), (size - 1, size - 1)
+    path = find_path_bfs(grid, start, goal)
+
+    begin = time.perf_counter()
+    visualize_grid_per_cell(grid, path, start, goal)
+    per_cell_time = time.perf_counter() - begin
+
+    begin = time.perf_counter()
+    visualize_grid(grid, path, start, goal)
+    table_time = time.perf_counter() - begin
+
+    print(f"Render a {size}x{size} map with a {len(path)}-cell path")
+    print(f"  per cell:          {per_cell_time:.3f}s")
+    print(f"  translation table: {table_time:.3f}s")
+
+    grid = create_grid(stream_size, stream_size)
+    begin = time.perf_counter()
+    with open(os.devnull, "w") as out:
+        visualize_grid(grid, out=out)
+    print(f"  stream {stream_size}x{stream_size}:   {time.perf_counter() - begin:.3f}s")
+
+
+def count_collisions(paths):
+    """Number of (timestep, cell) slots shared by more than one robot."""
+    slots = {}
+    for path in paths:
+        for t, cell in enumerate(path):
+            slots[t, cell] = slots.get((t, cell), 0) + 1
+    return sum(1 for robots in slots.values() if robots > 1)
+
+
+def bench_cooperative(robots=500, size=1000, radius=30, seed=6):
+    """A fleet with short trips: independent A* vs cooperative planning."""
+    grid = make_random_map(size=size, density=0.1, seed=seed)
+    rng = random.Random(seed)
+    starts, goals = set(), set()
+    while len(starts) < robots:
+        x, y = rng.randrange(size), rng.randrange(size)
+        if grid[y][x] == 0:
+            starts.add((x, y))
+    requests = []
+    for x, y in sorted(starts):
+        while True:
+            goal = (x + rng.randint(-radius, radius), y + rng.randint(-radius, radius))
+            if goal not in goals and 0 <= goal[0] < size and 0 <= goal[1] < size \
+                    and grid[goal[1]][goal[0]] == 0:
+                break
+        goals.add(goal)
+        requests.append(((x, y), goal))
+
+    begin = time.perf_counter()
+    independent = [find_path_astar(grid, start, goal) for start, goal in requests]
+    independent_time = time.perf_counter() - begin
+
+    stats = {}
+    begin = time.perf_counter()
+    cooperative = find_paths_cooperative(grid, requests, stats=stats)
+    cooperative_time = time.perf_counter() - begin
+
+    print(f"{robots} robots on a {size}x{size} map, goals within {radius} cells")
+    print(f"  independent A*:  {independent_time:.3f}s, "
+          f"{count_collisions(independent)} collisions")
+    print(f"  cooperative A*:  {cooperative_time:.3f}s, "
+          f"{count_collisions(cooperative)} collisions, "
+          f"{stats['replanned']} robots replanned in space-time")
+
+
+def bench_hierarchical(size=1000, queries=5, seed=7):
+    """Long routes on a big map: A* vs HPA*, plus the cost of one edit."""
+    print(f"{queries} long routes (Manhattan > {size * 9 // 10}) on {size}x{size} maps")
+    for name in ("random", "open"):
+        grid = BENCH_MAPS[name](size=size, seed=seed)
+        rng = random.Random(seed)
+        routes = []
+        while len(routes) < queries:
+            start = (rng.randrange(size), rng.randrange(size))
+            goal = (rng.randrange(size), rng.randrange(size))
+            if grid[start[1]][start[0]] == 0 and grid[goal[1]][goal[0]] == 0 \
+                    and abs(start[0] - goal[0]) + abs(start[1] - goal[1]) > size * 9 // 10:
+                routes.append((start, goal))
+
+        begin = time.perf_counter()
+        planner = HierarchicalPlanner(grid)
+        planner.refresh()
+        build_time = time.perf_counter() - begin
+
+        astar_time = hpa_time = 0.0
+        astar_cells = hpa_cells = 0
+        for start, goal in routes:
+            begin = time.perf_counter()
+            astar_cells += len(find_path_astar(grid, start, goal))
+            astar_time += time.perf_counter() - begin
+            begin = time.perf_counter()
+            hpa_cells += len(planner.find_path(start, goal))
+            hpa_time += time.perf_counter() - begin
+
+        add_obstacle(grid, size // 2, size // 2 + 1)
+        begin = time.perf_counter()
+        planner.refresh()
+        rebuild_time = time.perf_counter() - begin
+        planner.close()
+
+        print(f"  {name:6}  A*: {astar_time:.3f}s   HPA*: {hpa_time:.3f}s "
+              f"({astar_time / hpa_time:.1f}x, paths {hpa_cells / astar_cells - 1:+.1%})")
+        print(f"          build: {build_time:.2f}s   rebuild after one obstacle: "
+              f"{rebuild_time * 1000:.1f}ms")
+
+
+def run_all_benchmarks():
+    """Run all benchmarks and show results."""
+    print("=" * 50)
+    print("⏱️  Pathfinding Benchmarks")
+    print("=" * 50)
+    bench_planners()
+    print()
+    bench_bidirectional()
+    print()
+    bench_oracle()
+    print()
+    bench_incremental()
+    print()
+    bench_multi_source()
+    print()
+    bench_plan_paths()
+    print()
+    bench_visualize()
+    print()
+    bench_cooperative()
+    print()
+    bench_hierarchical()
+    print("=" * 50)
+
+
+if __name__ == "__main__":
+    run_all_benchmarks()
@@ -33,15 +33,206 @@ Grid Representation:
 --------------------
 - 0 = empty cell (can walk)
 - 1 = obstacle (blocked)
-- Grid is a list of lists: grid[y][x]
+- Grid is used like a list of lists: grid[y][x]
+
+create_grid() returns a Grid: one flat bytearray with a byte per cell, so
+a 4096x4096 map takes 16 MB instead of gigabytes of Python lists. Cell
+(x, y) has the integer id y * width + x, and the search functions work on
+these ids internally. grid[y][x] still reads and writes cells, and the
+functions below also accept a plain list of lists.
 
 Coordinates:
 - (0, 0) is top-left
 - x increases going right
 - y increases going down
+
+Faster Planners:
+----------------
+find_path_astar() searches toward the goal using the Manhattan distance,
+and find_path_jps() (Jump Point Search) skips over straight runs of open
+cells. Both return paths of the same length as find_path_bfs(); see
+benchmarks.py for how many cells each one expands.
+
+PathOracle is for answering many queries on the same grid: it labels
+connected components, keeps landmark distance tables to guide A*, and
+caches recent answers until the grid changes.
+
+IncrementalPlanner (D* Lite) keeps its search between calls, so when an
+obstacle is added only the part of the search it affects is redone.
+
+Coverage From Many Sources:
+---------------------------
+multi_source_bfs() floods out from many cells at once (e.g. every
+charging station) and gives each cell its distance to the nearest source
+and which source that is. It is one sweep with NumPy frontier arrays,
+not one count_reachable_cells() call per source.
+
+Planning For A Fleet:
+---------------------
+plan_paths() plans many (start, goal) pairs on one grid across worker
+processes. The grid is put in shared memory once, so it is not pickled
+with every request.
+
+find_paths_cooperative() plans robots that move at the same time. Each
+robot is planned in space and time (it may wait), avoiding the cells
+and moves already reserved by higher-priority robots.
+
+Very Large Maps:
+----------------
+HierarchicalPlanner (HPA*) cuts the grid into square clusters and
+precomputes how the clusters' entrances connect. A long route is first
+found on that small graph of entrances, then filled in cluster by
+cluster. Paths are close to, but not always exactly, the shortest.
 """
 
-from collections import deque
+import heapq
+import os
+from array import array
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+
+EMPTY = 0
+OBSTACLE = 1
+
+# Distance used for "no path" in the incremental planner
+INFINITY = float("inf")
+
+# bytes.translate table: obstacle -> 1, any other value -> 0
+_BLOCKED_TABLE = bytes(1 if value == OBSTACLE else 0 for value in range(256))
+
+# bytes.translate table for visualize_grid: obstacle -> '#', anything else -> '.'
+_SYMBOL_TABLE = bytes(ord("#") if value == OBSTACLE else ord(".") for value in range(256))
+
+
+class Grid:
+    """
+    A 2D grid stored as one flat bytearray (one byte per cell).
+    
+    Cell (x, y) lives at index y * width + x (its "cell id").
+    grid[y] returns a GridRow, so grid[y][x] works like a list of lists.
+    
+    Example:
+        grid = Grid(5, 3)
+        grid[1][2] = OBSTACLE
+        grid.cells[grid.cell_id(2, 1)]  # -> 1
+    """
+    
+    def __init__(self, width, height, fill=EMPTY):
+        """Create a width x height grid with every cell set to fill."""
+        self.width = width
+        self.height = height
+        self.cells = bytearray([fill]) * (width * height)
+        # Goes up on every change made through set_cell / grid[y][x] = ...
+        self.version = 0
+        self._listeners = []
+    
+    @classmethod
+    def from_rows(cls, rows):
+        """Build a Grid from a list of lists (rows[y][x])."""
+        height = len(rows)
+        width = len(rows[0]) if height else 0
+        grid = cls(width, height)
+        for y, row in enumerate(rows):
+            grid.cells[y * width:(y + 1) * width] = bytes(row)
+        return grid
+    
+    def __len__(self):
+        return self.height
+    
+    def __getitem__(self, y):
+        if y < 0:
+            y += self.height
+        if not 0 <= y < self.height:
+            raise IndexError("grid row out of range")
+        return GridRow(self, y)
+    
+    def __iter__(self):
+        for y in range(self.height):
+            yield GridRow(self, y)
+    
+    def in_bounds(self, x, y):
+        """True if (x, y) is inside the grid."""
+        return 0 <= x < self.width and 0 <= y < self.height
+    
+    def cell_id(self, x, y):
+        """Turn (x, y) into a cell id."""
+        return y * self.width + x
+    
+    def cell_xy(self, cell):
+        """Turn a cell id back into (x, y)."""
+        y, x = divmod(cell, self.width)
+        return (x, y)
+    
+    def set_cell(self, x, y, value):
+        """Set the value of cell (x, y), bumping version if it changed."""
+        cell = self.cell_id(x, y)
+        old = self.cells[cell]
+        if old != value:
+            self.cells[cell] = value
+            self.version += 1
+            for listener in self._listeners:
+                listener(cell, old, value)
+    
+    def add_listener(self, listener):
+        """Call listener(cell_id, old_value, new_value) on every change."""
+        self._listeners.append(listener)
+    
+    def remove_listener(self, listener):
+        """Stop calling a listener added with add_listener."""
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+
+class GridRow:
+    """One row of a Grid, indexed by x. Reads and writes go to the grid."""
+    
+    __slots__ = ("grid", "y")
+    
+    def __init__(self, grid, y):
+        self.grid = grid
+        self.y = y
+    
+    def __len__(self):
+        return self.grid.width
+    
+    def __getitem__(self, x):
+        width = self.grid.width
+        if isinstance(x, slice):
+            start = self.y * width
+            return list(self.grid.cells[start:start + width][x])
+        if x < 0:
+            x += width
+        if not 0 <= x < width:
+            raise IndexError("grid column out of range")
+        return self.grid.cells[self.y * width + x]
+    
+    def __setitem__(self, x, value):
+        if x < 0:
+            x += self.grid.width
+        if not 0 <= x < self.grid.width:
+            raise IndexError("grid column out of range")
+        self.grid.set_cell(x, self.y, value)
+    
+    def __iter__(self):
+        start = self.y * self.grid.width
+        return iter(self.grid.cells[start:start + self.grid.width])
+    
+    def __eq__(self, other):
+        return list(self) == list(other)
+    
+    def __repr__(self):
+        return repr(list(self))
+
+
+def as_grid(grid):
+    """Return grid as a Grid, converting a list of lists if needed."""
+    if isinstance(grid, Grid):
+        return grid
+    return Grid.from_rows(grid)
 
 
 def create_grid(width, height, fill=0):
@@ -54,7 +245,7 @@ def create_grid(width, height, fill=0):
         fill: Value to fill cells with (default 0)
     
     Returns:
-        A 2D list (list of lists) representing the grid
+        A Grid that behaves like a 2D list (list of lists)
         Access with grid[y][x]
     
     Example:
@@ -62,8 +253,7 @@ def create_grid(width, height, fill=0):
         # Creates a 5x3 grid of zeros
         # grid[0] is the first row with 5 cells
     """
-    # TODO: Create and return the 2D grid
-    pass
+    return Grid(width, height, fill)
 
 
 def add_obstacle(grid, x, y):
@@ -81,8 +271,8 @@ def add_obstacle(grid, x, y):
     Example:
         add_obstacle(grid, 2, 1)  # Block cell at column 2, row 1
     """
-    # TODO: Set grid[y][x] to 1 (obstacle)
-    pass
+    grid[y][x] = OBSTACLE
+    return grid
 
 
 def is_valid_cell(grid, x, y):
@@ -103,8 +293,11 @@ def is_valid_cell(grid, x, y):
     Example:
         is_valid_cell(grid, 2, 1) -> True/False
     """
-    # TODO: Check bounds and obstacle status
-    pass
+    if isinstance(grid, Grid):
+        return grid.in_bounds(x, y) and grid.cells[y * grid.width + x] != OBSTACLE
+    if not (0 <= y < len(grid) and 0 <= x < len(grid[0])):
+        return False
+    return grid[y][x] != OBSTACLE
 
 
 def get_neighbors(grid, x, y):
@@ -126,11 +319,14 @@ def get_neighbors(grid, x, y):
         get_neighbors(grid, 1, 1)
         might return [(0,1), (2,1), (1,0), (1,2)]
     """
-    # TODO: Check all 4 directions and return valid neighbors
-    pass
+    neighbors = []
+    for nx, ny in ((x - 1, y), (x + 1, y), (x, y - 1), (x, y + 1)):
+        if is_valid_cell(grid, nx, ny):
+            neighbors.append((nx, ny))
+    return neighbors
 
 
-def find_path_bfs(grid, start, goal):
+def find_path_bfs(grid, start, goal, stats=None, bidirectional=False):
     """
     Find the shortest path from start to goal using BFS.
     
@@ -138,6 +334,10 @@ def find_path_bfs(grid, start, goal):
         grid: The 2D grid
         start: Starting position (x, y) tuple
         goal: Goal position (x, y) tuple
+        stats: Optional dict; "expanded" is set to the number of cells
+               taken off the queue
+        bidirectional: If True, search from start and goal at the same
+                       time (see find_path_bidirectional_bfs)
     
     Returns:
         A list of (x, y) tuples representing the path from start to goal
@@ -155,9 +355,54 @@ def find_path_bfs(grid, start, goal):
     Example:
         path = find_path_bfs(grid, (0, 0), (4, 4))
         # Returns [(0,0), (1,0), (2,0), ...] or [] if blocked
+    
+    Cells are handled as integer ids (see Grid) while searching, and
+    only turned back into (x, y) tuples for the returned path.
     """
-    # TODO: Implement BFS pathfinding
-    pass
+    grid = as_grid(grid)
+    if bidirectional:
+        return find_path_bidirectional_bfs(grid, start, goal, stats)
+    if not is_valid_cell(grid, *start) or not is_valid_cell(grid, *goal):
+        return []
+
+    start_id = grid.cell_id(*start)
+    goal_id = grid.cell_id(*goal)
+    width = grid.width
+    size = len(grid.cells)
+    last_column = width - 1
+    seen = blocked_mask(grid)
+    seen[start_id] = 1
+    came_from = {start_id: None}
+    queue = deque([start_id])
+    expanded = 0
+
+    while queue:
+        cell = queue.popleft()
+        expanded += 1
+        if cell == goal_id:
+            _record_expanded(stats, expanded)
+            return [grid.cell_xy(c) for c in reconstruct_cells(came_from, goal_id)]
+        x = cell % width
+        # Left, right, up, down; seen[] is 1 for obstacles and visited cells
+        if x > 0 and not seen[cell - 1]:
+            seen[cell - 1] = 1
+            came_from[cell - 1] = cell
+            queue.append(cell - 1)
+        if x < last_column and not seen[cell + 1]:
+            seen[cell + 1] = 1
+            came_from[cell + 1] = cell
+            queue.append(cell + 1)
+        if cell >= width and not seen[cell - width]:
+            seen[cell - width] = 1
+            came_from[cell - width] = cell
+            queue.append(cell - width)
+        if cell + width < size and not seen[cell + width]:
+            seen[cell + width] = 1
+            came_from[cell + width] = cell
+            queue.append(cell + width)
+
+    _record_expanded(stats, expanded)
+    return []
 
 
 def reconstruct_path(came_from, start, goal):
@@ -177,8 +422,11 @@ def reconstruct_path(came_from, start, goal):
         reconstruct_path(came_from, (0,0), (2,0))
         returns [(0,0), (1,0), (2,0)]
     """
-    # TODO: Walk backwards from goal to start, then reverse
-    pass
+    path = [goal]
+    while path[-1] != start:
+        path.append(came_from[path[-1]])
+    path.reverse()
+    return path
 
 
 def calculate_path_length(path):
@@ -195,11 +443,10 @@ def calculate_path_length(path):
         calculate_path_length([(0,0), (1,0), (2,0)])
         returns 2
     """
-    # TODO: Return the number of steps
-    pass
+    return max(len(path) - 1, 0)
 
 
-def visualize_grid(grid, path=None, start=None, goal=None):
+def visualize_grid(grid, path=None, start=None, goal=None, out=None):
     """
     Create a string visualization of the grid.
     
@@ -208,6 +455,9 @@ def visualize_grid(grid, path=None, start=None, goal=None):
         path: Optional list of path positions to highlight
         start: Optional start position to mark
         goal: Optional goal position to mark
+        out: Optional text file-like object. If given, each row is written
+             to it as soon as it is rendered (followed by a newline) and
+             None is returned, so huge maps never exist as one string.
     
     Returns:
         A multi-line string showing the grid:
@@ -222,8 +472,43 @@ def visualize_grid(grid, path=None, start=None, goal=None):
         . * # . .
         S * * * G
     """
-    # TODO: Build and return the visualization string
-    pass
+    grid = as_grid(grid)
+    width = grid.width
+
+    # Path cells grouped by row, so each row only looks at its own cells
+    path_by_row = {}
+    for x, y in path or ():
+        if 0 <= x < width and 0 <= y < grid.height:
+            path_by_row.setdefault(y, []).append(x)
+
+    marks = {}
+    for position, symbol in ((goal, "G"), (start, "S")):
+        if position is not None and grid.in_bounds(*position):
+            x, y = position
+            marks.setdefault(y, []).append((x, ord(symbol)))
+
+    # Symbols go at even offsets of a space-filled line: "a b c"
+    line = bytearray(b" ") * max(2 * width - 1, 0)
+    lines = []
+    for y in range(grid.height):
+        row = grid.cells[y * width:(y + 1) * width].translate(_SYMBOL_TABLE)
+        if y in path_by_row or y in marks:
+            row = bytearray(row)
+            for x in path_by_row.get(y, ()):
+                if row[x] != ord("#"):
+                    row[x] = ord("*")
+            for x, symbol in marks.get(y, ()):
+                row[x] = symbol
+        line[0::2] = row
+        text = line.decode("ascii")
+        if out is None:
+            lines.append(text)
+        else:
+            out.write(text)
+            out.write("\n")
+    if out is None:
+        return "\n".join(lines)
+    return None
 
 
 def count_reachable_cells(grid, start):
@@ -239,6 +524,1500 @@ def count_reachable_cells(grid, start):
     
     Hint: Use BFS but count visited cells instead of finding path
     """
-    # TODO: Use BFS to count reachable cells
-    pass
+    grid = as_grid(grid)
+    if not is_valid_cell(grid, *start):
+        return 0
+
+    start_id = grid.cell_id(*start)
+    seen = blocked_mask(grid)
+    seen[start_id] = 1
+    count = 1
+    queue = deque([start_id])
+    while queue:
+        cell = queue.popleft()
+        for neighbor in neighbor_ids(grid, cell, seen):
+            seen[neighbor] = 1
+            count += 1
+            queue.append(neighbor)
+    return count
+
+
+# ============================================================
+# CELL ID HELPERS
+# ============================================================
+
+def blocked_mask(grid):
+    """
+    Get a new bytearray with 1 for every obstacle and 0 elsewhere.
+    
+    Searches use it as their "seen" array: marking a cell 1 when it is
+    visited means one check covers both obstacles and visited cells.
+    """
+    return bytearray(grid.cells.translate(_BLOCKED_TABLE))
+
+
+def neighbor_ids(grid, cell, blocked):
+    """
+    Get the open neighbors of a cell id (left, right, up, down).
+    
+    Args:
+        grid: A Grid
+        cell: A cell id
+        blocked: A bytearray like blocked_mask(); cells set to 1 in it
+                 are skipped
+    
+    Returns:
+        A list of neighbor cell ids that are in bounds and not blocked
+    """
+    width = grid.width
+    x = cell % width
+    neighbors = []
+    if x > 0 and not blocked[cell - 1]:
+        neighbors.append(cell - 1)
+    if x < width - 1 and not blocked[cell + 1]:
+        neighbors.append(cell + 1)
+    if cell >= width and not blocked[cell - width]:
+        neighbors.append(cell - width)
+    if cell + width < len(blocked) and not blocked[cell + width]:
+        neighbors.append(cell + width)
+    return neighbors
+
+
+def reconstruct_cells(came_from, goal):
+    """
+    Walk a came_from dict of cell ids back from goal to the start.
+    
+    Args:
+        came_from: Dictionary mapping each cell id to its parent id
+                   (the start maps to None)
+        goal: The cell id to walk back from
+    
+    Returns:
+        List of cell ids from start to goal
+    """
+    path = []
+    cell = goal
+    while cell is not None:
+        path.append(cell)
+        cell = came_from[cell]
+    path.reverse()
+    return path
+
+
+def _record_expanded(stats, expanded):
+    """Store the number of expanded nodes in stats, if a dict was given."""
+    if stats is not None:
+        stats["expanded"] = expanded
+
+
+# ============================================================
+# BIDIRECTIONAL BFS
+# ============================================================
+
+def find_path_bidirectional_bfs(grid, start, goal, stats=None):
+    """
+    Find the shortest path by running BFS from both ends at once.
+    
+    Args:
+        grid: The 2D grid
+        start: Starting position (x, y) tuple
+        goal: Goal position (x, y) tuple
+        stats: Optional dict; "expanded" is set to the number of cells
+               taken off either queue
+    
+    Returns:
+        A shortest path like find_path_bfs(), or [] if none exists
+    
+    Each round expands one whole level of the smaller frontier. When that
+    level touches a cell the other side has reached, the best meeting
+    point in the level is chosen and the two halves are joined with
+    reconstruct_path(). Two searches of depth d/2 touch far fewer cells
+    than one search of depth d on open maps.
+    """
+    grid = as_grid(grid)
+    if not is_valid_cell(grid, *start) or not is_valid_cell(grid, *goal):
+        return []
+
+    start_id = grid.cell_id(*start)
+    goal_id = grid.cell_id(*goal)
+    if start_id == goal_id:
+        _record_expanded(stats, 1)
+        return [start]
+
+    width = grid.width
+    size = len(grid.cells)
+    last_column = width - 1
+    # owner[cell]: 0 = unseen, 1 = obstacle, 2 = reached from start,
+    # 3 = reached from goal
+    owner = blocked_mask(grid)
+    owner[start_id] = 2
+    owner[goal_id] = 3
+    came_from = ({start_id: None}, {goal_id: None})
+    depth = ({start_id: 0}, {goal_id: 0})
+    frontier = ([start_id], [goal_id])
+    expanded = 0
+
+    while frontier[0] and frontier[1]:
+        side = 0 if len(frontier[0]) <= len(frontier[1]) else 1
+        my_mark, other_mark = 2 + side, 3 - side
+        mine, my_depth, other_depth = came_from[side], depth[side], depth[1 - side]
+        best = None
+        next_level = []
+
+        for cell in frontier[side]:
+            expanded += 1
+            next_depth = my_depth[cell] + 1
+            x = cell % width
+            left = cell - 1 if x > 0 else -1
+            right = cell + 1 if x < last_column else -1
+            for neighbor in (left, right, cell - width, cell + width):
+                if neighbor < 0 or neighbor >= size:
+                    continue
+                mark = owner[neighbor]
+                if mark == 0:
+                    owner[neighbor] = my_mark
+                    mine[neighbor] = cell
+                    my_depth[neighbor] = next_depth
+                    next_level.append(neighbor)
+                elif mark == other_mark:
+                    length = next_depth + other_depth[neighbor]
+                    if best is None or length < best[0]:
+                        best = (length, cell, neighbor)
+
+        if best is not None:
+            _, cell, neighbor = best
+            if side == 0:
+                meet_start_side, meet_goal_side = cell, neighbor
+            else:
+                meet_start_side, meet_goal_side = neighbor, cell
+            _record_expanded(stats, expanded)
+            first_half = reconstruct_path(came_from[0], start_id, meet_start_side)
+            second_half = reconstruct_path(came_from[1], goal_id, meet_goal_side)
+            second_half.reverse()
+            return [grid.cell_xy(c) for c in first_half + second_half]
+
+        if side == 0:
+            frontier = (next_level, frontier[1])
+        else:
+            frontier = (frontier[0], next_level)
+
+    _record_expanded(stats, expanded)
+    return []
+
+
+# ============================================================
+# A* AND JUMP POINT SEARCH
+# ============================================================
+
+def manhattan_distance(a, b):
+    """
+    Manhattan (grid) distance between two (x, y) positions.
+    
+    Example:
+        manhattan_distance((0, 0), (3, 4)) -> 7
+    """
+    return abs(a[0] - b[0]) + abs(a[1] - b[1])
+
+
+def find_path_astar(grid, start, goal, stats=None, heuristic=None):
+    """
+    Find the shortest path from start to goal using A*.
+    
+    Args:
+        grid: The 2D grid
+        start: Starting position (x, y) tuple
+        goal: Goal position (x, y) tuple
+        stats: Optional dict; "expanded" is set to the number of cells
+               taken off the open set
+        heuristic: Optional function taking a cell id and returning a
+                   lower bound on its distance to goal (default: Manhattan)
+    
+    Returns:
+        A shortest path like find_path_bfs(), or [] if none exists
+    
+    The open set is a binary heap ordered by f = g + h, where h is the
+    Manhattan distance to the goal. Ties go to the cell closer to the goal,
+    which keeps the search narrow on open maps.
+    """
+    grid = as_grid(grid)
+    if not is_valid_cell(grid, *start) or not is_valid_cell(grid, *goal):
+        return []
+
+    width = grid.width
+    goal_x, goal_y = goal
+    start_id = grid.cell_id(*start)
+    goal_id = grid.cell_id(*goal)
+
+    closed = blocked_mask(grid)
+    g_score = {start_id: 0}
+    came_from = {start_id: None}
+    h = manhattan_distance(start, goal)
+    open_heap = [(h, h, start_id)]
+    expanded = 0
+
+    while open_heap:
+        _, _, cell = heapq.heappop(open_heap)
+        if closed[cell]:
+            continue
+        closed[cell] = 1
+        expanded += 1
+        if cell == goal_id:
+            _record_expanded(stats, expanded)
+            return [grid.cell_xy(c) for c in reconstruct_cells(came_from, goal_id)]
+
+        g = g_score[cell] + 1
+        for neighbor in neighbor_ids(grid, cell, closed):
+            if g < g_score.get(neighbor, g + 1):
+                g_score[neighbor] = g
+                came_from[neighbor] = cell
+                if heuristic is None:
+                    y, x = divmod(neighbor, width)
+                    h = abs(x - goal_x) + abs(y - goal_y)
+                else:
+                    h = heuristic(neighbor)
+                heapq.heappush(open_heap, (g + h, h, neighbor))
+
+    _record_expanded(stats, expanded)
+    return []
+
+
+def find_path_jps(grid, start, goal, stats=None):
+    """
+    Find the shortest path using Jump Point Search on a 4-connected grid.
+    
+    Args:
+        grid: The 2D grid
+        start: Starting position (x, y) tuple
+        goal: Goal position (x, y) tuple
+        stats: Optional dict; "expanded" is set to the number of jump
+               points taken off the open set
+    
+    Returns:
+        A shortest path like find_path_bfs(), or [] if none exists
+    
+    Instead of adding every neighbor to the open set, JPS "jumps" in a
+    straight line and only stops at jump points: the goal, or cells where
+    an obstacle ends beside the line so a new shortest path could turn
+    there. Paths are searched vertical-first, so a vertical jump also
+    stops at any cell from which a horizontal jump finds a jump point.
+    Between jump points the path is a straight line, which is filled back
+    in at the end.
+    """
+    grid = as_grid(grid)
+    if not is_valid_cell(grid, *start) or not is_valid_cell(grid, *goal):
+        return []
+    if start == goal:
+        _record_expanded(stats, 1)
+        return [start]
+
+    width = grid.width
+    height = grid.height
+    blocked = grid.cells.translate(_BLOCKED_TABLE)
+
+    def is_open(x, y):
+        return 0 <= x < width and 0 <= y < height and not blocked[y * width + x]
+
+    def jump_horizontal(x, y, dx):
+        while True:
+            x += dx
+            if not is_open(x, y):
+                return None
+            if (x, y) == goal:
+                return (x, y)
+            # An obstacle just behind us above/below ends here: forced turn
+            if ((is_open(x, y - 1) and not is_open(x - dx, y - 1))
+                    or (is_open(x, y + 1) and not is_open(x - dx, y + 1))):
+                return (x, y)
+
+    def jump_vertical(x, y, dy):
+        while True:
+            y += dy
+            if not is_open(x, y):
+                return None
+            if (x, y) == goal:
+                return (x, y)
+            if ((is_open(x - 1, y) and not is_open(x - 1, y - dy))
+                    or (is_open(x + 1, y) and not is_open(x + 1, y - dy))):
+                return (x, y)
+            if jump_horizontal(x, y, -1) or jump_horizontal(x, y, 1):
+                return (x, y)
+
+    def directions(node, parent):
+        if parent is None:
+            return ((-1, 0), (1, 0), (0, -1), (0, 1))
+        x, y = node
+        if y == parent[1]:
+            dx = 1 if x > parent[0] else -1
+            result = [(dx, 0)]
+            for dy in (-1, 1):
+                if is_open(x, y + dy) and not is_open(x - dx, y + dy):
+                    result.append((0, dy))
+            return result
+        dy = 1 if y > parent[1] else -1
+        return ((0, dy), (-1, 0), (1, 0))
+
+    g_score = {start: 0}
+    came_from = {start: None}
+    closed = set()
+    h = manhattan_distance(start, goal)
+    open_heap = [(h, h, start)]
+    expanded = 0
+
+    while open_heap:
+        _, _, node = heapq.heappop(open_heap)
+        if node in closed:
+            continue
+        closed.add(node)
+        expanded += 1
+        if node == goal:
+            _record_expanded(stats, expanded)
+            return _fill_jump_path(reconstruct_cells(came_from, goal))
+
+        x, y = node
+        for dx, dy in directions(node, came_from[node]):
+            if dx:
+                jump_point = jump_horizontal(x, y, dx)
+            else:
+                jump_point = jump_vertical(x, y, dy)
+            if jump_point is None or jump_point in closed:
+                continue
+            g = g_score[node] + manhattan_distance(node, jump_point)
+            if g < g_score.get(jump_point, g + 1):
+                g_score[jump_point] = g
+                came_from[jump_point] = node
+                h = manhattan_distance(jump_point, goal)
+                heapq.heappush(open_heap, (g + h, h, jump_point))
+
+    _record_expanded(stats, expanded)
+    return []
+
+
+def _fill_jump_path(jump_points):
+    """Expand a list of jump points (straight segments) into every cell."""
+    path = [jump_points[0]]
+    for x, y in jump_points[1:]:
+        px, py = path[-1]
+        dx = (x > px) - (x < px)
+        dy = (y > py) - (y < py)
+        while (px, py) != (x, y):
+            px += dx
+            py += dy
+            path.append((px, py))
+    return path
+
+
+# ============================================================
+# PATH ORACLE (COMPONENTS, LANDMARKS, CACHE)
+# ============================================================
+
+def label_components(grid):
+    """
+    Label the connected open areas of a grid.
+    
+    Args:
+        grid: A Grid
+    
+    Returns:
+        (labels, sizes): labels is an array with one entry per cell id,
+        giving its component number (-1 for obstacles); sizes[n] is the
+        number of cells in component n
+    
+    Two cells have a path between them exactly when their labels match.
+    """
+    grid = as_grid(grid)
+    blocked = blocked_mask(grid)
+    labels = array("i", [-1]) * len(blocked)
+    sizes = []
+
+    for first in range(len(blocked)):
+        if blocked[first]:
+            continue
+        label = len(sizes)
+        blocked[first] = 1
+        labels[first] = label
+        queue = deque([first])
+        size = 1
+        while queue:
+            cell = queue.popleft()
+            for neighbor in neighbor_ids(grid, cell, blocked):
+                blocked[neighbor] = 1
+                labels[neighbor] = label
+                size += 1
+                queue.append(neighbor)
+        sizes.append(size)
+
+    return labels, sizes
+
+
+def bfs_distances(grid, source):
+    """
+    Get the BFS distance from one cell id to every cell.
+    
+    Args:
+        grid: A Grid
+        source: Cell id to measure from
+    
+    Returns:
+        An array with one entry per cell id: the number of steps from
+        source, or -1 for obstacles and unreachable cells
+    """
+    grid = as_grid(grid)
+    seen = blocked_mask(grid)
+    distances = array("i", [-1]) * len(seen)
+    seen[source] = 1
+    distances[source] = 0
+    queue = deque([source])
+    while queue:
+        cell = queue.popleft()
+        next_distance = distances[cell] + 1
+        for neighbor in neighbor_ids(grid, cell, seen):
+            seen[neighbor] = 1
+            distances[neighbor] = next_distance
+            queue.append(neighbor)
+    return distances
+
+
+class PathOracle:
+    """
+    Answer many path queries on one grid quickly.
+    
+    Three things are precomputed and reused between queries:
+    
+    - Connected components: if start and goal have different labels
+      there is no path, so [] is returned without searching.
+    - Landmark distance tables (ALT): BFS distances from a few far-apart
+      landmark cells. For any landmark L, |d(L, goal) - d(L, cell)| is a
+      lower bound on the distance from cell to goal, which guides A*
+      much better than Manhattan distance around walls.
+    - An LRU cache of recent (start, goal) -> path answers.
+    
+    All of it is rebuilt on the next query after the grid changes
+    (add_obstacle or grid[y][x] = ... bump grid.version).
+    
+    Example:
+        oracle = PathOracle(grid)
+        oracle.find_path((0, 0), (9, 9))  # searches
+        oracle.find_path((0, 0), (9, 9))  # from the cache
+        add_obstacle(grid, 5, 5)
+        oracle.find_path((0, 0), (9, 9))  # precomputes again, then searches
+    """
+    
+    def __init__(self, grid, landmarks=4, cache_size=1024):
+        """Set up the oracle. Precomputation happens on the first query."""
+        if not isinstance(grid, Grid):
+            raise TypeError("PathOracle needs a Grid from create_grid()")
+        self.grid = grid
+        self.landmark_count = landmarks
+        self.cache_size = cache_size
+        self.labels = None
+        self.landmarks = []
+        self.landmark_distances = []
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._cache = OrderedDict()
+        self._version = None
+    
+    def refresh(self):
+        """Redo the precomputation if the grid changed since the last one."""
+        if self._version == self.grid.version:
+            return
+        self._cache.clear()
+        self.labels, sizes = label_components(self.grid)
+        self._choose_landmarks(sizes)
+        self._version = self.grid.version
+    
+    def same_component(self, a, b):
+        """True if open cells a and b, given as (x, y), are connected."""
+        self.refresh()
+        if not is_valid_cell(self.grid, *a) or not is_valid_cell(self.grid, *b):
+            return False
+        return self.labels[self.grid.cell_id(*a)] == self.labels[self.grid.cell_id(*b)]
+    
+    def find_path(self, start, goal, stats=None):
+        """
+        Find a shortest path from start to goal.
+        
+        Returns:
+            A path like find_path_bfs(), or [] if none exists
+        """
+        self.refresh()
+        key = (start, goal)
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            self.cache_hits += 1
+            return list(self._cache[key])
+
+        self.cache_misses += 1
+        if not self.same_component(start, goal):
+            path = []
+        else:
+            heuristic = self._landmark_heuristic(self.grid.cell_id(*goal))
+            path = find_path_astar(self.grid, start, goal, stats, heuristic)
+
+        self._cache[key] = path
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return list(path)
+    
+    def _choose_landmarks(self, sizes):
+        """Pick far-apart landmarks in the largest component."""
+        self.landmarks = []
+        self.landmark_distances = []
+        if not sizes or self.landmark_count <= 0:
+            return
+
+        # Farthest-point selection: each new landmark is the cell farthest
+        # from all landmarks picked so far
+        candidate = self.labels.index(sizes.index(max(sizes)))
+        nearest = None
+        for _ in range(self.landmark_count):
+            distances = bfs_distances(self.grid, candidate)
+            self.landmarks.append(candidate)
+            self.landmark_distances.append(distances)
+            if nearest is None:
+                nearest = distances
+            else:
+                nearest = array("i", map(min, nearest, distances))
+            farthest = max(nearest)
+            if farthest <= 0:
+                break
+            candidate = nearest.index(farthest)
+    
+    def _landmark_heuristic(self, goal):
+        """Build the ALT heuristic function for one goal cell id."""
+        width = self.grid.width
+        goal_y, goal_x = divmod(goal, width)
+        tables = [
+            (distances, distances[goal])
+            for distances in self.landmark_distances
+            if distances[goal] >= 0
+        ]
+
+        def heuristic(cell):
+            y, x = divmod(cell, width)
+            best = abs(x - goal_x) + abs(y - goal_y)
+            for distances, goal_distance in tables:
+                bound = abs(goal_distance - distances[cell])
+                if bound > best:
+                    best = bound
+            return best
+
+        return heuristic
+
+
+# ============================================================
+# INCREMENTAL REPLANNING (D* LITE)
+# ============================================================
+
+class IncrementalPlanner:
+    """
+    Plan a path that is repaired, not redone, when the grid changes.
+    
+    This is D* Lite: it searches backwards from the goal and remembers
+    for every cell g (its distance to the goal) and rhs (the distance
+    one step of lookahead says it should have). When a cell changes,
+    only cells whose g and rhs stop agreeing are put back in the queue,
+    so a single new obstacle usually costs a small local repair.
+    
+    The planner listens to the grid, so edits made with add_obstacle or
+    grid[y][x] = ... are picked up on the next find_path(). Call close()
+    when the planner is no longer needed.
+    
+    Example:
+        planner = IncrementalPlanner(grid, (0, 0), (9, 9))
+        path = planner.find_path()
+        add_obstacle(grid, *path[3])
+        path = planner.find_path()  # repaired around the new obstacle
+    """
+    
+    def __init__(self, grid, start, goal):
+        """Create the planner. The first find_path() does the full search."""
+        if not isinstance(grid, Grid):
+            raise TypeError("IncrementalPlanner needs a Grid from create_grid()")
+        self.grid = grid
+        self.start = grid.cell_id(*start)
+        self.goal = grid.cell_id(*goal)
+        self._last_start = self.start
+        self._key_offset = 0  # "km" in the D* Lite paper
+        self._g = {}
+        self._rhs = {self.goal: 0}
+        self._queue = []
+        self._queued = {}
+        self._changed = []
+        self._push(self.goal)
+        grid.add_listener(self._on_change)
+    
+    def close(self):
+        """Stop listening to the grid."""
+        self.grid.remove_listener(self._on_change)
+    
+    def move_start(self, start):
+        """Move the start (e.g. the robot took a step) without replanning."""
+        self.start = self.grid.cell_id(*start)
+    
+    def find_path(self, stats=None):
+        """
+        Get the current shortest path from start to goal.
+        
+        Args:
+            stats: Optional dict; "expanded" is set to the number of cells
+                   taken off the queue during this call
+        
+        Returns:
+            A path like find_path_bfs(), or [] if none exists
+        """
+        if self.start != self._last_start:
+            self._key_offset += self._distance(self._last_start, self.start)
+            self._last_start = self.start
+
+        changed, self._changed = self._changed, []
+        for cell in changed:
+            self._update(cell)
+            for neighbor in self._neighbors(cell):
+                self._update(neighbor)
+
+        _record_expanded(stats, self._compute())
+        return self._extract_path()
+    
+    def _on_change(self, cell, old, new):
+        if (old == OBSTACLE) != (new == OBSTACLE):
+            self._changed.append(cell)
+    
+    def _distance(self, a, b):
+        ay, ax = divmod(a, self.grid.width)
+        by, bx = divmod(b, self.grid.width)
+        return abs(ax - bx) + abs(ay - by)
+    
+    def _neighbors(self, cell):
+        """In-bound neighbors of a cell, open or not."""
+        width = self.grid.width
+        x = cell % width
+        neighbors = []
+        if x > 0:
+            neighbors.append(cell - 1)
+        if x < width - 1:
+            neighbors.append(cell + 1)
+        if cell >= width:
+            neighbors.append(cell - width)
+        if cell + width < len(self.grid.cells):
+            neighbors.append(cell + width)
+        return neighbors
+    
+    def _key(self, cell):
+        best = min(self._g.get(cell, INFINITY), self._rhs.get(cell, INFINITY))
+        return (best + self._distance(self.start, cell) + self._key_offset, best)
+    
+    def _push(self, cell):
+        key = self._key(cell)
+        self._queued[cell] = key
+        heapq.heappush(self._queue, (key, cell))
+    
+    def _top(self):
+        """Drop stale heap entries and return the top (key, cell), or None."""
+        while self._queue:
+            key, cell = self._queue[0]
+            if self._queued.get(cell) == key:
+                return key, cell
+            heapq.heappop(self._queue)
+        return None
+    
+    def _update(self, cell):
+        cells = self.grid.cells
+        if cell != self.goal:
+            best = INFINITY
+            if cells[cell] != OBSTACLE:
+                for neighbor in self._neighbors(cell):
+                    if cells[neighbor] != OBSTACLE:
+                        best = min(best, self._g.get(neighbor, INFINITY) + 1)
+            self._rhs[cell] = best
+        self._queued.pop(cell, None)
+        if self._g.get(cell, INFINITY) != self._rhs.get(cell, INFINITY):
+            self._push(cell)
+    
+    def _compute(self):
+        """Process the queue until the start's distance is settled."""
+        expanded = 0
+        while True:
+            top = self._top()
+            start_g = self._g.get(self.start, INFINITY)
+            start_rhs = self._rhs.get(self.start, INFINITY)
+            if top is None or (top[0] >= self._key(self.start) and start_g == start_rhs):
+                return expanded
+
+            old_key, cell = top
+            heapq.heappop(self._queue)
+            del self._queued[cell]
+            expanded += 1
+
+            new_key = self._key(cell)
+            g = self._g.get(cell, INFINITY)
+            rhs = self._rhs.get(cell, INFINITY)
+            if old_key < new_key:
+                self._push(cell)
+            elif g > rhs:
+                self._g[cell] = rhs
+                for neighbor in self._neighbors(cell):
+                    self._update(neighbor)
+            else:
+                self._g[cell] = INFINITY
+                self._update(cell)
+                for neighbor in self._neighbors(cell):
+                    self._update(neighbor)
+    
+    def _extract_path(self):
+        """Walk downhill in g from the start to the goal."""
+        cells = self.grid.cells
+        if cells[self.start] == OBSTACLE or cells[self.goal] == OBSTACLE:
+            return []
+        if self._g.get(self.start, INFINITY) == INFINITY:
+            return []
+
+        path = [self.start]
+        cell = self.start
+        while cell != self.goal:
+            cell = min(
+                (n for n in self._neighbors(cell) if cells[n] != OBSTACLE),
+                key=lambda n: self._g.get(n, INFINITY),
+            )
+            path.append(cell)
+        return [self.grid.cell_xy(c) for c in path]
+
+
+# ============================================================
+# MULTI-SOURCE BFS
+# ============================================================
+
+def multi_source_bfs(grid, sources):
+    """
+    Distance to the nearest source, and which source it is, for every cell.
+    
+    All sources start in the frontier together, so one sweep over the
+    grid does the work of a BFS per source. Each level is handled as a
+    whole with NumPy: the frontier is an array of cell ids, its four
+    neighbor sets are computed with array arithmetic, and the cells seen
+    for the first time become the next frontier.
+    
+    Args:
+        grid: The 2D grid
+        sources: List of (x, y) positions; sources on obstacles or out of
+                 bounds reach nothing
+    
+    Returns:
+        (distances, owners): two int32 arrays of shape (height, width),
+        indexed [y][x] like the grid. distances is the number of steps to
+        the nearest source; owners is that source's index in sources
+        (the lowest index wins ties). Both are -1 for cells no source
+        can reach.
+    
+    Example:
+        distances, owners = multi_source_bfs(grid, stations)
+        covered = np.bincount(owners[owners >= 0], minlength=len(stations))
+        # covered[i] = number of cells closest to station i
+    """
+    grid = as_grid(grid)
+    width, height = grid.width, grid.height
+    total = width * height
+    open_cells = np.frombuffer(grid.cells, dtype=np.uint8) != OBSTACLE
+    distances = np.full(total, -1, dtype=np.int32)
+    owners = np.full(total, -1, dtype=np.int32)
+
+    frontier = []
+    frontier_owners = []
+    for index, (x, y) in enumerate(sources):
+        if not is_valid_cell(grid, x, y):
+            continue
+        cell = grid.cell_id(x, y)
+        if owners[cell] == -1:
+            owners[cell] = index
+            distances[cell] = 0
+            frontier.append(cell)
+            frontier_owners.append(index)
+    frontier = np.array(frontier, dtype=np.int64)
+    frontier_owners = np.array(frontier_owners, dtype=np.int64)
+    source_count = max(len(sources), 1)
+
+    distance = 0
+    while frontier.size:
+        distance += 1
+        x = frontier % width
+        # left, right, up, down - each with its own edge check
+        steps = (
+            (frontier - 1, x > 0),
+            (frontier + 1, x < width - 1),
+            (frontier - width, frontier >= width),
+            (frontier + width, frontier < total - width),
+        )
+        candidates = np.concatenate([cells[inside] for cells, inside in steps])
+        candidate_owners = np.concatenate(
+            [frontier_owners[inside] for _, inside in steps])
+        fresh = open_cells[candidates] & (owners[candidates] == -1)
+        candidates = candidates[fresh]
+        candidate_owners = candidate_owners[fresh]
+
+        # Several frontier cells can reach the same new cell; keep the one
+        # with the lowest source index. Sorting on cell * count + owner puts
+        # each cell's lowest owner first.
+        keys = np.unique(candidates * source_count + candidate_owners)
+        cells = keys // source_count
+        first = np.ones(cells.size, dtype=bool)
+        first[1:] = cells[1:] != cells[:-1]
+        frontier = cells[first]
+        frontier_owners = keys[first] % source_count
+        owners[frontier] = frontier_owners
+        distances[frontier] = distance
+
+    return distances.reshape(height, width), owners.reshape(height, width)
+
+
+# ============================================================
+# BATCH PLANNING WITH A PROCESS POOL
+# ============================================================
+
+# Set in each worker process by _init_plan_worker
+_worker_grid = None
+_worker_planner = None
+
+
+def _init_plan_worker(shm_name, width, height, planner):
+    """Copy the shared grid into this worker's own Grid, once."""
+    global _worker_grid, _worker_planner
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        grid = Grid(width, height)
+        grid.cells[:] = shm.buf[:width * height]
+    finally:
+        shm.close()
+    _worker_grid = grid
+    _worker_planner = planner
+
+
+def _plan_chunk(chunk):
+    """Plan a list of (start, goal) pairs on the worker's grid."""
+    return [_worker_planner(_worker_grid, start, goal) for start, goal in chunk]
+
+
+def plan_paths(grid, requests, workers=None, planner=find_path_bfs):
+    """
+    Plan paths for many (start, goal) pairs on the same grid in parallel.
+    
+    The grid's cells are copied into a shared memory block once; each
+    worker process reads them from there when it starts, instead of the
+    grid being pickled and sent along with the requests. Requests are
+    sent in chunks so each round trip carries enough work to be worth it.
+    
+    Args:
+        grid: The 2D grid
+        requests: List of (start, goal) pairs
+        workers: Number of processes (default: one per CPU). With 1 worker,
+                 or a single request, everything runs in this process.
+        planner: Any planner taking (grid, start, goal), e.g. find_path_bfs
+                 or find_path_astar. Must be a module-level function so
+                 the workers can import it.
+    
+    Returns:
+        A list of paths, one per request and in the same order
+    
+    Example:
+        paths = plan_paths(grid, [((0, 0), (9, 9)), ((5, 0), (0, 5))], workers=4)
+    """
+    grid = as_grid(grid)
+    requests = list(requests)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = min(workers, len(requests))
+    if workers <= 1:
+        return [planner(grid, start, goal) for start, goal in requests]
 
+    chunk_size = -(-len(requests) // (workers * 4))
+    chunks = [requests[i:i + chunk_size] for i in range(0, len(requests), chunk_size)]
+
+    shm = shared_memory.SharedMemory(create=True, size=max(len(grid.cells), 1))
+    try:
+        shm.buf[:len(grid.cells)] = grid.cells
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_plan_worker,
+            initargs=(shm.name, grid.width, grid.height, planner),
+        ) as pool:
+            paths = []
+            for chunk_paths in pool.map(_plan_chunk, chunks):
+                paths.extend(chunk_paths)
+    finally:
+        shm.close()
+        shm.unlink()
+    return paths
+
+
+# ============================================================
+# COOPERATIVE MULTI-ROBOT PLANNING
+# ============================================================
+
+class ReservationTable:
+    """
+    Which robot is in which cell at which timestep.
+    
+    Reservations are kept in a dict keyed by t * cells + cell, so a lookup
+    is one hash of a small int and memory grows with the total length of
+    the planned paths, not with cells x time like a full bitset would.
+    A robot that has reached its goal stays there: that is stored once
+    per cell as the time it parked, not as one entry per future step.
+    
+    Example:
+        table = ReservationTable(grid)
+        table.reserve([0, 1, 2], robot=0)   # cell ids at t = 0, 1, 2
+        table.is_free(2, 5)                 # -> False, robot 0 parked there
+    """
+    
+    def __init__(self, grid):
+        self.cell_count = grid.width * grid.height
+        self._slots = {}
+        self._parked = {}
+        self._last_visit = {}
+    
+    def reserve(self, cells, robot):
+        """Reserve cells[t] at time t for robot, then park it on cells[-1]."""
+        count = self.cell_count
+        for t, cell in enumerate(cells):
+            self._slots[t * count + cell] = robot
+            if t > self._last_visit.get(cell, -1):
+                self._last_visit[cell] = t
+        self._parked[cells[-1]] = len(cells) - 1
+    
+    def is_free(self, cell, t):
+        """True if no robot is in cell at time t."""
+        return (t * self.cell_count + cell not in self._slots
+                and self._parked.get(cell, t + 1) > t)
+    
+    def is_swap(self, cell, next_cell, t):
+        """True if moving cell -> next_cell at t meets a robot coming the other way."""
+        robot = self._slots.get(t * self.cell_count + next_cell)
+        return (robot is not None
+                and self._slots.get((t + 1) * self.cell_count + cell) == robot)
+    
+    def can_park(self, cell, t):
+        """True if a robot can stop in cell from time t on."""
+        return self._last_visit.get(cell, -1) < t and cell not in self._parked
+    
+    def is_clear(self, cells):
+        """True if the timed path cells[t] runs into no reservation."""
+        for t in range(1, len(cells)):
+            if not self.is_free(cells[t], t) or self.is_swap(cells[t - 1], cells[t], t - 1):
+                return False
+        return self.is_free(cells[0], 0) and self.can_park(cells[-1], len(cells) - 1)
+
+
+def _find_timed_path(grid, blocked, table, start, goal, horizon):
+    """
+    Space-time A* for one robot. Returns cell ids by timestep, or None.
+    
+    States are (cell, t) packed as t * cells + cell. Moving or waiting
+    both cost one step, so a state's cost is just t and the first time a
+    state is pushed is the best it will get.
+    """
+    width = grid.width
+    count = table.cell_count
+    goal_y, goal_x = divmod(goal, width)
+    y, x = divmod(start, width)
+    h = abs(x - goal_x) + abs(y - goal_y)
+    open_heap = [(h, h, start)]
+    came_from = {start: None}
+    expanded = 0
+
+    while open_heap:
+        _, _, state = heapq.heappop(open_heap)
+        expanded += 1
+        t, cell = divmod(state, count)
+        if cell == goal and table.can_park(goal, t):
+            cells = []
+            while state is not None:
+                cells.append(state % count)
+                state = came_from[state]
+            cells.reverse()
+            return cells, expanded
+        if t == horizon:
+            continue
+
+        next_t = t + 1
+        x = cell % width
+        moves = [cell]
+        if x > 0 and not blocked[cell - 1]:
+            moves.append(cell - 1)
+        if x < width - 1 and not blocked[cell + 1]:
+            moves.append(cell + 1)
+        if cell >= width and not blocked[cell - width]:
+            moves.append(cell - width)
+        if cell + width < count and not blocked[cell + width]:
+            moves.append(cell + width)
+        for next_cell in moves:
+            next_state = next_t * count + next_cell
+            if next_state in came_from or not table.is_free(next_cell, next_t):
+                continue
+            if next_cell != cell and table.is_swap(cell, next_cell, t):
+                continue
+            came_from[next_state] = state
+            y, x = divmod(next_cell, width)
+            h = abs(x - goal_x) + abs(y - goal_y)
+            heapq.heappush(open_heap, (next_t + h, h, next_state))
+
+    return None, expanded
+
+
+def find_paths_cooperative(grid, requests, max_delay=32, stats=None):
+    """
+    Plan collision-free paths for robots that all move at the same time.
+    
+    Robots are planned one at a time in the order given (earlier means
+    higher priority), avoiding the slots already in the ReservationTable:
+    no two robots in one cell at the same time, and no two robots
+    swapping cells in one step. A robot stays on its goal after arriving.
+    
+    Each robot first gets a plain A* path; if that path runs into no
+    reservation it is used as is. Only robots that would collide are
+    replanned with A* over (cell, timestep) states, where waiting in
+    place is also a move. After the first robot whose goal turns out to
+    be unreachable, connected components are labeled so later ones are
+    rejected without a search.
+    
+    A robot without a plan stays on its start cell the whole time. If an
+    earlier robot's path already runs through that cell, planning starts
+    over with the cell taken from t = 0 on, so every such robot costs one
+    more pass.
+    
+    Args:
+        grid: The 2D grid
+        requests: List of (start, goal) pairs, highest priority first
+        max_delay: How many steps longer than its shortest path a robot's
+                   route may be before the robot is given up on
+        stats: Optional dict; "expanded" is set to the total number of
+               cells and states taken off the open sets (over all passes),
+               "replanned" to the number of robots that needed the
+               space-time search in the final pass
+    
+    Returns:
+        A list with one timed path per request: path[t] is the robot's
+        (x, y) at time t, so repeated positions are waits. [] means no
+        plan was found; that robot stays on its start and no other path
+        goes through it.
+    
+    Example:
+        paths = find_paths_cooperative(grid, [((0, 0), (4, 0)), ((4, 0), (0, 0))])
+    """
+    grid = as_grid(grid)
+    blocked = blocked_mask(grid)
+    stuck = set()
+    expanded = 0
+
+    while True:
+        paths, conflict, pass_expanded, replanned = _plan_cooperative_pass(
+            grid, blocked, requests, max_delay, stuck)
+        expanded += pass_expanded
+        if conflict is None:
+            break
+        stuck.add(conflict)
+
+    _record_expanded(stats, expanded)
+    if stats is not None:
+        stats["replanned"] = replanned
+    return paths
+
+
+def _plan_cooperative_pass(grid, blocked, requests, max_delay, stuck):
+    """
+    One priority-order pass of find_paths_cooperative.
+    
+    Robots in stuck are not planned: their start cells are taken from
+    t = 0 on before anyone else is planned. Returns (paths, conflict,
+    expanded, replanned), where conflict is a robot that got no plan
+    while an earlier path uses its start cell (then paths is incomplete),
+    or None.
+    """
+    labels = None
+    table = ReservationTable(grid)
+    for robot in stuck:
+        start = requests[robot][0]
+        if grid.in_bounds(*start):
+            table.reserve([grid.cell_id(*start)], robot)
+    paths = []
+    expanded = 0
+    replanned = 0
+
+    for robot, (start, goal) in enumerate(requests):
+        if robot in stuck:
+            paths.append([])
+            continue
+        cells = None
+        if (is_valid_cell(grid, *start) and is_valid_cell(grid, *goal)
+                and (labels is None
+                     or labels[grid.cell_id(*start)] == labels[grid.cell_id(*goal)])):
+            astar_stats = {}
+            shortest = find_path_astar(grid, start, goal, astar_stats)
+            expanded += astar_stats["expanded"]
+            cells = [grid.cell_id(x, y) for x, y in shortest]
+            if not cells:
+                cells = None
+                labels, _ = label_components(grid)
+            elif not table.is_clear(cells):
+                replanned += 1
+                horizon = len(cells) - 1 + max_delay
+                cells, robot_expanded = _find_timed_path(
+                    grid, blocked, table, cells[0], cells[-1], horizon)
+                expanded += robot_expanded
+        if cells is None:
+            paths.append([])
+            if grid.in_bounds(*start):
+                cell = grid.cell_id(*start)
+                if not table.can_park(cell, 0):
+                    return paths, robot, expanded, replanned
+                table.reserve([cell], robot)
+            continue
+        table.reserve(cells, robot)
+        paths.append([grid.cell_xy(cell) for cell in cells])
+
+    return paths, None, expanded, replanned
+
+
+# ============================================================
+# HIERARCHICAL PATHFINDING (HPA*)
+# ============================================================
+
+# Entrances at least this wide get a transition at each end, not one
+HPA_WIDE_ENTRANCE = 6
+
+
+class HierarchicalPlanner:
+    """
+    Plan long routes on huge grids with HPA* (hierarchical A*).
+    
+    The grid is cut into cluster_size x cluster_size clusters. Where two
+    neighboring clusters share a run of open cells along their border
+    (an "entrance"), one or two pairs of facing cells become transitions:
+    nodes of a small abstract graph. Inside each cluster the BFS distance
+    between every two of its nodes is precomputed.
+    
+    A query connects start and goal to the nodes of their own clusters,
+    searches the abstract graph with A*, then refines each abstract step
+    into real cells with a BFS that stays inside one cluster. Paths can
+    be a few percent longer than find_path_bfs(), but a path is found
+    whenever one exists.
+    
+    The planner listens to the grid: a change marks its cluster dirty,
+    and only dirty clusters and their neighbors are rebuilt on the next
+    query. Call close() when the planner is no longer needed.
+    
+    Example:
+        planner = HierarchicalPlanner(grid, cluster_size=16)
+        path = planner.find_path((0, 0), (999, 999))
+    """
+    
+    def __init__(self, grid, cluster_size=16):
+        """Build the abstract graph for the whole grid."""
+        if not isinstance(grid, Grid):
+            raise TypeError("HierarchicalPlanner needs a Grid from create_grid()")
+        self.grid = grid
+        self.cluster_size = cluster_size
+        self.columns = -(-grid.width // cluster_size)
+        self.rows = -(-grid.height // cluster_size)
+        self._borders = {}     # (cluster, right/lower cluster) -> [(cell, cell)]
+        self._crossings = {}   # transition cell -> cells it faces
+        self._nodes = {}       # cluster -> transition cells inside it
+        self._edges = {}       # transition cell -> [(node, distance)]
+        self._dirty = set(range(self.columns * self.rows))
+        grid.add_listener(self._on_change)
+    
+    def close(self):
+        """Stop listening to the grid."""
+        self.grid.remove_listener(self._on_change)
+    
+    def refresh(self):
+        """Rebuild the clusters touched by grid changes since last time."""
+        if not self._dirty:
+            return
+        dirty, self._dirty = self._dirty, set()
+
+        borders = set()
+        for cluster in dirty:
+            borders.update(self._cluster_borders(cluster))
+        affected = set(dirty)
+        for border in borders:
+            self._build_border(border)
+            affected.update(border)
+        for cluster in affected:
+            self._build_edges(cluster)
+    
+    def find_path(self, start, goal, stats=None):
+        """
+        Find a path from start to goal.
+        
+        Args:
+            start: Starting position (x, y) tuple
+            goal: Goal position (x, y) tuple
+            stats: Optional dict; "expanded" is set to the number of
+                   abstract nodes taken off the open set
+        
+        Returns:
+            A path like find_path_bfs() (possibly slightly longer than the
+            shortest), or [] if none exists
+        """
+        grid = self.grid
+        if not is_valid_cell(grid, *start) or not is_valid_cell(grid, *goal):
+            return []
+        self.refresh()
+        start_id = grid.cell_id(*start)
+        goal_id = grid.cell_id(*goal)
+        if start_id == goal_id:
+            return [start]
+
+        start_cluster = self._cluster_of(start_id)
+        goal_cluster = self._cluster_of(goal_id)
+        start_targets = list(self._nodes[start_cluster])
+        if goal_cluster == start_cluster:
+            start_targets.append(goal_id)
+        start_dist = self._distances_within(start_cluster, start_id, start_targets)
+        goal_dist = self._distances_within(goal_cluster, goal_id, self._nodes[goal_cluster])
+
+        nodes, expanded = self._abstract_search(
+            start_id, goal_id, start_cluster, goal_cluster, start_dist, goal_dist)
+        _record_expanded(stats, expanded)
+        if nodes is None:
+            return []
+        return [grid.cell_xy(cell) for cell in self._refine(nodes)]
+    
+    def _on_change(self, cell, old, new):
+        if (old == OBSTACLE) != (new == OBSTACLE):
+            self._dirty.add(self._cluster_of(cell))
+    
+    def _cluster_of(self, cell):
+        y, x = divmod(cell, self.grid.width)
+        return (y // self.cluster_size) * self.columns + x // self.cluster_size
+    
+    def _bounds(self, cluster):
+        """(x0, y0, x1, y1) of a cluster, end-exclusive."""
+        row, column = divmod(cluster, self.columns)
+        x0 = column * self.cluster_size
+        y0 = row * self.cluster_size
+        return (x0, y0, min(x0 + self.cluster_size, self.grid.width),
+                min(y0 + self.cluster_size, self.grid.height))
+    
+    def _cluster_borders(self, cluster):
+        """Keys of the (up to four) borders around a cluster."""
+        row, column = divmod(cluster, self.columns)
+        borders = []
+        if column > 0:
+            borders.append((cluster - 1, cluster))
+        if column < self.columns - 1:
+            borders.append((cluster, cluster + 1))
+        if row > 0:
+            borders.append((cluster - self.columns, cluster))
+        if row < self.rows - 1:
+            borders.append((cluster, cluster + self.columns))
+        return borders
+    
+    def _build_border(self, border):
+        """Recompute the transitions between two neighboring clusters."""
+        for a, b in self._borders.get(border, ()):
+            self._crossings[a].remove(b)
+            self._crossings[b].remove(a)
+
+        first, second = border
+        x0, y0, x1, y1 = self._bounds(first)
+        width = self.grid.width
+        if first // self.columns == second // self.columns:
+            # Vertical border: first's right column faces second's left column
+            pairs = [(y * width + x1 - 1, y * width + x1) for y in range(y0, y1)]
+        else:
+            # Horizontal border: first's bottom row faces second's top row
+            pairs = [((y1 - 1) * width + x, y1 * width + x) for x in range(x0, x1)]
+
+        cells = self.grid.cells
+        transitions = []
+        run = []
+        for a, b in pairs + [(None, None)]:
+            if a is not None and cells[a] != OBSTACLE and cells[b] != OBSTACLE:
+                run.append((a, b))
+                continue
+            if len(run) >= HPA_WIDE_ENTRANCE:
+                transitions += [run[0], run[-1]]
+            elif run:
+                transitions.append(run[len(run) // 2])
+            run = []
+
+        self._borders[border] = transitions
+        for a, b in transitions:
+            self._crossings.setdefault(a, []).append(b)
+            self._crossings.setdefault(b, []).append(a)
+    
+    def _find_nodes(self, cluster):
+        """Transition cells that lie inside a cluster."""
+        nodes = set()
+        for border in self._cluster_borders(cluster):
+            side = 0 if border[0] == cluster else 1
+            nodes.update(pair[side] for pair in self._borders.get(border, ()))
+        return nodes
+    
+    def _build_edges(self, cluster):
+        """
+        Edges of a cluster's nodes: the distance inside the cluster to each
+        other node it can reach, plus a step of 1 across each crossing.
+        """
+        for node in self._nodes.get(cluster, ()):
+            del self._edges[node]
+        nodes = self._find_nodes(cluster)
+        self._nodes[cluster] = nodes
+
+        blocked, stride, to_local, _ = self._cluster_view(cluster)
+        local_nodes = [(node, to_local(node)) for node in nodes]
+        between = {}
+        for node, local in local_nodes:
+            distances, _ = self._cluster_bfs(blocked, stride, local)
+            between[node] = {other: distances[other_local]
+                             for other, other_local in local_nodes
+                             if other != node and distances[other_local] >= 0}
+
+        for node, reachable in between.items():
+            # a -> c is left out when some a -> b -> c is just as short:
+            # distances stay exact, and each node has far fewer edges
+            edges = []
+            for other, distance in reachable.items():
+                shortcut = any(
+                    via != other and reachable[via] + between[via].get(other, distance) == distance
+                    for via in reachable
+                )
+                if not shortcut:
+                    edges.append((other, distance))
+            edges += [(other, 1) for other in self._crossings.get(node, ())]
+            self._edges[node] = edges
+    
+    def _cluster_view(self, cluster):
+        """
+        A cluster copied out as a blocked mask with a wall all around it.
+        
+        Returns (blocked, stride, to_local, to_cell): blocked is a
+        bytearray like blocked_mask() for the padded cluster, to_local
+        maps a grid cell id to its index in it and to_cell maps back. The
+        padding means a BFS never needs a bounds check to stay inside.
+        """
+        x0, y0, x1, y1 = self._bounds(cluster)
+        width = self.grid.width
+        stride = x1 - x0 + 2
+        blocked = bytearray([1]) * (stride * (y1 - y0 + 2))
+        for y in range(y0, y1):
+            local = (y - y0 + 1) * stride + 1
+            row = self.grid.cells[y * width + x0:y * width + x1]
+            blocked[local:local + x1 - x0] = row.translate(_BLOCKED_TABLE)
+
+        def to_local(cell):
+            y, x = divmod(cell, width)
+            return (y - y0 + 1) * stride + x - x0 + 1
+
+        def to_cell(local):
+            y, x = divmod(local, stride)
+            return (y + y0 - 1) * width + x + x0 - 1
+
+        return blocked, stride, to_local, to_cell
+    
+    def _cluster_bfs(self, blocked, stride, source, target=None):
+        """BFS inside a padded cluster view; returns (distances, parents)."""
+        size = len(blocked)
+        seen = bytearray(blocked)
+        distances = [-1] * size
+        parents = [-1] * size
+        seen[source] = 1
+        distances[source] = 0
+        queue = deque([source])
+        while queue:
+            cell = queue.popleft()
+            if cell == target:
+                break
+            next_distance = distances[cell] + 1
+            for neighbor in (cell - 1, cell + 1, cell - stride, cell + stride):
+                if not seen[neighbor]:
+                    seen[neighbor] = 1
+                    distances[neighbor] = next_distance
+                    parents[neighbor] = cell
+                    queue.append(neighbor)
+        return distances, parents
+    
+    def _distances_within(self, cluster, source, targets):
+        """{target: distance} for the targets source reaches inside cluster."""
+        blocked, stride, to_local, _ = self._cluster_view(cluster)
+        distances, _ = self._cluster_bfs(blocked, stride, to_local(source))
+        found = {}
+        for target in targets:
+            distance = distances[to_local(target)]
+            if distance >= 0:
+                found[target] = distance
+        return found
+    
+    def _path_within(self, cluster, a, b):
+        """Shortest list of cells from a to b that stays inside cluster."""
+        blocked, stride, to_local, to_cell = self._cluster_view(cluster)
+        _, parents = self._cluster_bfs(blocked, stride, to_local(a), to_local(b))
+        path = []
+        local = to_local(b)
+        while local != -1:
+            path.append(to_cell(local))
+            local = parents[local]
+        return path[::-1]
+    
+    def _abstract_search(self, start, goal, start_cluster, goal_cluster,
+                         start_dist, goal_dist):
+        """
+        A* over the abstract graph with start and goal added to it.
+        
+        Returns the list of visited cells (start, nodes..., goal) and the
+        number of nodes expanded; the list is None if goal is unreachable.
+        """
+        width = self.grid.width
+        goal_y, goal_x = divmod(goal, width)
+        # Edges into the goal from the nodes of its cluster
+        to_goal = {node: goal_dist[node]
+                   for node in self._nodes[goal_cluster] if node in goal_dist}
+
+        g_score = {start: 0}
+        came_from = {start: None}
+        open_heap = [(0, 0, start)]
+        closed = set()
+        expanded = 0
+        while open_heap:
+            _, _, node = heapq.heappop(open_heap)
+            if node in closed:
+                continue
+            closed.add(node)
+            expanded += 1
+            if node == goal:
+                path = []
+                while node is not None:
+                    path.append(node)
+                    node = came_from[node]
+                return path[::-1], expanded
+
+            g = g_score[node]
+            edges = self._edges.get(node, ())
+            if node in to_goal or node == start:
+                edges = list(edges)
+                if node in to_goal:
+                    edges.append((goal, to_goal[node]))
+                if node == start:
+                    edges += [(other, start_dist[other])
+                              for other in self._nodes[start_cluster] if other in start_dist]
+                    if goal in start_dist:
+                        edges.append((goal, start_dist[goal]))
+            for other, cost in edges:
+                new_g = g + cost
+                if other not in closed and new_g < g_score.get(other, new_g + 1):
+                    g_score[other] = new_g
+                    came_from[other] = node
+                    y, x = divmod(other, width)
+                    h = abs(x - goal_x) + abs(y - goal_y)
+                    heapq.heappush(open_heap, (new_g + h, h, other))
+        return None, expanded
+    
+    def _refine(self, nodes):
+        """Turn an abstract path into cells, one cluster-local BFS per step."""
+        cells = [nodes[0]]
+        for a, b in zip(nodes, nodes[1:]):
+            if self._cluster_of(a) != self._cluster_of(b):
+                cells.append(b)  # a crossing between neighboring clusters
+                continue
+            cells.extend(self._path_within(self._cluster_of(a), a, b)[1:])
+        return cells
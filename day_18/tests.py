@@ -7,6 +7,9 @@ Usage:
     python tests.py
 """
 
+import io
+import random
+
 from project import (
     create_grid,
     add_obstacle,
@@ -17,6 +20,16 @@ from project import (
     calculate_path_length,
     visualize_grid,
     count_reachable_cells,
+    Grid,
+    find_path_astar,
+    find_path_jps,
+    PathOracle,
+    label_components,
+    IncrementalPlanner,
+    multi_source_bfs,
+    plan_paths,
+    find_paths_cooperative,
+    HierarchicalPlanner,
 )
 
 
@@ -215,6 +228,272 @@ def test_count_reachable_blocked():
     print("✅ Test 18 passed: Blocked not reachable")
 
 
+# ============================================================
+# FLAT GRID TESTS
+# ============================================================
+
+def test_flat_grid_storage():
+    """Test: Grid cells live in one flat bytearray"""
+    grid = create_grid(4, 3)
+    add_obstacle(grid, 3, 2)
+    assert isinstance(grid, Grid), f"❌ create_grid should return a Grid"
+    assert len(grid.cells) == 12, f"❌ Should store 12 cells"
+    assert grid.cells[grid.cell_id(3, 2)] == 1, f"❌ Cell id 11 should be blocked"
+    assert grid.cell_xy(11) == (3, 2), f"❌ Cell id 11 should be (3, 2)"
+    assert grid[2][-1] == 1, f"❌ grid[2][-1] should read the same cell"
+    print("✅ Test 19 passed: Flat grid storage")
+
+
+def test_list_of_lists_still_supported():
+    """Test: Functions still accept a plain list of lists"""
+    grid = [[0, 1, 0],
+            [0, 1, 0],
+            [0, 0, 0]]
+    path = find_path_bfs(grid, (0, 0), (2, 0))
+    assert len(path) == 7, f"❌ Path should have 7 cells, got {len(path)}"
+    assert count_reachable_cells(grid, (0, 0)) == 7, f"❌ 7 cells should be reachable"
+    print("✅ Test 20 passed: List of lists grid")
+
+
+# ============================================================
+# A* AND JPS TESTS
+# ============================================================
+
+def make_wall_grid():
+    """7x5 grid with a wall that has one gap at the bottom."""
+    grid = create_grid(7, 5)
+    for y in range(4):
+        add_obstacle(grid, 3, y)
+    return grid
+
+
+def test_astar_matches_bfs():
+    """Test: A* finds a path as short as BFS"""
+    grid = make_wall_grid()
+    bfs_path = find_path_bfs(grid, (0, 0), (6, 0))
+    stats = {}
+    path = find_path_astar(grid, (0, 0), (6, 0), stats=stats)
+    assert len(path) == len(bfs_path), f"❌ A* path should have {len(bfs_path)} cells"
+    assert path[0] == (0, 0) and path[-1] == (6, 0), f"❌ Wrong path ends"
+    assert stats["expanded"] > 0, f"❌ Should report expanded nodes"
+    print("✅ Test 21 passed: A* path")
+
+
+def test_jps_matches_bfs():
+    """Test: JPS finds a connected path as short as BFS"""
+    grid = make_wall_grid()
+    bfs_path = find_path_bfs(grid, (0, 0), (6, 0))
+    path = find_path_jps(grid, (0, 0), (6, 0))
+    assert len(path) == len(bfs_path), f"❌ JPS path should have {len(bfs_path)} cells"
+    for (x1, y1), (x2, y2) in zip(path, path[1:]):
+        assert abs(x1 - x2) + abs(y1 - y2) == 1, f"❌ Path cells should be adjacent"
+    assert find_path_jps(grid, (0, 0), (3, 0)) == [], f"❌ Blocked goal has no path"
+    print("✅ Test 22 passed: JPS path")
+
+
+# ============================================================
+# BIDIRECTIONAL BFS TESTS
+# ============================================================
+
+def test_bidirectional_matches_bfs():
+    """Test: Bidirectional BFS finds paths as short as BFS"""
+    grid = make_wall_grid()
+    for start, goal in (((0, 0), (6, 0)), ((0, 4), (6, 4)), ((2, 2), (2, 2))):
+        expected = find_path_bfs(grid, start, goal)
+        path = find_path_bfs(grid, start, goal, bidirectional=True)
+        assert len(path) == len(expected), \
+            f"❌ {start}->{goal} should have {len(expected)} cells, got {len(path)}"
+        assert path[0] == start and path[-1] == goal, f"❌ Wrong path ends"
+    assert find_path_bfs(grid, (0, 0), (3, 0), bidirectional=True) == [], \
+        f"❌ Blocked goal has no path"
+    print("✅ Test 23 passed: Bidirectional BFS")
+
+
+# ============================================================
+# PATH ORACLE TESTS
+# ============================================================
+
+def test_label_components():
+    """Test: A full wall splits the grid into two components"""
+    grid = create_grid(3, 3)
+    for y in range(3):
+        add_obstacle(grid, 1, y)
+    labels, sizes = label_components(grid)
+    assert sorted(sizes) == [3, 3], f"❌ Expected two components of 3 cells"
+    assert labels[grid.cell_id(1, 0)] == -1, f"❌ Obstacles should be labeled -1"
+    assert labels[grid.cell_id(0, 0)] != labels[grid.cell_id(2, 0)], \
+        f"❌ Cells on either side of the wall should differ"
+    print("✅ Test 24 passed: Component labels")
+
+
+def test_oracle_matches_bfs_and_caches():
+    """Test: Oracle paths match BFS and repeat queries hit the cache"""
+    grid = make_wall_grid()
+    oracle = PathOracle(grid, landmarks=2)
+    expected = find_path_bfs(grid, (0, 0), (6, 0))
+    path = oracle.find_path((0, 0), (6, 0))
+    assert len(path) == len(expected), f"❌ Oracle path should have {len(expected)} cells"
+    oracle.find_path((0, 0), (6, 0))
+    assert oracle.cache_hits == 1, f"❌ Second query should come from the cache"
+    print("✅ Test 25 passed: Oracle cache")
+
+
+def test_oracle_invalidated_by_obstacle():
+    """Test: Adding an obstacle clears the oracle's cached answers"""
+    grid = make_wall_grid()
+    oracle = PathOracle(grid)
+    assert oracle.find_path((0, 0), (6, 0)) != [], f"❌ Path should exist"
+    add_obstacle(grid, 3, 4)  # close the gap in the wall
+    assert oracle.find_path((0, 0), (6, 0)) == [], f"❌ Path should be gone"
+    assert oracle.cache_hits == 0, f"❌ Stale answer should not be reused"
+    print("✅ Test 26 passed: Oracle invalidation")
+
+
+def test_incremental_planner_repairs_path():
+    """Test: IncrementalPlanner routes around an obstacle added after planning"""
+    grid = make_wall_grid()
+    planner = IncrementalPlanner(grid, (0, 4), (6, 4))
+    path = planner.find_path()
+    assert len(path) == 7, f"❌ First path should go straight through the gap"
+    add_obstacle(grid, 3, 4)  # close the gap in the wall
+    assert planner.find_path() == [], f"❌ Closing the gap should remove the path"
+    grid[0][3] = 0  # open the top of the wall instead
+    path = planner.find_path()
+    expected = find_path_bfs(grid, (0, 4), (6, 4))
+    assert len(path) == len(expected), f"❌ Repaired path should have {len(expected)} cells"
+    assert (3, 0) in path, f"❌ Repaired path should use the new gap"
+    planner.close()
+    print("✅ Test 27 passed: Incremental replanning")
+
+
+def test_incremental_planner_moving_start():
+    """Test: Moving the start reuses the search and stays shortest"""
+    grid = make_wall_grid()
+    planner = IncrementalPlanner(grid, (0, 0), (6, 0))
+    path = planner.find_path()
+    planner.move_start(path[3])
+    stats = {}
+    path = planner.find_path(stats)
+    expected = find_path_bfs(grid, path[0], (6, 0))
+    assert len(path) == len(expected), f"❌ Path from new start should be shortest"
+    assert stats["expanded"] == 0, f"❌ Moving along the path should not need a search"
+    planner.close()
+    print("✅ Test 28 passed: Moving start")
+
+
+def test_multi_source_distances_and_owners():
+    """Test: Multi-source BFS gives distance and owner of the nearest source"""
+    grid = make_wall_grid()
+    distances, owners = multi_source_bfs(grid, [(0, 0), (6, 0)])
+    assert distances[0][2] == 2 and owners[0][2] == 0, f"❌ (2, 0) is 2 steps from source 0"
+    assert distances[0][4] == 2 and owners[0][4] == 1, f"❌ (4, 0) is 2 steps from source 1"
+    assert distances[4][3] == 7 and owners[4][3] == 0, f"❌ Gap is 7 from both, lowest index wins"
+    assert distances[0][3] == -1 and owners[0][3] == -1, f"❌ Obstacles get -1"
+    print("✅ Test 29 passed: Multi-source BFS")
+
+
+def test_multi_source_matches_count_reachable():
+    """Test: Cells owned by a lone source match count_reachable_cells"""
+    grid = make_wall_grid()
+    add_obstacle(grid, 3, 4)  # split the grid in two
+    distances, owners = multi_source_bfs(grid, [(0, 0), (9, 9)])
+    owned = int((owners == 0).sum())
+    assert owned == count_reachable_cells(grid, (0, 0)), f"❌ Source 0 should own its whole side"
+    assert (owners == 1).sum() == 0, f"❌ Out-of-bounds source should reach nothing"
+    print("✅ Test 30 passed: Multi-source coverage")
+
+
+def test_plan_paths_in_request_order():
+    """Test: plan_paths matches find_path_bfs for every request, in order"""
+    grid = make_wall_grid()
+    requests = [((0, 0), (6, 0)), ((6, 4), (0, 4)), ((0, 0), (3, 0)), ((1, 1), (1, 1))]
+    expected = [find_path_bfs(grid, start, goal) for start, goal in requests]
+    assert plan_paths(grid, requests, workers=2) == expected, f"❌ Parallel paths should match serial ones"
+    assert plan_paths(grid, requests, workers=1) == expected, f"❌ Single worker should match too"
+    print("✅ Test 31 passed: Batch planning")
+
+
+def test_visualize_exact_and_streamed():
+    """Test: Rendering gives exact rows and can stream them to a file"""
+    grid = create_grid(5, 3)
+    add_obstacle(grid, 2, 0)
+    add_obstacle(grid, 2, 1)
+    path = [(0, 2), (1, 2), (2, 2), (3, 2), (4, 2)]
+    expected = ". . # . .\n. . # . .\nS * * * G"
+    viz = visualize_grid(grid, path, start=(0, 2), goal=(4, 2))
+    assert viz == expected, f"❌ Rendering should be:\n{expected}"
+    out = io.StringIO()
+    result = visualize_grid(grid, path, start=(0, 2), goal=(4, 2), out=out)
+    assert result is None, f"❌ Streaming mode should return None"
+    assert out.getvalue() == expected + "\n", f"❌ Streamed rows should match the string"
+    print("✅ Test 32 passed: Exact and streamed visualization")
+
+
+def test_cooperative_robots_do_not_collide():
+    """Test: Two robots crossing a corridor never share a cell or swap"""
+    grid = create_grid(7, 2)
+    for x in (0, 1, 2, 3, 5, 6):
+        add_obstacle(grid, x, 1)  # corridor along y = 0 with a pocket at x = 4
+    stats = {}
+    first, second = find_paths_cooperative(grid, [((0, 0), (6, 0)), ((6, 0), (0, 0))], stats=stats)
+    assert first == [(x, 0) for x in range(7)], f"❌ First robot should go straight"
+    assert second[0] == (6, 0) and second[-1] == (0, 0), f"❌ Second robot should reach its goal"
+    steps = max(len(first), len(second))
+    at = lambda path, t: path[min(t, len(path) - 1)]
+    for t in range(steps):
+        assert at(first, t) != at(second, t), f"❌ Robots share a cell at t={t}"
+        assert (at(first, t), at(first, t + 1)) != (at(second, t + 1), at(second, t)), \
+            f"❌ Robots swap cells at t={t}"
+    assert (4, 1) in second, f"❌ Second robot should dodge into the pocket"
+    assert stats["replanned"] == 1, f"❌ Only the second robot should need replanning"
+    print("✅ Test 33 passed: Cooperative planning")
+
+
+def test_hierarchical_path_is_valid():
+    """Test: HPA* finds a valid path through the gap across clusters"""
+    grid = make_wall_grid()
+    planner = HierarchicalPlanner(grid, cluster_size=2)
+    path = planner.find_path((0, 0), (6, 0))
+    assert path[0] == (0, 0) and path[-1] == (6, 0), f"❌ Path should go from start to goal"
+    assert all(is_valid_cell(grid, x, y) for x, y in path), f"❌ Path should avoid obstacles"
+    steps = [abs(a[0] - b[0]) + abs(a[1] - b[1]) for a, b in zip(path, path[1:])]
+    assert steps == [1] * (len(path) - 1), f"❌ Path should move one cell at a time"
+    assert len(path) >= len(find_path_bfs(grid, (0, 0), (6, 0))), f"❌ Path can't beat BFS"
+    planner.close()
+    print("✅ Test 34 passed: Hierarchical path")
+
+
+def test_hierarchical_follows_grid_changes():
+    """Test: HPA* rebuilds clusters when obstacles are added or removed"""
+    grid = make_wall_grid()
+    planner = HierarchicalPlanner(grid, cluster_size=2)
+    assert planner.find_path((0, 0), (6, 0)) != [], f"❌ Path should exist"
+    add_obstacle(grid, 3, 4)  # close the gap in the wall
+    assert planner.find_path((0, 0), (6, 0)) == [], f"❌ Closing the gap should remove the path"
+    grid[0][3] = 0  # open the top of the wall instead
+    assert (3, 0) in planner.find_path((0, 0), (6, 0)), f"❌ Path should use the new gap"
+    planner.close()
+    print("✅ Test 35 passed: Hierarchical rebuild")
+
+
+def test_cooperative_stuck_robots_keep_their_start():
+    """Test: A robot without a plan stays put and nobody runs into it"""
+    rng = random.Random(3)
+    for _ in range(50):
+        grid = create_grid(8, 8)
+        for _ in range(12):
+            add_obstacle(grid, rng.randrange(8), rng.randrange(8))
+        free = [(x, y) for y in range(8) for x in range(8) if grid[y][x] == 0]
+        requests = list(zip(rng.sample(free, 12), rng.sample(free, 12)))
+        paths = find_paths_cooperative(grid, requests, max_delay=8)
+        timed = [path or [start] for (start, _), path in zip(requests, paths)]
+        at = lambda path, t: path[min(t, len(path) - 1)]
+        for t in range(max(len(path) for path in timed)):
+            cells = [at(path, t) for path in timed]
+            assert len(set(cells)) == len(cells), f"❌ Robots share a cell at t={t}"
+    print("✅ Test 36 passed: Robots without a plan")
+
+
 def run_all_tests():
     """Run all tests and show results."""
     print("=" * 50)
@@ -241,6 +520,24 @@ def run_all_tests():
         test_visualize_with_path,
         test_count_reachable_all,
         test_count_reachable_blocked,
+        test_flat_grid_storage,
+        test_list_of_lists_still_supported,
+        test_astar_matches_bfs,
+        test_jps_matches_bfs,
+        test_bidirectional_matches_bfs,
+        test_label_components,
+        test_oracle_matches_bfs_and_caches,
+        test_oracle_invalidated_by_obstacle,
+        test_incremental_planner_repairs_path,
+        test_incremental_planner_moving_start,
+        test_multi_source_distances_and_owners,
+        test_multi_source_matches_count_reachable,
+        test_plan_paths_in_request_order,
+        test_visualize_exact_and_streamed,
+        test_cooperative_robots_do_not_collide,
+        test_hierarchical_path_is_valid,
+        test_hierarchical_follows_grid_changes,
+        test_cooperative_stuck_robots_keep_their_start,
     ]
     
     passed = 0
@@ -34,10 +34,20 @@ This project combines everything you've learned:
 - Error handling
 """
 
+import csv
+import itertools
 import json
 import os
+import sys
+from array import array
 from datetime import datetime
 
+import numpy as np
+
+# Rows parsed per batch by SensorLogAnalyzer.load_csv, so only one batch of
+# row dictionaries is alive at a time
+LOAD_CHUNK_ROWS = 65536
+
 # ============================================================
 # PATH A: SIMULATION
 # ============================================================
@@ -140,47 +150,306 @@ class SimulationController:
 # PATH B: DATA ANALYSIS
 # ============================================================
 
+class RunTable:
+    """
+    Column-based storage for sensor runs (Path B).
+    
+    Instead of one dictionary per run, each CSV column is kept in its own
+    NumPy array, so filters and statistics are array operations:
+    
+        distance   float64
+        battery    int16
+        errors     int16
+        robot_id   int32 code into robot_names
+        timestamp  datetime64[s]
+    
+    Timestamps are parsed rather than kept as strings, since nearly every
+    run has its own. Reading a row formats them back to the CSV layout
+    ("2024-01-15 09:00"), down to the finest unit seen in the file (at
+    most seconds). Rows can still be read as dictionaries with table[i],
+    iteration, or table.rows(positions).
+    
+    The table also keeps a robot index: for each robot, the positions of
+    its runs, so per-robot queries only touch that robot's rows. Together
+    that is 32 bytes per run plus one copy of each distinct robot id
+    (see nbytes()).
+    
+    The arrays have spare room at the end and double in size when they
+    fill up, so appending a batch costs time for that batch only, not for
+    every run already loaded. The column attributes (table.distance, ...)
+    are views of the filled part.
+    """
+    
+    COLUMNS = ("timestamp", "robot_id", "distance", "battery", "errors")
+    
+    # Storage arrays and their types
+    _STORAGE = {
+        "distance": np.float64,
+        "battery": np.int16,
+        "errors": np.int16,
+        "robot_codes": np.int32,
+        "timestamp": "datetime64[s]",
+    }
+    
+    # Timestamp units from coarsest to finest, for formatting rows back
+    _TIMESTAMP_UNITS = ("Y", "M", "W", "D", "h", "m", "s")
+    
+    def __init__(self):
+        """Create an empty table."""
+        self._size = 0
+        self._buffers = {name: np.empty(0, dtype=dtype) for name, dtype in self._STORAGE.items()}
+        self.robot_names = []
+        self._robot_lookup = {}
+        self._timestamp_unit = "Y"  # finest unit seen so far
+        self._robot_rows = []  # robot code -> array of row positions
+    
+    @property
+    def distance(self):
+        return self._buffers["distance"][:self._size]
+    
+    @property
+    def battery(self):
+        return self._buffers["battery"][:self._size]
+    
+    @property
+    def errors(self):
+        return self._buffers["errors"][:self._size]
+    
+    @property
+    def robot_codes(self):
+        return self._buffers["robot_codes"][:self._size]
+    
+    @property
+    def timestamp(self):
+        return self._buffers["timestamp"][:self._size]
+    
+    def __len__(self):
+        return self._size
+    
+    def __getitem__(self, position):
+        if isinstance(position, slice):
+            return self.rows(range(len(self))[position])
+        if position < 0:
+            position += len(self)
+        if not 0 <= position < len(self):
+            raise IndexError("run index out of range")
+        return {
+            "timestamp": self._format_timestamp(self.timestamp[position]),
+            "robot_id": self.robot_names[self.robot_codes[position]],
+            "distance": float(self.distance[position]),
+            "battery": int(self.battery[position]),
+            "errors": int(self.errors[position]),
+        }
+    
+    def __iter__(self):
+        for position in range(len(self)):
+            yield self[position]
+    
+    def __eq__(self, other):
+        if isinstance(other, (list, tuple, RunTable)):
+            return len(self) == len(other) and list(self) == list(other)
+        return NotImplemented
+    
+    def append_rows(self, rows):
+        """
+        Add runs to the end of the table.
+        
+        Args:
+            rows: Iterable of dictionaries with the COLUMNS keys
+                  (values may be strings, as read by csv.DictReader)
+        
+        Returns:
+            Number of runs added
+        """
+        first_position = len(self)
+        distance, battery, errors, robots, timestamps = [], [], [], [], []
+        for row in rows:
+            distance.append(float(row["distance"]))
+            battery.append(int(row["battery"]))
+            errors.append(int(row["errors"]))
+            robots.append(self._encode(row["robot_id"], self.robot_names,
+                                       self._robot_lookup))
+            timestamps.append(row["timestamp"])
+
+        end = first_position + len(distance)
+        self._reserve(end)
+        added = {
+            "distance": distance,
+            "battery": battery,
+            "errors": errors,
+            "robot_codes": robots,
+            "timestamp": self._parse_timestamps(timestamps),
+        }
+        for name, values in added.items():
+            self._buffers[name][first_position:end] = values
+        self._size = end
+
+        while len(self._robot_rows) < len(self.robot_names):
+            self._robot_rows.append(array("q"))
+        for position, code in enumerate(robots, first_position):
+            self._robot_rows[code].append(position)
+        return len(distance)
+    
+    def truncate(self, length):
+        """Drop the runs from position `length` on (used to undo a failed load)."""
+        self._size = min(length, self._size)
+        for positions in self._robot_rows:
+            while positions and positions[-1] >= length:
+                positions.pop()
+    
+    def rows(self, positions):
+        """
+        Get runs as a list of dictionaries.
+        
+        Args:
+            positions: Row positions, or a boolean mask the length of the table
+        """
+        positions = np.asarray(positions)
+        if positions.dtype == bool:
+            positions = np.flatnonzero(positions)
+        return [self[int(position)] for position in positions]
+    
+    def robot_code(self, robot_id):
+        """Return the code for a robot id, or None if it isn't in the table."""
+        return self._robot_lookup.get(robot_id)
+    
+    def robot_positions(self, robot_id):
+        """
+        Get the row positions of one robot's runs from the robot index.
+        
+        Returns:
+            A NumPy int64 array (empty if the robot isn't in the table)
+        """
+        code = self._robot_lookup.get(robot_id)
+        if code is None:
+            return np.empty(0, dtype=np.int64)
+        # Copy, so a caller holding the result can't block later appends
+        return np.frombuffer(self._robot_rows[code], dtype=np.int64).copy()
+    
+    def nbytes(self):
+        """
+        Bytes held by the table.
+        
+        Counts the column arrays (spare room included), the robot index and
+        the robot id dictionary, so nbytes() / len(table) is the real cost
+        of a run.
+        """
+        columns = sum(buffer.nbytes for buffer in self._buffers.values())
+        robot_index = sys.getsizeof(self._robot_rows) + sum(
+            sys.getsizeof(positions) for positions in self._robot_rows
+        )
+        robot_names = (sys.getsizeof(self.robot_names) + sys.getsizeof(self._robot_lookup)
+                       + sum(sys.getsizeof(name) for name in self.robot_names))
+        return columns + robot_index + robot_names
+    
+    def _reserve(self, size):
+        """Make room for `size` runs, at least doubling the arrays when they grow."""
+        capacity = len(self._buffers["distance"])
+        if size <= capacity:
+            return
+        capacity = max(size, 2 * capacity)
+        for name, old in self._buffers.items():
+            grown = np.empty(capacity, dtype=old.dtype)
+            grown[:self._size] = old[:self._size]
+            self._buffers[name] = grown
+    
+    def _parse_timestamps(self, timestamps):
+        """
+        Parse timestamp strings into a datetime64[s] array.
+        
+        Raises:
+            ValueError if a timestamp isn't a date/time
+        """
+        if not timestamps:
+            return np.empty(0, dtype="datetime64[s]")
+        parsed = np.array(timestamps, dtype="datetime64")
+        unit = np.datetime_data(parsed.dtype)[0]
+        units = self._TIMESTAMP_UNITS
+        if unit not in units:  # finer than seconds
+            unit = "s"
+        if units.index(unit) > units.index(self._timestamp_unit):
+            self._timestamp_unit = unit
+        return parsed.astype("datetime64[s]")
+    
+    def _format_timestamp(self, value):
+        """Format a stored timestamp the way it was written in the CSV."""
+        return np.datetime_as_string(value, unit=self._timestamp_unit).replace("T", " ")
+    
+    @staticmethod
+    def _encode(value, values, lookup):
+        """Return the code for value, adding it to the dictionary if new."""
+        code = lookup.get(value)
+        if code is None:
+            code = len(values)
+            lookup[value] = code
+            values.append(value)
+        return code
+
+
 class SensorLogAnalyzer:
     """Analyzes robot sensor logs for Path B."""
     
     def __init__(self):
         """Initialize the analyzer."""
-        self.data = []
+        self.data = RunTable()
         self.filename = None
     
-    def load_csv(self, filename):
+    def load_csv(self, filename, append=False, chunk_rows=LOAD_CHUNK_ROWS):
         """
         Load sensor data from a CSV file.
         
         Expected columns: timestamp, robot_id, distance, battery, errors
+        
+        If append is True the runs are added to the ones already loaded
+        (and to the robot index) instead of replacing them.
+        
+        Rows are added chunk_rows at a time straight from the reader,
+        so the whole file never exists as a list of dictionaries. If a row
+        can't be parsed nothing from this file is kept.
+        
+        Returns True if the file was loaded, False if it doesn't exist.
         """
-        # TODO: Load CSV data into self.data
-        pass
+        table = self.data if append else RunTable()
+        first_position = len(table)
+        try:
+            f = open(filename, "r", newline="")
+        except FileNotFoundError:
+            return False
+
+        with f:
+            reader = csv.DictReader(f)
+            try:
+                while table.append_rows(itertools.islice(reader, chunk_rows)):
+                    pass
+            except Exception:
+                table.truncate(first_position)
+                raise
+
+        self.data = table
+        self.filename = filename
+        return True
     
     def get_total_runs(self):
         """Get total number of runs in the data."""
-        # TODO: Return count of data entries
-        pass
+        return len(self.data)
     
     def get_average_distance(self):
         """Calculate average distance across all runs."""
-        # TODO: Calculate and return average
-        pass
+        if len(self.data) == 0:
+            return 0.0
+        return round(float(self.data.distance.mean()), 2)
     
     def get_runs_by_robot(self, robot_id):
         """Get all runs for a specific robot."""
-        # TODO: Filter and return runs
-        pass
+        return self.data.rows(self.data.robot_positions(robot_id))
     
     def get_error_runs(self):
         """Get all runs that had errors."""
-        # TODO: Filter runs where errors > 0
-        pass
+        return self.data.rows(self.data.errors > 0)
     
     def get_low_battery_runs(self, threshold=20):
         """Get runs where battery dropped below threshold."""
-        # TODO: Filter runs by battery level
-        pass
+        return self.data.rows(self.data.battery < threshold)
     
     def calculate_statistics(self):
         """
@@ -193,19 +462,57 @@ class SensorLogAnalyzer:
         - total_errors
         - runs_with_errors
         - average_battery_consumption
+        
+        Battery consumption is measured from a full charge (100).
         """
-        # TODO: Calculate all statistics
-        pass
+        total_runs = len(self.data)
+        if total_runs == 0:
+            return {
+                "total_runs": 0,
+                "total_distance": 0.0,
+                "average_distance": 0.0,
+                "total_errors": 0,
+                "runs_with_errors": 0,
+                "average_battery_consumption": 0.0,
+            }
+
+        return {
+            "total_runs": total_runs,
+            "total_distance": round(float(self.data.distance.sum()), 2),
+            "average_distance": self.get_average_distance(),
+            "total_errors": int(self.data.errors.sum(dtype=np.int64)),
+            "runs_with_errors": int(np.count_nonzero(self.data.errors > 0)),
+            "average_battery_consumption": round(
+                100 - float(self.data.battery.mean()), 2
+            ),
+        }
     
     def generate_report(self):
         """Generate a formatted text report."""
-        # TODO: Create and return report string
-        pass
+        stats = self.calculate_statistics()
+        lines = [
+            "=" * 40,
+            "ROBOT SENSOR LOG REPORT",
+            "=" * 40,
+            f"Source: {self.filename}",
+            f"Total runs: {stats['total_runs']}",
+            f"Total distance: {stats['total_distance']}",
+            f"Average distance: {stats['average_distance']}",
+            f"Total errors: {stats['total_errors']}",
+            f"Runs with errors: {stats['runs_with_errors']}",
+            f"Average battery consumption: {stats['average_battery_consumption']}",
+            "=" * 40,
+        ]
+        return "\n".join(lines)
 
 
 class Dashboard:
     """A simple dashboard for Path B analysis."""
     
+    # Alert thresholds
+    ERROR_RATE_LIMIT = 0.10
+    LOW_BATTERY_LEVEL = 30
+    
     def __init__(self):
         """Initialize the dashboard."""
         self.analyzer = SensorLogAnalyzer()
@@ -213,13 +520,13 @@ class Dashboard:
     
     def load_data(self, filename):
         """Load data into the analyzer."""
-        # TODO: Load data and return success status
-        pass
+        return self.analyzer.load_csv(filename)
     
     def run_analysis(self):
         """Run full analysis and store report."""
-        # TODO: Generate and store report
-        pass
+        report = self.analyzer.generate_report()
+        self.reports.append(report)
+        return report
     
     def get_alerts(self):
         """
@@ -230,13 +537,33 @@ class Dashboard:
         - Low average battery
         - Any robot with all failed runs
         """
-        # TODO: Generate and return alerts list
-        pass
+        data = self.analyzer.data
+        alerts = []
+        if len(data) == 0:
+            return alerts
+
+        error_rate = np.count_nonzero(data.errors > 0) / len(data)
+        if error_rate > self.ERROR_RATE_LIMIT:
+            alerts.append(f"High error rate: {error_rate:.0%} of runs had errors")
+
+        average_battery = float(data.battery.mean())
+        if average_battery < self.LOW_BATTERY_LEVEL:
+            alerts.append(f"Low average battery: {average_battery:.1f}")
+
+        # The robot index gives each robot's rows, so this is one pass overall
+        for robot_id in data.robot_names:
+            positions = data.robot_positions(robot_id)
+            if len(positions) and np.all(data.errors[positions] > 0):
+                alerts.append(f"All runs failed for robot {robot_id}")
+        return alerts
     
     def save_report(self, filename):
         """Save the latest report to a file."""
-        # TODO: Save report to text file
-        pass
+        if not self.reports:
+            self.run_analysis()
+        with open(filename, "w") as f:
+            f.write(self.reports[-1] + "\n")
+        return True
 
 
 # ============================================================
@@ -18,6 +18,7 @@ from project import (
     SensorLogAnalyzer,
     Dashboard,
     create_sample_csv,
+    RunTable,
 )
 
 
@@ -207,6 +208,116 @@ def test_dashboard_alerts():
     print("✅ Path B Test 10: Alerts")
 
 
+def test_analysis_columnar_storage():
+    """Test: Runs are stored column by column"""
+    create_sample_csv(TEST_CSV)
+    analyzer = SensorLogAnalyzer()
+    analyzer.load_csv(TEST_CSV)
+    assert isinstance(analyzer.data, RunTable), f"❌ Data should be a RunTable"
+    first = analyzer.data[0]
+    expected = {"timestamp": "2024-01-15 09:00", "robot_id": "Scout",
+                "distance": 150.5, "battery": 75, "errors": 0}
+    assert first == expected, f"❌ Expected {expected}, got {first}"
+    assert str(analyzer.data.timestamp.dtype) == "datetime64[s]", \
+        f"❌ Timestamps should be stored as datetime64"
+
+    # Real logs have a different timestamp on every run
+    rows = [{"timestamp": f"2024-01-15 09:{i // 60 % 60:02d}:{i % 60:02d}",
+             "robot_id": f"R{i % 5}", "distance": "1.5", "battery": "50", "errors": "0"}
+            for i in range(3600)]
+    table = RunTable()
+    table.append_rows(rows)
+    assert table[3599]["timestamp"] == "2024-01-15 09:59:59", \
+        f"❌ Timestamps should read back as written, got {table[3599]['timestamp']}"
+    per_row = table.nbytes() / len(table)
+    assert 32 <= per_row <= 40, f"❌ Expected about 32 bytes per run, got {per_row}"
+    cleanup()
+    print("✅ Path B Test 11: Columnar storage")
+
+
+def test_analysis_low_battery():
+    """Test: Low battery filter"""
+    create_sample_csv(TEST_CSV)
+    analyzer = SensorLogAnalyzer()
+    analyzer.load_csv(TEST_CSV)
+    low = analyzer.get_low_battery_runs(50)
+    batteries = [run["battery"] for run in low]
+    assert batteries == [45, 40, 25], f"❌ Expected [45, 40, 25], got {batteries}"
+    cleanup()
+    print("✅ Path B Test 12: Low battery runs")
+
+
+def test_analysis_incremental_robot_index():
+    """Test: Robot index follows appended loads"""
+    create_sample_csv(TEST_CSV)
+    analyzer = SensorLogAnalyzer()
+    analyzer.load_csv(TEST_CSV)
+    analyzer.load_csv(TEST_CSV, append=True)
+    assert analyzer.get_total_runs() == 16, f"❌ Should have 16 runs after append"
+    scout_runs = analyzer.get_runs_by_robot("Scout")
+    assert len(scout_runs) == 10, f"❌ Scout should have 10 runs, got {len(scout_runs)}"
+    assert all(run["robot_id"] == "Scout" for run in scout_runs), \
+        f"❌ Only Scout runs should be returned"
+    assert analyzer.get_runs_by_robot("Nobody") == [], f"❌ Unknown robot has no runs"
+    cleanup()
+    print("✅ Path B Test 13: Incremental robot index")
+
+
+def test_dashboard_all_failed_alert():
+    """Test: Alert for a robot whose runs all failed"""
+    create_sample_csv(TEST_CSV)
+    with open(TEST_CSV, 'a') as f:
+        f.write("2024-01-18 09:00,Broken,10.0,90,1\n")
+        f.write("2024-01-18 10:00,Broken,12.0,85,2\n")
+    dashboard = Dashboard()
+    dashboard.load_data(TEST_CSV)
+    alerts = dashboard.get_alerts()
+    assert any("Broken" in alert for alert in alerts), f"❌ Should alert on Broken"
+    assert not any("Scout" in alert for alert in alerts), f"❌ Scout should not alert"
+    cleanup()
+    print("✅ Path B Test 14: All failed alert")
+
+
+def test_analysis_chunked_load():
+    """Test: Loading in small chunks gives the same table, and bad rows undo the load"""
+    create_sample_csv(TEST_CSV)
+    whole = SensorLogAnalyzer()
+    whole.load_csv(TEST_CSV)
+    chunked = SensorLogAnalyzer()
+    chunked.load_csv(TEST_CSV, chunk_rows=3)
+    assert chunked.data == whole.data, f"❌ Chunked load should match a single-batch load"
+
+    with open(TEST_CSV, 'a') as f:
+        f.write("2024-01-18 09:00,Scout,not-a-number,90,1\n")
+    try:
+        chunked.load_csv(TEST_CSV, append=True, chunk_rows=3)
+        assert False, f"❌ A bad row should raise ValueError"
+    except ValueError:
+        pass
+    assert chunked.get_total_runs() == 8, \
+        f"❌ A failed append should keep 8 runs, got {chunked.get_total_runs()}"
+    assert len(chunked.get_runs_by_robot("Scout")) == 5, f"❌ Robot index should be rolled back"
+    cleanup()
+    print("✅ Path B Test 15: Chunked load")
+
+
+def test_run_table_grows_in_place():
+    """Test: Many small appends match one big append"""
+    rows = [{"timestamp": f"2024-01-15 {i // 60:02d}:{i % 60:02d}", "robot_id": f"R{i % 3}", "distance": str(i / 2),
+             "battery": str(i % 100), "errors": str(i % 4)} for i in range(500)]
+    whole = RunTable()
+    whole.append_rows(rows)
+    pieces = RunTable()
+    for start in range(0, len(rows), 7):
+        pieces.append_rows(rows[start:start + 7])
+    assert pieces == whole, f"❌ Appending in pieces should give the same table"
+    assert len(pieces.distance) == 500, f"❌ Columns should only show filled rows"
+    assert list(pieces.robot_positions("R1")) == list(range(1, 500, 3)), \
+        f"❌ Robot index should follow the appends"
+    cleanup()
+    print("✅ Path B Test 16: Table grows in place")
+
+
 def run_all_tests():
     """Run all tests and show results."""
     print("=" * 60)
@@ -237,6 +348,12 @@ def run_all_tests():
         test_analysis_report,
         test_dashboard,
         test_dashboard_alerts,
+        test_analysis_columnar_storage,
+        test_analysis_low_battery,
+        test_analysis_incremental_robot_index,
+        test_dashboard_all_failed_alert,
+        test_analysis_chunked_load,
+        test_run_table_grows_in_place,
     ]
     
     # Run Path A